@@ -20,9 +20,22 @@ CREATE TABLE IF NOT EXISTS CarInfo (
     price INT NOT NULL,
     -- 가성비 점수 컬럼 추가
     value_score DOUBLE,
-    FOREIGN KEY (car_name) REFERENCES CarName(car_name)
+    -- 차종/차량명/연식/주행거리/가격의 SHA-1 (같은 매물 중복 적재 방지, 델타 적재 비교용)
+    row_hash CHAR(40),
+    -- CSV에서 사라진(판매된) 시각, 판매 중이면 NULL
+    sold_at DATETIME NULL,
+    FOREIGN KEY (car_name) REFERENCES CarName(car_name),
+    -- 가성비 상위 N대 조회와 서버 검색 페이지(ORDER BY value_score DESC, car_ID)용
+    -- (정렬 방향이 섞여 있어 MySQL 8.0 이상의 내림차순 인덱스로 만들어야 filesort 없이 인덱스 순서대로 읽음)
+    INDEX idx_value_score (value_score DESC, car_ID),
+    UNIQUE KEY uk_row_hash (row_hash)
 );
 
+-- 이미 만들어진 테이블에는 인덱스/컬럼만 추가 (row_hash는 python Data_input.py --delta 실행 시 채워짐)
+-- ALTER TABLE CarInfo ADD INDEX idx_value_score (value_score DESC, car_ID);
+-- (예전 value_score 단일 인덱스가 있으면: ALTER TABLE CarInfo DROP INDEX idx_value_score, ADD INDEX idx_value_score (value_score DESC, car_ID);)
+-- ALTER TABLE CarInfo ADD COLUMN row_hash CHAR(40), ADD COLUMN sold_at DATETIME NULL, ADD UNIQUE KEY uk_row_hash (row_hash);
+
 CREATE TABLE IF NOT EXISTS UsedCarData (
     yearNum INT PRIMARY KEY,
     total_transactions INT NOT NULL
@@ -33,6 +46,24 @@ CREATE TABLE IF NOT EXISTS AllCarData (
     total_transactions INT NOT NULL
 );
 
+-- 데이터셋별 버전 (적재 스크립트가 적재와 같은 트랜잭션에서 올리고, 앱은 주기적으로 이 테이블만 확인)
+CREATE TABLE IF NOT EXISTS data_version (
+    dataset VARCHAR(30) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+INSERT IGNORE INTO data_version (dataset, version) VALUES ('listings', 0), ('transactions', 0), ('faq', 0);
+
+-- CSV 적재 체크포인트 (source = 테이블:파일명, 커밋된 마지막 묶음의 끝 바이트 위치)
+CREATE TABLE IF NOT EXISTS ingest_checkpoint (
+    source VARCHAR(255) PRIMARY KEY,
+    fingerprint CHAR(40) NOT NULL,
+    byte_offset BIGINT NOT NULL,
+    rows_loaded BIGINT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
 
 
 -- 데이터 삽입
@@ -44,6 +75,15 @@ INSERT INTO UsedCarData (yearNum, total_transactions) VALUES (%s, %s);
 
 -- 데이터 조회
 
+-- 가성비 상위 10개 차량 (value_score는 Data_input.update_value_scores()가 적재 후 저장)
+SELECT c.car_brand, i.full_name, i.model_year, i.mileage, i.price, i.value_score
+FROM CarInfo i
+JOIN CarName c ON i.car_name = c.car_name
+WHERE i.value_score IS NOT NULL
+AND i.sold_at IS NULL
+ORDER BY i.value_score DESC
+LIMIT 10;
+
 -- 브랜드별 평균 중고차 가격
 SELECT c.car_brand,  COUNT(*),
        AVG(i.price) AS avg_used_price
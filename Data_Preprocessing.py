@@ -1,20 +1,166 @@
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 import os # 파일 존재 여부 확인을 위해 import
+from model_matcher import ModelMatcher
 
-def process_all_data():
+# 처리할 모든 데이터 파일 목록
+SOURCE_FILES = ["kcar_cars.csv", "usedcar_data.csv", "AllCarData.csv"]
+OUTPUT_FILE = "merged_clean.csv"
+KEY_COLUMNS = ["차량명", "연식", "주행거리", "가격", "차종"]  # 결측 제거 및 중복 판단 기준
+CHUNK_ROWS = 100_000  # 스트리밍 처리 시 한 번에 읽는 행 수 (메모리 사용량은 이 크기에 비례)
+PENDING_PER_WORKER = 2  # 병렬 처리 시 작업자마다 미리 넘겨 두는 조각 수 (메모리는 작업자 수 × 이 값 × 조각 크기)
+
+
+def clean_price(price_str):
+    if pd.isna(price_str):
+        return np.nan
+    price_str = str(price_str).strip().replace(",", "").replace("만원", "")
+    try:
+        return int(price_str)
+    except (ValueError, TypeError):
+        return np.nan
+
+
+def clean_chunk(df, matcher):
+    """원본 데이터 조각의 차종 태깅 및 연식/주행거리/가격 정제 후 KEY_COLUMNS 결측 행 제거 (중복 제거는 하지 않음)"""
+    df["차종"] = matcher.tag(df["차량명"])
+
+    df["연식"] = df["연식"].astype(str).str.extract(r"(\d{2,4})", expand=False).astype(float)
+
+    df["주행거리"] = (
+        df["주행거리"]
+        .astype(str)
+        .str.replace(",", "", regex=False)
+        .str.replace("km", "", regex=False)
+        .astype(float)
+    )
+
+    # 조각마다 정수/실수 타입이 달라지지 않도록 실수로 고정 (출력 형식과 중복 판단이 조각에 따라 바뀌지 않음)
+    df["가격"] = df["가격"].apply(clean_price).astype(float)
+
+    return df.dropna(subset=KEY_COLUMNS)
+
+
+def row_hashes(df, subset=KEY_COLUMNS):
+    """행마다 subset 값의 64비트 해시 (pandas 고정 키라 실행/프로세스가 달라도 같은 행은 같은 값)"""
+    return pd.util.hash_pandas_object(df[subset], index=False).to_numpy()
+
+
+class SeenRows:
+    """지금까지 출력한 행의 64비트 해시를 정렬된 numpy 배열 몇 개(run)로 보관하는 중복 판별기
+
+    행마다 8바이트만 쓰므로 전체 데이터를 메모리에 두지 않고도 조각 사이의 중복을 걸러낼 수 있습니다.
+    조각마다 새 해시만 정렬해 run으로 추가하고, 마지막 run이 앞 run의 절반 이상이 되면 둘을 병합합니다.
+    run 크기가 2배씩 커지므로 run은 O(log N)개이고, 각 해시가 병합되는 횟수도 O(log N)번입니다
+    (전체를 조각마다 다시 정렬하면 조각 수의 제곱에 비례해 느려짐).
+    (서로 다른 행의 해시가 같을 확률은 1억 행에서도 약 0.03%)
+    """
+
+    def __init__(self):
+        self.runs = []
+
+    def __len__(self):
+        return sum(len(run) for run in self.runs)
+
+    def _contains(self, hashes):
+        # 찾을 해시도 정렬해 두고 검색하면 run을 앞에서부터 차례로 읽어 캐시 미스가 크게 줄어듦
+        order = np.argsort(hashes)
+        keys = hashes[order]
+        found = np.zeros(len(keys), dtype=bool)
+        for run in self.runs:
+            position = np.minimum(np.searchsorted(run, keys), len(run) - 1)
+            found |= run[position] == keys
+        contains = np.empty(len(hashes), dtype=bool)
+        contains[order] = found
+        return contains
+
+    def first_seen(self, hashes):
+        """row_hashes 중 처음 보는 행(앞선 조각과 같은 조각의 앞선 행에 없는 행)의 불리언 마스크, 본 행으로 기록"""
+        new = ~self._contains(hashes) & ~pd.Series(hashes).duplicated().to_numpy()
+        if new.any():
+            self.runs.append(np.sort(hashes[new]))
+            while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+                # 정렬된 두 배열을 이어 붙인 뒤 stable 정렬(timsort)은 한 번의 병합으로 끝남
+                last = self.runs.pop()
+                self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]), kind='stable')
+        return new
+
+
+def source_columns(files):
+    """병합 결과의 컬럼 순서 (파일 순서대로 처음 나오는 컬럼, pd.concat과 같음) + 없으면 차종"""
+    columns = []
+    for file in files:
+        header = pd.read_csv(file, encoding='utf-8', encoding_errors='ignore', nrows=0).columns
+        columns += [column for column in header if column not in columns]
+    if "차종" not in columns:
+        columns.append("차종")
+    return columns
+
+
+def read_source_chunks(files, columns, chunk_rows=CHUNK_ROWS):
+    """파일들을 차례로 chunk_rows행씩 읽어 columns 순서의 데이터프레임 조각으로 반환 (chunk_rows가 없으면 파일 통째로)
+
+    값은 모두 문자열로 읽어(dtype=str) 조각마다 타입 추론 결과가 달라지지 않게 합니다.
     """
-    폴더에 있는 모든 차량 데이터 소스를 자동으로 찾아 병합하고 정제하여 
+    for file in files:
+        reader = pd.read_csv(file, encoding='utf-8', encoding_errors='ignore', dtype=str, chunksize=chunk_rows or None)
+        for chunk in ([reader] if not chunk_rows else reader):
+            yield chunk.reindex(columns=columns)
+
+
+_worker_matcher = None
+
+
+def _init_worker(matcher):
+    global _worker_matcher
+    _worker_matcher = matcher
+
+
+def _clean_shard(chunk):
+    clean_df = clean_chunk(chunk, _worker_matcher)
+    return clean_df, row_hashes(clean_df)
+
+
+def clean_chunks(chunks, matcher, workers=1):
+    """조각마다 (정제 결과, 행 해시)를 입력 순서대로 반환
+
+    workers가 2 이상이면 프로세스 workers개가 조각을 나눠 정제합니다(조각은 파일 경계를 넘지 않음).
+    결과는 입력 순서대로 돌려주므로 중복 제거와 출력은 직렬 처리와 똑같습니다.
+    한 번에 넘겨 두는 조각은 workers × PENDING_PER_WORKER개까지라 메모리도 조각 크기에 비례합니다.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            clean_df = clean_chunk(chunk, matcher)
+            yield clean_df, row_hashes(clean_df)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(matcher,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_clean_shard, chunk))
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def process_all_data(chunk_rows=CHUNK_ROWS, output_file=OUTPUT_FILE, workers=1):
+    """
+    폴더에 있는 모든 차량 데이터 소스를 자동으로 찾아 병합하고 정제하여
     최종 'merged_clean.csv' 파일을 생성하는 전체 프로세스입니다.
+
+    원본을 chunk_rows행씩 읽어 조각마다 정제하고, 처음 보는 행만 결과 파일에 이어 씁니다.
+    메모리는 조각 하나와 출력한 행의 해시(행당 8바이트)만 사용합니다. chunk_rows가 0/None이면 파일을 통째로 읽습니다.
+    workers가 2 이상이면 조각 정제를 프로세스 workers개에 나눠 실행합니다(결과 파일은 직렬 처리와 같음).
     """
-    
-    # --- 1. 존재하는 모든 CSV 데이터 소스 찾아서 병합 ---
-    # 처리할 모든 데이터 파일 목록
-    all_files = ["kcar_cars.csv", "usedcar_data.csv", "AllCarData.csv"]
-    
+
+    # --- 1. 존재하는 모든 CSV 데이터 소스 찾기 ---
     # 현재 폴더에 실제로 존재하는 파일만 골라냅니다.
-    existing_files = [f for f in all_files if os.path.exists(f)]
-    
+    existing_files = [f for f in SOURCE_FILES if os.path.exists(f)]
+
     # 처리할 파일이 하나도 없으면 오류 메시지를 보여주고 종료합니다.
     if not existing_files:
         print("[ERROR] 처리할 데이터 파일이 없습니다. kcar_cars.csv, usedcar_data.csv 등을 확인해주세요.")
@@ -22,57 +168,35 @@ def process_all_data():
         return
 
     print(f"[INFO] 다음 파일들을 병합합니다: {existing_files}")
-    
 
-    df_list = [pd.read_csv(file, encoding='utf-8', encoding_errors='ignore') for file in existing_files]
-    merged_df = pd.concat(df_list, ignore_index=True)
-    
 
     car_name_df = pd.read_csv("car_name.csv", encoding="cp949")
-    merged_df["차종"] = None
-
-    for _, row in car_name_df.iterrows():
-        nor_name = row["차종"]
-        mask = merged_df["차량명"].str.contains(nor_name, na=False)
-        merged_df.loc[mask, "차종"] = nor_name
-    
-
-    merged_df["연식"] = merged_df["연식"].astype(str).str.extract(r"(\d{2,4})").astype(float)
-
-    merged_df["주행거리"] = (
-        merged_df["주행거리"]
-        .astype(str)
-        .str.replace(",", "", regex=False)
-        .str.replace("km", "", regex=False)
-        .astype(float)
-    )
 
-    def clean_price(price_str):
-        if pd.isna(price_str):
-            return np.nan
-        price_str = str(price_str).strip().replace(",", "").replace("만원", "")
-        try:
-            return int(price_str)
-        except (ValueError, TypeError):
-            return np.nan
+    # 모든 차종 이름을 하나로 컴파일한 매처로 차량명마다 한 번만 검색
+    # (단어 시작에서 가장 왼쪽·가장 긴 차종, 맨 앞 브랜드명은 건너뜀 - model_matcher.py 참고)
+    matcher = ModelMatcher.from_car_names(car_name_df)
 
-    merged_df["가격"] = merged_df["가격"].apply(clean_price)
-    
 
-    final_df = merged_df.dropna(subset=["차량명", "연식", "주행거리", "가격", "차종"])
-    final_df = final_df.drop_duplicates(subset=["차량명", "연식", "주행거리", "가격", "차종"])
-    
+    # --- 2. 조각 단위로 정제, 중복 제거 후 결과 파일에 이어 쓰기 ---
+    columns = source_columns(existing_files)
+    seen = SeenRows()
+    with open(output_file, "w", encoding="utf-8-sig", newline="") as output:
+        pd.DataFrame(columns=columns).to_csv(output, index=False)
+        chunks = read_source_chunks(existing_files, columns, chunk_rows)
+        for clean_df, hashes in clean_chunks(chunks, matcher, workers):
+            clean_df[seen.first_seen(hashes)].to_csv(output, index=False, header=False)
 
-    final_df = final_df.reset_index(drop=True)
-    
-
-    output_file = "merged_clean.csv"
-    final_df.to_csv(output_file, index=False, encoding="utf-8-sig")
     print(f"[INFO] 모든 데이터 처리 완료! → {output_file}")
-    print(f"최종 데이터 개수: {len(final_df)}개")
+    print(f"최종 데이터 개수: {len(seen)}개")
 
 
 if __name__ == "__main__":
-    # 데이터 처리 전체 프로세스 실행
-    process_all_data()
+    parser = argparse.ArgumentParser(description="차량 데이터 병합 및 정제")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS,
+                        help="한 번에 읽어 정제하는 행 수 (0이면 파일을 통째로 읽음)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="조각 정제에 쓰는 프로세스 수 (0이면 CPU 코어 수, 1이면 직렬 처리)")
+    args = parser.parse_args()
 
+    # 데이터 처리 전체 프로세스 실행
+    process_all_data(chunk_rows=args.chunk_rows, workers=args.workers or os.cpu_count())
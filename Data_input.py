@@ -1,6 +1,17 @@
-import csv
+import argparse
+import os
+import time
+from functools import partial
+
 import pandas as pd
-import mysql.connector
+from bulk_load import COMMIT_EVERY_ROWS, INSERT_CHUNK_ROWS
+from csv_source import load_csv, read_csv_batches
+from data_version import bump_version
+from db_access import get_connection, read_sql, timed
+from delta_load import backfill_row_hashes, delta_load_listings, upsert_changed, with_row_hash
+from ingest_scheduler import CHUNK_WRITERS, IngestScheduler
+from scoring import calculate_value_score
+from snapshot import export_snapshots
 
 CSV_FILE = "merged_clean.csv"  # 차종, 차량명, 연식, 주행거리, 가격
 CSV_FILE2 = "car_name.csv"  # 브랜드, 차종, 차량종류, 신차가격
@@ -9,103 +20,219 @@ CSV_FILE4 = "AllCarData.csv" # 연도, 총거래량
 CSV_FILE5 = "kia_faq.csv"  # category, question, answer, site(선택)
 CSV_FILE6 = "hyundai_faq.csv"  # category, question, answer, site(선택)
 
-# MySQL 연결 설정
-db_config = {
-    'user': 'Park',    # MySQL 사용자 이름
-    'password': 'Park',    # MySQL 비밀번호
-    'host': 'localhost',        # MySQL 호스트 (로컬호스트
-    'database': 'used_car_db',      # 사용할 데이터베이스 이름
-    'auth_plugin': 'mysql_native_password'  # 인증 플러그인 설정
-}
+SCORE_BATCH_SIZE = 5000  # 가성비 점수 일괄 저장 시 한 번에 보내는 행 수
+
+# MySQL 연결 설정은 db_access.py의 DB_CONFIG 사용 (연결 풀 공유)
 
 
+# 테이블 -> (CSV 파일 목록, 인코딩, 테이블 컬럼, CSV 컬럼)
 ### 실행 안되면 encoding 방식 'cp949'로 바꿔보기 ###
-def insert_data_to_db():
-    # MySQL 데이터베이스 연결
-    conn = mysql.connector.connect(**db_config)
-    cursor = conn.cursor()
-    
-    # car_name.csv 파일 읽기 및 데이터 삽입
-    with open(CSV_FILE2, mode='r', encoding='cp949') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            cursor.execute(
-                "INSERT IGNORE INTO CarName (car_brand, car_name, car_type, newcar_price) VALUES (%s, %s, %s, %s)",
-                (row['브랜드'], row['차종'], row['차량종류'], int(row['신차가격']))
-            )
-    print("car_name.csv data inserted successfully.")
+TABLE_SOURCES = {
+    'CarName': ([CSV_FILE2], 'cp949',
+                ('car_brand', 'car_name', 'car_type', 'newcar_price'), ('브랜드', '차종', '차량종류', '신차가격')),
+    # row_hash는 CSV 값으로 계산해 붙임 (ROW_TRANSFORMS)
+    'CarInfo': ([CSV_FILE], 'utf-8-sig',
+                ('car_name', 'full_name', 'model_year', 'mileage', 'price', 'row_hash'),
+                ('차종', '차량명', '연식', '주행거리', '가격')),
+    'UsedCarData': ([CSV_FILE3], 'utf-8-sig', ('yearNum', 'total_transactions'), ('연도', '총거래대수')),
+    'AllCarData': ([CSV_FILE4], 'cp949', ('yearNum', 'total_transactions'), ('연도', '총거래대수')),
+    # site 컬럼은 없을 수 있으므로 없으면 NULL
+    'car_faq': ([CSV_FILE5, CSV_FILE6], 'utf-8-sig',
+                ('category', 'question', 'answer', 'site'), ('category', 'question', 'answer', 'site')),
+}
 
+# 테이블 -> 먼저 적재해야 하는 테이블 (외래 키)
+TABLE_DEPENDENCIES = {
+    'CarInfo': ('CarName',),
+}
 
+# 여러 연결이 묶음을 나눠 동시에 쓰는 큰 테이블
+PARALLEL_TABLES = {'CarInfo'}
 
-    # kcar_cars.csv 파일 읽기 및 데이터 삽입
-    with open(CSV_FILE, mode='r', encoding='utf-8-sig') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            cursor.execute(
-                "INSERT IGNORE INTO CarInfo (car_name, full_name, model_year, mileage, price) VALUES (%s, %s, %s, %s, %s)",
-                (row['차종'], row['차량명'], row['연식'], row['주행거리'], row['가격'])
-            )
-    print("kcar_cars.csv data inserted successfully.")
+# 테이블 -> CSV 행을 적재할 행으로 바꾸는 함수
+ROW_TRANSFORMS = {
+    'CarInfo': with_row_hash,
+}
+
+# 델타 적재 시 기본 키로 비교해 바뀐 행만 반영하는 테이블 -> 기본 키
+UPSERT_KEYS = {
+    'CarName': 'car_name',
+    'UsedCarData': 'yearNum',
+    'AllCarData': 'yearNum',
+}
 
-    # usedcar_data.csv 파일 읽기 및 데이터 삽입
-    with open(CSV_FILE3, mode='r', encoding='utf-8-sig') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            cursor.execute(
-                "INSERT IGNORE INTO UsedCarData (yearNum, total_transactions) VALUES (%s, %s)",
-                (row['연도'], row['총거래대수'])
-            )
-    print("usedcar_data.csv data inserted successfully.")
 
-    # AllCarData.csv 파일 읽기 및 데이터 삽입
-    with open(CSV_FILE4, mode='r', encoding='cp949') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
+def load_tables(tables, chunk_rows=INSERT_CHUNK_ROWS, commit_rows=COMMIT_EVERY_ROWS, use_infile=True, resume=True,
+                writers=CHUNK_WRITERS):
+    """tables의 CSV 파일들을 의존 관계(TABLE_DEPENDENCIES)를 지키며 동시에 적재하고 파일별/전체 적재 속도를 출력
+
+    서로 관계없는 파일은 풀 연결로 동시에 적재하고, 큰 테이블(PARALLEL_TABLES)은 writers개 연결이 묶음을 나눠 씁니다.
+    중단된 적재는 ingest_checkpoint에 기록된 위치부터 이어서 적재합니다(resume=False면 처음부터).
+    """
+    tasks = {}
+    sources = {}
+    for table in tables:
+        paths, encoding, columns, fields = TABLE_SOURCES[table]
+        sources[table] = [f"{table}:{os.path.basename(path)}" for path in paths]
+        for source, path in zip(sources[table], paths):
+            tasks[source] = partial(load_csv, table, columns, path, encoding, fields, commit_rows, chunk_rows,
+                                    use_infile, resume, ROW_TRANSFORMS.get(table),
+                                    writers if table in PARALLEL_TABLES else 1)
+    dependencies = {source: [dependency for required in TABLE_DEPENDENCIES.get(table, ()) if required in sources
+                             for dependency in sources[required]]
+                    for table in tables for source in sources[table]}
+
+    scheduler = IngestScheduler(tasks, dependencies, on_done=lambda source, stats: print(stats))
+    results = scheduler.run()
+
+    total_rows = sum(stats.rows for stats in results.values())
+    busy_seconds = sum(stats.seconds for stats in results.values())
+    print(f"total: {total_rows:,} rows, wall {scheduler.seconds:.2f}s "
+          f"({total_rows / max(scheduler.seconds, 1e-9):,.0f} rows/s, 작업 시간 합계 {busy_seconds:.2f}s)")
+    for source in scheduler.skipped:
+        print(f"{source}: 선행 테이블 적재 실패로 건너뜀")
+    if scheduler.errors:
+        source, error = next(iter(scheduler.errors.items()))
+        raise RuntimeError(f"{source} 적재 실패") from error
+
+
+def bump_dataset_versions(*datasets):
+    """적재가 끝난 데이터셋의 버전을 올려 앱이 해당 데이터만 다시 로드하도록 함"""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        bump_version(cursor, *datasets)
+        conn.commit()
+        cursor.close()
+
+
+def insert_data_to_db(chunk_rows=INSERT_CHUNK_ROWS, commit_rows=COMMIT_EVERY_ROWS, use_infile=True, resume=True,
+                      writers=CHUNK_WRITERS):
+    """차량/거래 현황 CSV를 일괄 적재 (LOAD DATA LOCAL INFILE, 안 되면 chunk_rows개씩 executemany)"""
+    load_tables(['CarName', 'CarInfo', 'UsedCarData', 'AllCarData'], chunk_rows, commit_rows, use_infile, resume,
+                writers)
+    # 중간 커밋이 있어도 앱은 모든 테이블 적재가 끝난 뒤 버전이 바뀔 때 다시 로드
+    # (listings 버전은 가성비 점수를 저장하는 트랜잭션에서 한 번만 올림)
+    bump_dataset_versions('transactions')
+    update_value_scores()
+
+
+def delta_data_to_db(chunk_rows=INSERT_CHUNK_ROWS, commit_rows=COMMIT_EVERY_ROWS, use_infile=True):
+    """차량/거래 현황 CSV를 DB와 비교해 바뀐 행만 반영하고, 바뀐 데이터셋 이름 집합을 반환
+
+    CarName/UsedCarData/AllCarData는 기본 키로 비교해 새 행/바뀐 행만 반영하고,
+    CarInfo는 row_hash로 새 매물만 넣으며 CSV에서 사라진 매물은 판매(sold_at) 처리합니다.
+    매물이 바뀌었으면 가성비 점수를 다시 계산합니다(listings 버전은 그때 한 번만 올림).
+    매물이 그대로면 점수도 바뀌지 않으므로 다시 계산하지 않습니다.
+    """
+    changed = set()
+    for table, key in UPSERT_KEYS.items():
+        paths, encoding, columns, fields = TABLE_SOURCES[table]
+        start = time.perf_counter()
+        rows = [row for path in paths for batch, _ in read_csv_batches(path, encoding, fields) for row in batch]
+        count = upsert_changed(table, columns, key, rows)
+        print(f"{table}: {count:,} rows changed of {len(rows):,}, {time.perf_counter() - start:.2f}s")
+        if count:
+            changed.add('transactions' if table in ('UsedCarData', 'AllCarData') else 'listings')
+
+    backfilled, removed = backfill_row_hashes(chunk_rows)
+    if backfilled or removed:
+        print(f"CarInfo: row_hash {backfilled:,} rows filled, {removed:,} duplicate rows removed")
+        changed.add('listings')
+
+    paths, encoding, columns, fields = TABLE_SOURCES['CarInfo']
+    for path in paths:
+        result = delta_load_listings(path, encoding, fields, columns, commit_rows, chunk_rows, use_infile)
+        print(f"CarInfo: {result['inserted']:,} new, {result['sold']:,} sold, {result['relisted']:,} relisted, "
+              f"{result['unchanged']:,} unchanged, {result['seconds']:.2f}s ({result['method']})")
+        if result['inserted'] or result['sold'] or result['relisted']:
+            changed.add('listings')
+
+    if changed - {'listings'}:
+        bump_dataset_versions(*sorted(changed - {'listings'}))
+    if 'listings' in changed:
+        update_value_scores()
+    return changed
+
+
+def update_value_scores():
+    """적재된 전체 차량의 가성비 점수를 한 번 계산해 CarInfo.value_score에 일괄 저장
+
+    점수 UPDATE와 같은 트랜잭션에서 listings 버전을 올리므로, 매물을 적재한 경로는
+    listings 버전을 따로 올리지 않고 이 함수를 호출합니다(앱이 점수 없는 데이터로 다시 로드하지 않도록).
+    """
+    # 앱(load_car_data)과 같은 기준 데이터로 점수 계산
+    query = """
+    SELECT i.car_ID,
+           i.car_name AS 차종,
+           i.model_year AS 연식,
+           i.mileage AS 주행거리,
+           i.price AS 가격,
+           c.newcar_price AS 신차가격
+    FROM carname c
+    JOIN carinfo i ON c.car_name = i.car_name
+    WHERE i.price IS NOT NULL
+    AND i.mileage IS NOT NULL
+    AND i.sold_at IS NULL
+    """
+    car_data = read_sql(query, label="update_value_scores.load")
+    scored = calculate_value_score(car_data, car_data)
+    rows = [
+        (int(car_id), None if pd.isna(score) else float(score))
+        for car_id, score in zip(scored['car_ID'], scored['value_score'])
+    ]
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+
+        # 임시 테이블에 여러 행씩 넣은 뒤 JOIN UPDATE 한 번으로 반영
+        cursor.execute(
+            "CREATE TEMPORARY TABLE tmp_value_score (car_ID INT PRIMARY KEY, value_score DOUBLE)"
+        )
+        for start in range(0, len(rows), SCORE_BATCH_SIZE):
+            cursor.executemany(
+                "INSERT INTO tmp_value_score (car_ID, value_score) VALUES (%s, %s)",
+                rows[start:start + SCORE_BATCH_SIZE]
+            )
+        with timed("update_value_scores.update"):
             cursor.execute(
-                "INSERT IGNORE INTO AllCarData (yearNum, total_transactions) VALUES (%s, %s)",
-                (row['연도'], row['총거래대수'])
+                "UPDATE CarInfo i JOIN tmp_value_score t ON i.car_ID = t.car_ID SET i.value_score = t.value_score"
             )
-    print("AllCarData.csv data inserted successfully.")
+        cursor.execute("DROP TEMPORARY TABLE tmp_value_score")
+        print(f"value_score updated for {len(rows)} cars.")
 
-    conn.commit()
-    cursor.close()
-    conn.close()
+        bump_version(cursor, 'listings')
+        conn.commit()
+        cursor.close()
 
 
 def load_data_to_db(query):
-    # MySQL 데이터베이스 연결
-    conn = mysql.connector.connect(**db_config)
-
-    df = pd.read_sql(query, conn)
-
-    conn.close()
-    return df
+    # 연결 풀을 통해 조회
+    return read_sql(query)
 
-def insert_faq_data_to_db():
-    # MySQL 데이터베이스 연결
-    conn = mysql.connector.connect(**db_config)
-    cursor = conn.cursor()
-
-    with open(CSV_FILE5, mode='r', encoding='utf-8-sig') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            cursor.execute(
-                "INSERT IGNORE INTO car_faq (category, question, answer, site) VALUES (%s, %s, %s, %s)",
-                (row['category'], row['question'], row['answer'], row.get('site'))  # site 컬럼은 없을 수 있으니 get 사용
-            )
-    with open(CSV_FILE6, mode='r', encoding='utf-8-sig') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            cursor.execute(
-                "INSERT IGNORE INTO car_faq (category, question, answer, site) VALUES (%s, %s, %s, %s)",
-                (row['category'], row['question'], row['answer'], row.get('site'))  # site 컬럼은 없을 수 있으니 get 사용
-            )
-    print("FAQ data inserted successfully.")
-    
-    conn.commit()
-    cursor.close()
-    conn.close()
+def insert_faq_data_to_db(chunk_rows=INSERT_CHUNK_ROWS, commit_rows=COMMIT_EVERY_ROWS, use_infile=True, resume=True):
+    """기아/현대 FAQ CSV를 car_faq에 일괄 적재 (두 파일을 동시에)"""
+    load_tables(['car_faq'], chunk_rows, commit_rows, use_infile, resume)
+    bump_dataset_versions('faq')
 
 if __name__ == "__main__":
-    insert_data_to_db()
-    insert_faq_data_to_db()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="CSV 데이터를 MySQL에 적재")
+    parser.add_argument("--chunk-rows", type=int, default=INSERT_CHUNK_ROWS, help="executemany 한 번에 보내는 행 수")
+    parser.add_argument("--commit-rows", type=int, default=COMMIT_EVERY_ROWS, help="이 행 수마다 커밋하고 체크포인트 기록")
+    parser.add_argument("--no-infile", action="store_true", help="LOAD DATA LOCAL INFILE을 쓰지 않고 executemany로 적재")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 모든 파일을 처음부터 적재")
+    parser.add_argument("--writers", type=int, default=CHUNK_WRITERS, help="CarInfo를 나눠 쓰는 연결 수")
+    parser.add_argument("--delta", action="store_true",
+                        help="차량/거래 현황은 바뀐 행만 반영 (새 매물 추가, 사라진 매물은 판매 처리)")
+    args = parser.parse_args()
+    load_options = dict(chunk_rows=args.chunk_rows, commit_rows=args.commit_rows, use_infile=not args.no_infile)
+
+    if args.delta:
+        delta_data_to_db(**load_options)
+        insert_faq_data_to_db(**load_options, resume=not args.restart)
+    else:
+        # 차량/거래 현황/FAQ 테이블을 한 번에 의존 관계에 따라 동시에 적재
+        load_tables(list(TABLE_SOURCES), **load_options, resume=not args.restart, writers=args.writers)
+        bump_dataset_versions('transactions', 'faq')
+        update_value_scores()
+    # 새 버전 기준 스냅샷을 미리 만들어 두면 앱이 MySQL을 거치지 않고 바로 로드
+    export_snapshots()
\ No newline at end of file
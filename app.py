@@ -1,193 +1,279 @@
 import streamlit as st
 import pandas as pd
-import mysql.connector
 import numpy as np
-import matplotlib.pyplot as plt
-import Data_input as Dinput
+from analysis_cube import CUBE_MIN_ROWS, AnalysisCube
+from data_version import VersionTracker
+from db_access import read_sql
+from faq_index import FaqIndex
+from home_dashboard import load_transactions, render_transaction_chart
+from listing_query import count_listings, fetch_filter_options, fetch_listing_page, page_cursor
+from listing_store import ListingStore
+from result_cache import ResultCache, normalize_filter_key
+from scoring import DEFAULT_PROFILE, SCORE_PROFILES, ProfileScores, calculate_value_score, with_value_score
+from snapshot import read_dataset
+from topk import RankedResult, top_k_positions
+from warmup import Warmup
 
-# Windows용 한글 폰트 설정
-import platform
-if platform.system() == 'Windows':
-    plt.rcParams['font.family'] = ['Malgun Gothic', 'Microsoft YaHei', 'SimHei', 'sans-serif']
-    plt.rcParams['axes.unicode_minus'] = False
-else:
-    plt.rc("font", family="AppleGothic")
+# matplotlib과 한글 폰트 설정은 홈 차트를 처음 그릴 때 home_dashboard.get_figure_class()에서 로드
+# (시작 시간 기준치는 bench_startup.py로 확인)
 
 # --------------------------------------------------------------------------
 # --- 1. 데이터베이스 연결 및 데이터 로딩 함수 ---
 # --------------------------------------------------------------------------
 
-# MySQL 연결 설정
-db_config = {
-    'user': 'Park',
-    'password': 'Park',
-    'host': 'localhost',
-    'database': 'used_car_db',
-    'auth_plugin': 'mysql_native_password'
-}
+# MySQL 연결 설정과 연결 풀은 db_access.py에서 공용으로 관리
+
+# True면 차량 검색의 필터/정렬/페이지 이동을 MySQL에서 처리 (세션이 전체 결과를 들고 있지 않음)
+# 적재 후 Data_input.update_value_scores()로 value_score가 저장되어 있어야 합니다.
+SERVER_SIDE_SEARCH = False
+ITEMS_PER_PAGE = 10
+
+# 가성비 점수 비교 범위 (화면 표시 이름 -> 정규화 기준 컬럼)
+SEGMENT_OPTIONS = {'전체': None, '차량종류별': '차량종류', '차종별': '차종'}
 
-@st.cache_data
-def load_car_data():
+# 모든 세션이 공유하는 검색/분석 결과 캐시의 메모리 예산
+RESULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# 데이터 로더는 data_version의 데이터셋 버전(listings/transactions/faq)을 캐시 키로 받습니다.
+# 새 버전은 VersionTracker가 백그라운드에서 미리 로드하므로, 이전 버전 캐시(max_entries=2)를 쓰다가 교체됩니다.
+# 로더는 오류를 잡지 않고 그대로 올립니다. 실패 결과(빈 데이터)가 해당 버전으로 캐시되지 않고,
+# 백그라운드 로드가 실패하면 이전 버전을 계속 사용합니다. 오류 표시는 페이지에서 load_or_report로 합니다.
+
+@st.cache_data(max_entries=2)
+def load_car_data(data_version=None):
     """데이터베이스에서 차량 데이터를 로드하는 함수"""
-    try:
-        conn = mysql.connector.connect(**db_config)
-        
-        query = """
-        SELECT c.car_brand AS 브랜드,
-               i.car_name AS 차종,
-               c.car_type AS 차량종류,
-               i.full_name AS 차량명,
-               i.model_year AS 연식,
-               i.mileage AS 주행거리,
-               i.price AS 가격,
-               c.newcar_price AS 신차가격
-        FROM carname c
-        JOIN carinfo i ON c.car_name = i.car_name
-        WHERE i.price IS NOT NULL 
-        AND i.mileage IS NOT NULL
-        """
-        
-        car_data = pd.read_sql(query, conn)
-        conn.close()
-        
-        return car_data
-    except Exception as e:
-        st.error(f"데이터베이스 연결 중 오류가 발생했습니다: {e}")
-        return pd.DataFrame()
+    # 최신 Arrow 스냅샷이 있으면 바로 메모리 맵으로 읽고, 없으면 MySQL에서 읽어 스냅샷을 갱신
+    # (문자열은 category, 정수는 작은 정수형으로 변환된 상태로 저장됨)
+    return read_dataset('car_data', data_version)
+
+@st.cache_data(max_entries=4)
+def load_top_value_cars(limit=10, data_version=None):
+    """저장된 가성비 점수(value_score) 기준 상위 차량을 로드하는 함수"""
+    query = """
+    SELECT c.car_brand AS 브랜드,
+           i.full_name AS 차량명,
+           i.model_year AS 연식,
+           i.mileage AS 주행거리,
+           i.price AS 가격,
+           i.value_score
+    FROM carinfo i
+    JOIN carname c ON c.car_name = i.car_name
+    WHERE i.value_score IS NOT NULL
+    AND i.sold_at IS NULL
+    ORDER BY i.value_score DESC
+    LIMIT %s
+    """
+    
+    top_cars = read_sql(query, params=(limit,), label="load_top_value_cars")
+    
+    return top_cars
+
+@st.cache_data(max_entries=2)
+def load_home_dashboard(data_version=None):
+    """데이터 버전별로 거래 현황 데이터와 렌더링된 차트(PNG)를 캐시하는 함수"""
+    df_1 = load_transactions()
+    return df_1, render_transaction_chart(df_1)
 
-@st.cache_data  
-def load_analysis_data():
+@st.cache_data(max_entries=2)
+def load_filter_options(data_version=None):
+    """서버 검색 모드의 사이드바 선택지를 DB에서 집계해 로드하는 함수"""
+    return fetch_filter_options()
+
+@st.cache_data(ttl=600)
+def load_listing_count(filters, data_version=None):
+    """서버 검색 모드의 검색 결과 수를 조회하는 함수"""
+    return count_listings(**filters)
+
+@st.cache_data(ttl=600, max_entries=1000)
+def load_listing_page(filters, after=None, limit=ITEMS_PER_PAGE, data_version=None):
+    """서버 검색 모드의 한 페이지(가성비 점수 순)를 조회하는 함수"""
+    return fetch_listing_page(after=after, limit=limit, **filters)
+
+@st.cache_resource(max_entries=2)
+def load_listing_store(data_version=None):
+    """차량 데이터 색인을 데이터 버전당 한 번만 생성하는 함수"""
+    return ListingStore(load_car_data(data_version))
+
+@st.cache_resource(max_entries=2)
+def load_analysis_cube(data_version=None):
+    """분석용 사전 집계 큐브를 데이터 버전당 한 번만 생성하는 함수
+
+    매물이 CUBE_MIN_ROWS 미만이면 직접 집계가 더 빠르므로 만들지 않고 None을 반환합니다.
+    """
+    car_data = load_car_data(data_version)
+    if len(car_data) < CUBE_MIN_ROWS:
+        return None
+    return AnalysisCube(car_data)
+
+@st.cache_resource(max_entries=6)
+def load_profile_scores(segment=None, data_version=None):
+    """모든 가성비 기준의 점수를 데이터 버전당 한 번의 행렬 곱으로 계산하는 함수
+
+    segment(차량종류/차종)를 주면 같은 segment 안에서 정규화한 점수를 계산합니다.
+    """
+    return ProfileScores(load_car_data(data_version), segment=segment)
+
+@st.cache_resource
+def get_result_cache():
+    """프로세스 전체에서 공유하는 필터 조합별 결과 캐시"""
+    return ResultCache(RESULT_CACHE_MAX_BYTES)
+
+@st.cache_data(max_entries=2)
+def load_analysis_data(data_version=None):
     """분석용 데이터를 데이터베이스에서 로딩"""
-    try:
-        conn = mysql.connector.connect(**db_config)
-        
-        usedcar_query = "SELECT * FROM usedcardata"
-        allcar_query = "SELECT * FROM allcardata"
-        
-        usedcar_data = pd.read_sql(usedcar_query, conn)
-        allcar_data = pd.read_sql(allcar_query, conn)
-        
-        conn.close()
-        
-        return usedcar_data, allcar_data
-    except Exception as e:
-        st.error(f"분석 데이터 로딩 중 오류가 발생했습니다: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+    usedcar_data = read_dataset('usedcardata', data_version)
+    allcar_data = read_dataset('allcardata', data_version)
+    
+    return usedcar_data, allcar_data
+
+@st.cache_data(max_entries=2)
+def load_faq_data(data_version=None):
+    """데이터베이스에서 FAQ 데이터를 로드하는 함수 (data_version이 바뀌면 다시 로드)"""
+    faq_data = read_dataset('car_faq', data_version)
+    return faq_data
+
+@st.cache_resource(max_entries=2)
+def load_faq_index(data_version):
+    """FAQ 검색 색인을 FAQ 데이터 버전별로 한 번만 생성해 모든 세션이 공유하는 함수
 
-@st.cache_data
-def load_faq_data():
-    """데이터베이스에서 FAQ 데이터를 로드하는 함수"""
+    DB 연결 실패는 그대로 올립니다(정적 FAQ가 이 버전으로 캐시되지 않도록, 페이지에서 load_static_faq_index 사용).
+    """
+    faq_data = load_faq_data(data_version)
+    if faq_data.empty:
+        # DB에 데이터가 없으면 정적 데이터 사용
+        faq_data = get_static_faq_data()
+    return FaqIndex(faq_data)
+
+@st.cache_resource
+def load_static_faq_index():
+    """DB에서 FAQ를 읽지 못했을 때 쓰는 정적 FAQ 검색 색인"""
+    return FaqIndex(get_static_faq_data())
+
+def load_or_report(message, default, loader, *args):
+    """loader(*args)의 결과, 실패하면 화면에 오류를 표시하고 default 반환 (default는 캐시되지 않음)"""
     try:
-        conn = mysql.connector.connect(**db_config)
-        query = "SELECT category, question, answer FROM car_faq"
-        faq_data = pd.read_sql(query, conn)
-        conn.close()
-        return faq_data
+        return loader(*args)
     except Exception as e:
-        st.error(f"FAQ 데이터 로딩 중 오류가 발생했습니다: {e}")
-        return pd.DataFrame()
+        st.error(f"{message}: {e}")
+        return default
+
+def warm_listings(version):
+    """차량 데이터와 파생 색인/큐브/점수, 상위 차량을 version으로 미리 로드"""
+    load_car_data(version)
+    if SERVER_SIDE_SEARCH:
+        load_filter_options(version)
+    else:
+        load_listing_store(version)
+        load_profile_scores(None, version)
+    load_analysis_cube(version)
+    load_top_value_cars(10, version)
+
+def warm_transactions(version):
+    """거래 현황(차트 포함)과 분석용 거래 데이터를 version으로 미리 로드"""
+    load_home_dashboard(version)
+    load_analysis_data(version)
+
+def warm_faq(version):
+    """FAQ 데이터와 검색 색인을 version으로 미리 로드"""
+    load_faq_index(version)
+
+# 데이터셋별 미리 로드 함수 (워밍업과 새 버전 백그라운드 로드에 공용)
+DATASET_LOADERS = {
+    'listings': warm_listings,
+    'transactions': warm_transactions,
+    'faq': warm_faq,
+}
+
+@st.cache_resource
+def get_version_tracker():
+    """프로세스 전체에서 공유하는 데이터 버전 관리 객체"""
+    return VersionTracker(DATASET_LOADERS)
+
+def dataset_version(dataset):
+    """dataset(listings/transactions/faq)의 현재 사용 버전"""
+    return get_version_tracker().version(dataset)
+
+def warmup_tasks():
+    """워밍업 작업 목록 (데이터셋별로 동시에, 데이터셋 안의 로더는 순서대로 실행)"""
+    versions = get_version_tracker().active_versions()
+    return [(dataset, lambda loader=loader, dataset=dataset: loader(versions.get(dataset)))
+            for dataset, loader in DATASET_LOADERS.items()]
+
+@st.cache_resource
+def start_warmup():
+    """서버 프로세스에서 처음 실행될 때 한 번만 모든 데이터를 동시에 미리 로드하는 함수
+
+    로더들은 st.cache_data/st.cache_resource를 거치므로 워밍업 중에 사용자가 같은 로더를 호출하면
+    다시 조회하지 않고 워밍업 결과를 기다려 사용합니다.
+    """
+    return Warmup(warmup_tasks()).start()
 
 # --------------------------------------------------------------------------
 # --- 2. 가성비 점수 계산 함수 ---
 # --------------------------------------------------------------------------
 
-def calculate_value_score(df, full_data):
-    """차량의 가성비 점수를 계산하는 함수"""
-    df_copy = df.copy()
-    
-    # 필요한 컬럼이 있는지 확인
-    required_columns = ['신차가격', '가격', '연식', '주행거리', '차종']
-    if not all(col in df_copy.columns for col in required_columns):
-        return df_copy
-    
-    # 1. 신차 대비 중고차 가격 비율 점수 (가격이 낮을수록 좋음)
-    df_copy['price_ratio'] = df_copy['가격'] / df_copy['신차가격']
-    df_copy['price_score'] = 1 - df_copy['price_ratio'].clip(0, 1)
-    
-    # 2. 차량 연령 점수 (최신 연식일수록 좋음) - 전체 데이터 기준
-    min_year = full_data['연식'].min()
-    max_year = full_data['연식'].max()
-    year_range = max_year - min_year
-    if year_range > 0:
-        df_copy['age_score'] = (df_copy['연식'] - min_year) / year_range
-    else:
-        df_copy['age_score'] = 1.0
-    
-    # 3. 주행거리 점수 (적을수록 좋음) - 전체 데이터 기준
-    min_mileage = full_data['주행거리'].min()
-    max_mileage = full_data['주행거리'].max()
-    mileage_range = max_mileage - min_mileage
-    if mileage_range > 0:
-        df_copy['mileage_score'] = 1 - ((df_copy['주행거리'] - min_mileage) / mileage_range)
-    else:
-        df_copy['mileage_score'] = 1.0
-    
-    # 4. 차종별 인기도 점수 (같은 차종 등록 대수가 많을수록 좋음) - 전체 데이터 기준
-    car_popularity = full_data['차종'].value_counts()
-    min_popularity = car_popularity.min()
-    max_popularity = car_popularity.max()
-    popularity_range = max_popularity - min_popularity
-    if popularity_range > 0:
-        df_copy['popularity_score'] = (df_copy['차종'].map(car_popularity) - min_popularity) / popularity_range
-    else:
-        df_copy['popularity_score'] = 1.0
-    
-    # 전체 가성비 점수 계산 (가중평균)
-    df_copy['value_score'] = (
-        df_copy['price_score'] * 0.40 +        # 가격 점수 (40%)
-        df_copy['age_score'] * 0.25 +          # 연식 점수 (25%)
-        df_copy['mileage_score'] * 0.25 +      # 주행거리 점수 (25%)
-        df_copy['popularity_score'] * 0.10     # 인기도 점수 (10%)
-    ) * 100  # 100점 만점으로 변환
-    
-    return df_copy
+# 점수 계산 로직은 scoring.py에 있으며, 적재 시 CarInfo.value_score에 미리 저장됩니다.
 
 # --------------------------------------------------------------------------
 # --- 3. 데이터 필터링 함수 ---
 # --------------------------------------------------------------------------
 def filter_car_data(data, brand=None, car_type=None, min_year=None, max_year=None, 
-                   min_price=None, max_price=None, min_mileage=None, max_mileage=None):
-    """조건에 따라 차량 데이터를 필터링하는 함수"""
-    filtered_data = data.copy()
-    
-    if brand and brand != "전체":
-        # 정확한 브랜드명으로 필터링
-        filtered_data = filtered_data[filtered_data['브랜드'].str.strip() == brand.strip()]
-    
-    if car_type and car_type != "전체":
-        # 정확한 차량종류로 필터링
-        filtered_data = filtered_data[filtered_data['차량종류'].str.strip() == car_type.strip()]
-    
-    if min_year:
-        filtered_data = filtered_data[filtered_data['연식'] >= min_year]
-    
-    if max_year:
-        filtered_data = filtered_data[filtered_data['연식'] <= max_year]
-    
-    if min_price:
-        filtered_data = filtered_data[filtered_data['가격'] >= min_price]
-    
-    if max_price:
-        filtered_data = filtered_data[filtered_data['가격'] <= max_price]
-    
-    if min_mileage:
-        filtered_data = filtered_data[filtered_data['주행거리'] >= min_mileage]
-    
-    if max_mileage:
-        filtered_data = filtered_data[filtered_data['주행거리'] <= max_mileage]
+                   min_price=None, max_price=None, min_mileage=None, max_mileage=None, store=None):
+    """조건에 따라 차량 데이터를 필터링하는 함수
+
+    store가 주어지면 미리 만들어 둔 색인(ListingStore)으로 행 위치만 찾아 해당 행을 반환합니다.
+    """
+    if store is None:
+        store = ListingStore(data)
+    
+    positions = store.filter_positions(
+        brand=brand,
+        car_type=car_type,
+        min_year=min_year,
+        max_year=max_year,
+        min_price=min_price,
+        max_price=max_price,
+        min_mileage=min_mileage,
+        max_mileage=max_mileage
+    )
+    return data.iloc[positions]
+
+def search_listings(data, store, filters, profile=DEFAULT_PROFILE, segment=None, data_version=None):
+    """검색 결과를 가성비 점수 순위 객체(RankedResult)로 반환하는 함수
+
+    전체를 정렬하지 않고 화면에 보여주는 순위까지만 정렬하며,
+    같은 필터 조합은 결과 캐시를 통해 모든 세션이 한 번 계산한 결과를 공유합니다(데이터 버전별).
+    profile이 기본이 아니거나 segment가 있으면 미리 계산해 둔 점수(ProfileScores)에서 해당 열을 사용합니다.
+    """
+    def compute():
+        positions = store.filter_positions(**filters)
+        if len(positions) == 0:
+            return RankedResult(positions, np.empty(0))
+        if profile == DEFAULT_PROFILE and segment is None:
+            # 저장된 가성비 점수 사용 (점수가 없는 행이 있으면 전체 데이터 기준으로 계산)
+            scores = with_value_score(data.iloc[positions], data)['value_score'].to_numpy(dtype='float64')
+        else:
+            scores = load_profile_scores(segment, data_version).column(profile)[positions]
+        return RankedResult(positions, scores)
     
-    return filtered_data
+    key = (data_version, normalize_filter_key('search', **filters, profile=profile, segment=segment))
+    return get_result_cache().get_or_compute(key, compute)
+
+def rows_with_score(data, search_result, start, end):
+    """검색 결과 중 start~end 순위의 행만 원본에서 꺼내 점수를 붙이는 함수"""
+    positions, scores = search_result.page(start, end)
+    return data.iloc[positions].assign(value_score=scores)
 
 def get_analysis_data(data, analysis_type, group_by):
     """분석 데이터를 생성하는 함수"""
     if analysis_type == "평균 가격":
-        return data.groupby(group_by)['가격'].mean().reset_index()
+        return data.groupby(group_by, observed=True)['가격'].mean().reset_index()
     elif analysis_type == "판매 대수":
-        return data.groupby(group_by).size().reset_index(name='판매대수')
+        return data.groupby(group_by, observed=True).size().reset_index(name='판매대수')
     elif analysis_type == "평균 주행거리":
-        return data.groupby(group_by)['주행거리'].mean().reset_index()
+        return data.groupby(group_by, observed=True)['주행거리'].mean().reset_index()
     elif analysis_type == "신차-중고차 가격차이":
-        result = data.groupby(group_by).agg({
+        result = data.groupby(group_by, observed=True).agg({
             '신차가격': 'mean',
             '가격': 'mean'
         }).reset_index()
@@ -204,53 +290,18 @@ def home_page():
     st.markdown("---")
     
     # 데이터 로드
-    car_data = load_car_data()
+    listings_version = dataset_version('listings')
+    car_data = load_or_report("데이터베이스 연결 중 오류가 발생했습니다", pd.DataFrame(),
+                              load_car_data, listings_version)
     
     # 자동차 거래 현황 분석
     try:
-        query_1 = """
-        SELECT 
-            u.yearNum,
-            u.total_transactions AS used_transactions,
-            a.total_transactions AS all_transactions,
-            ROUND(u.total_transactions / a.total_transactions * 100, 2) AS used_ratio_percent
-        FROM usedcardata u
-        JOIN allcardata a 
-            ON u.yearNum = a.yearNum
-        ORDER BY u.yearNum;
-        """
-        
-        conn = mysql.connector.connect(**db_config)
-        df_1 = pd.read_sql(query_1, conn)
-        conn.close()
-        
-        df_1["all_transactions_yoy"] = df_1["all_transactions"].pct_change() * 100
-        df_1["all_transactions_yoy"] = df_1["all_transactions_yoy"].round(2)
+        # 데이터 버전이 바뀌지 않았다면 쿼리 결과와 차트 이미지를 캐시에서 재사용
+        df_1, chart_png = load_home_dashboard(dataset_version('transactions'))
         
         st.header("📊 자동차 등록 현황 대비 중고차 거래량 전년 대비 증감률 및 비율")
         
-        fig, ax1 = plt.subplots(figsize=(10, 6))
-        
-        # 선 그래프 (중고차 거래량)
-        ax1.plot(df_1["yearNum"], df_1["used_transactions"], marker="o", label="중고차 거래 비율", color="blue")
-        ax1.set_xlabel("Year")
-        ax1.set_ylabel("중고차 거래 비율 (%)", color="blue")
-        ax1.legend(loc="upper left")
-        
-        # 막대 그래프 (all_transactions 전년 대비 증감률)
-        ax2 = ax1.twinx()
-        ax2.bar(df_1["yearNum"], df_1["all_transactions_yoy"], alpha=0.3, color="orange", label="신차 등록 증감율(%)")
-        ax2.set_ylabel("신차 등록 증감율(%)", color="orange")
-        
-        # 범례 합치기
-        lines, labels = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
-        ax1.legend(lines + lines2, labels + labels2, loc="upper right")
-        
-        plt.title("신차 등록 증감률 및 중고차 거래 비율 (2015-2023)")
-        plt.grid(True)
-        
-        st.pyplot(fig)
+        st.image(chart_png, use_container_width=True)
         
         st.markdown("신차 등록률이 감소하고 중고차 거래율이 증가하는 현상은, 소비자들이 새 차보다 중고차를 선호하게 되면서 중고차 시장이 점점 더 중요한 자동차 유통 채널로 자리 잡고 있음을 보여줍니다.")
         
@@ -270,12 +321,26 @@ def home_page():
         JOIN CarInfo i ON c.car_name = i.car_name;"""
 
         # 가성비 상위 10개 차량 표시
-        if not car_data.empty:
-            car_data_with_score = calculate_value_score(car_data, car_data)
-            top10 = car_data_with_score.nlargest(10, 'value_score')
-            
-            st.header("🏆 가성비 상위 10개 차량")
-            st.markdown("가성비 점수는 신차 가격 대비 중고차 가격, 연식, 주행 거리, 동일 모델 등록 대수(인기도)를 종합적으로 고려하여 계산되었습니다.")
+        st.header("🏆 가성비 상위 10개 차량")
+        st.markdown("가성비 점수는 신차 가격 대비 중고차 가격, 연식, 주행 거리, 동일 모델 등록 대수(인기도)를 종합적으로 고려하여 계산되었습니다.")
+        segment_label = st.selectbox("비교 범위", list(SEGMENT_OPTIONS),
+                                     help="차량종류별/차종별을 선택하면 같은 차량종류(차종)끼리 비교한 점수로 순위를 매깁니다.")
+        segment = SEGMENT_OPTIONS[segment_label]
+        
+        if segment is None:
+            # 적재 시 저장된 점수 사용, 없으면 직접 계산
+            top10 = load_or_report("가성비 상위 차량 로딩 중 오류가 발생했습니다", pd.DataFrame(),
+                                   load_top_value_cars, 10, listings_version)
+            if top10.empty and not car_data.empty:
+                car_data_with_score = calculate_value_score(car_data, car_data)
+                top10 = car_data_with_score.iloc[top_k_positions(car_data_with_score['value_score'], 10)]
+        elif not car_data.empty:
+            segment_scores = load_profile_scores(segment, listings_version).column(DEFAULT_PROFILE)
+            top_positions = top_k_positions(segment_scores, 10)
+            top10 = car_data.iloc[top_positions].assign(value_score=segment_scores[top_positions])
+        else:
+            top10 = pd.DataFrame()
+        if not top10.empty:
             
             # 순위와 함께 표시
             display_data = top10[['차량명', '브랜드', '가격', '연식', '주행거리', 'value_score']].copy()
@@ -300,31 +365,74 @@ def search_page():
     st.title("🔍 차량 검색 및 분석")
     st.markdown("---")
     
-    # 데이터 로드
-    car_data = load_car_data()
-    if car_data.empty:
-        st.error("데이터를 로드할 수 없습니다.")
-        return
+    # 데이터 로드 (서버 검색 모드에서는 사이드바 선택지만 DB에서 집계)
+    listings_version = dataset_version('listings')
+    if SERVER_SIDE_SEARCH:
+        filter_options = load_or_report("검색 옵션 로딩 중 오류가 발생했습니다", None,
+                                        load_filter_options, listings_version)
+        if filter_options is None:
+            st.error("데이터를 로드할 수 없습니다.")
+            return
+        brand_types, value_ranges = filter_options
+    else:
+        car_data = load_or_report("데이터베이스 연결 중 오류가 발생했습니다", pd.DataFrame(),
+                                  load_car_data, listings_version)
+        if car_data.empty:
+            st.error("데이터를 로드할 수 없습니다.")
+            return
+        store = load_listing_store(listings_version)
+        value_ranges = {column: (int(car_data[column].min()), int(car_data[column].max()))
+                        for column in ['연식', '가격', '주행거리']}
     
     # 세션 상태 초기화
-    if 'filtered_results' not in st.session_state:
-        st.session_state.filtered_results = pd.DataFrame()
+    if 'search_result' not in st.session_state:
+        st.session_state.search_result = None
+    if 'search_filters' not in st.session_state:
+        st.session_state.search_filters = None
+        st.session_state.search_total = 0
+        st.session_state.page_cursors = [None]
     if 'analysis_results' not in st.session_state:
         st.session_state.analysis_results = pd.DataFrame()
     if 'page_number' not in st.session_state:
         st.session_state.page_number = 0
+    if 'search_profile' not in st.session_state:
+        st.session_state.search_profile = DEFAULT_PROFILE
+        st.session_state.search_segment = None
+    if 'search_version' not in st.session_state:
+        st.session_state.search_version = listings_version
+    
+    # 매물 데이터가 새 버전으로 바뀌었으면 지난 검색 조건을 새 데이터로 다시 검색
+    # (세션의 순위 객체/커서는 이전 데이터의 행 위치를 가리키므로 그대로 쓸 수 없음)
+    if st.session_state.search_version != listings_version:
+        if st.session_state.search_filters is not None:
+            if SERVER_SIDE_SEARCH:
+                st.session_state.search_total = load_listing_count(st.session_state.search_filters, listings_version)
+                st.session_state.page_cursors = [None]
+            elif st.session_state.search_result is not None:
+                st.session_state.search_result = search_listings(
+                    car_data, store, st.session_state.search_filters,
+                    st.session_state.search_profile, st.session_state.search_segment, listings_version)
+        st.session_state.search_version = listings_version
+        st.session_state.page_number = 0
     
     # 사이드바 필터
     st.sidebar.header("검색 및 분석 옵션")
     
     # 브랜드 선택
-    brands = ["전체"] + sorted(car_data['브랜드'].unique().tolist())
+    brand_column = brand_types['브랜드'] if SERVER_SIDE_SEARCH else car_data['브랜드']
+    brands = ["전체"] + sorted(brand_column.unique().tolist())
     selected_brand = st.sidebar.selectbox("브랜드", brands)
     
     # 차량종류 선택 (선택된 브랜드에 맞는 차량종류만 표시)
-    if selected_brand != "전체":
-        brand_filtered_data = car_data[car_data['브랜드'].str.strip() == selected_brand.strip()]
-        available_types = brand_filtered_data['차량종류'].unique()
+    if SERVER_SIDE_SEARCH:
+        if selected_brand != "전체":
+            brand_filtered_types = brand_types[brand_types['브랜드'].str.strip() == selected_brand.strip()]
+            available_types = brand_filtered_types['차량종류'].unique()
+        else:
+            available_types = brand_types['차량종류'].unique()
+    elif selected_brand != "전체":
+        brand_positions = store.positions_for('브랜드', selected_brand)
+        available_types = car_data['차량종류'].iloc[brand_positions].unique()
     else:
         available_types = car_data['차량종류'].unique()
     
@@ -335,20 +443,34 @@ def search_page():
     selected_type = st.sidebar.selectbox("차량종류", car_types)
     
     # 연식 범위
-    min_year = int(car_data['연식'].min())
-    max_year = int(car_data['연식'].max())
+    min_year, max_year = value_ranges['연식']
     year_range = st.sidebar.slider("연식 범위", min_year, max_year, (min_year, max_year))
     
     # 가격 범위
-    min_price = int(car_data['가격'].min())
-    max_price = int(car_data['가격'].max())
+    min_price, max_price = value_ranges['가격']
     price_range = st.sidebar.slider("가격 범위 (만원)", min_price, max_price, (min_price, max_price))
     
     # 주행거리 범위
-    min_mileage = int(car_data['주행거리'].min())
-    max_mileage = int(car_data['주행거리'].max())
+    min_mileage, max_mileage = value_ranges['주행거리']
     mileage_range = st.sidebar.slider("주행거리 범위 (km)", min_mileage, max_mileage, (min_mileage, max_mileage))
     
+    # 가성비 기준과 비교 범위 (서버 검색 모드는 DB에 저장된 기본 점수만 사용)
+    if SERVER_SIDE_SEARCH:
+        selected_profile = DEFAULT_PROFILE
+        selected_segment = None
+    else:
+        selected_profile = st.sidebar.selectbox("가성비 기준", list(SCORE_PROFILES))
+        selected_segment = SEGMENT_OPTIONS[st.sidebar.selectbox("점수 비교 범위", list(SEGMENT_OPTIONS))]
+        # 기준만 바뀌면 지난 검색 조건을 새 기준으로 다시 순위 매김 (성분 점수는 다시 계산하지 않음)
+        if (st.session_state.search_result is not None
+                and (st.session_state.search_profile, st.session_state.search_segment)
+                != (selected_profile, selected_segment)):
+            st.session_state.search_result = search_listings(car_data, store, st.session_state.search_filters,
+                                                             selected_profile, selected_segment, listings_version)
+            st.session_state.search_profile = selected_profile
+            st.session_state.search_segment = selected_segment
+            st.session_state.page_number = 0
+    
     st.sidebar.markdown("---")
     st.sidebar.header("분석 옵션")
     
@@ -370,46 +492,51 @@ def search_page():
     selected_metric = st.sidebar.selectbox('분석 지표', metric_options)
     
     # 검색 및 분석 실행 버튼
+    search_filters = dict(
+        brand=selected_brand,
+        car_type=selected_type,
+        min_year=year_range[0],
+        max_year=year_range[1],
+        min_price=price_range[0],
+        max_price=price_range[1],
+        min_mileage=mileage_range[0],
+        max_mileage=mileage_range[1]
+    )
     col1, col2 = st.sidebar.columns(2)
     with col1:
         if st.button("검색 실행", type="primary", use_container_width=True):
-            filtered_data = filter_car_data(
-                car_data,
-                brand=selected_brand,
-                car_type=selected_type,
-                min_year=year_range[0],
-                max_year=year_range[1],
-                min_price=price_range[0],
-                max_price=price_range[1],
-                min_mileage=mileage_range[0],
-                max_mileage=mileage_range[1]
-            )
-            # 가성비 점수 계산 (전체 데이터를 기준으로)
-            if not filtered_data.empty:
-                results_with_score = calculate_value_score(filtered_data, car_data)
-                # 가성비 점수 순으로 정렬 (높은 순)
-                st.session_state.filtered_results = results_with_score.sort_values('value_score', ascending=False)
+            if SERVER_SIDE_SEARCH:
+                # 조건과 전체 건수만 저장하고, 페이지는 표시할 때마다 DB에서 10개씩 조회
+                st.session_state.search_filters = search_filters
+                st.session_state.search_total = load_listing_count(search_filters, listings_version)
+                st.session_state.page_cursors = [None]
             else:
-                st.session_state.filtered_results = pd.DataFrame()
+                # 세션에는 공유 캐시의 순위 객체만 보관 (데이터프레임 복사본 없음)
+                st.session_state.search_result = search_listings(car_data, store, search_filters,
+                                                                 selected_profile, selected_segment,
+                                                                 listings_version)
+                st.session_state.search_filters = search_filters
+                st.session_state.search_profile = selected_profile
+                st.session_state.search_segment = selected_segment
+            st.session_state.search_version = listings_version
             st.session_state.page_number = 0
     
     with col2:
         if st.button("분석 실행", type="secondary", use_container_width=True):
-            filtered_data = filter_car_data(
-                car_data,
-                brand=selected_brand,
-                car_type=selected_type,
-                min_year=year_range[0],
-                max_year=year_range[1],
-                min_price=price_range[0],
-                max_price=price_range[1],
-                min_mileage=mileage_range[0],
-                max_mileage=mileage_range[1]
-            )
-            if not filtered_data.empty:
-                st.session_state.analysis_results = get_analysis_data(filtered_data, selected_metric, group_by)
-            else:
-                st.session_state.analysis_results = pd.DataFrame()
+            def compute_analysis():
+                # 매물이 많으면 사전 집계 큐브의 셀 합계로 계산 (get_analysis_data와 같은 결과)
+                cube = load_analysis_cube(listings_version)
+                if cube is not None:
+                    return cube.query(selected_metric, group_by, **search_filters)
+                filtered = filter_car_data(load_car_data(listings_version), store=load_listing_store(listings_version),
+                                           **search_filters)
+                if filtered.empty:
+                    return pd.DataFrame()
+                return get_analysis_data(filtered, selected_metric, group_by)
+            
+            analysis_key = (listings_version, normalize_filter_key('analysis', **search_filters,
+                                                                   metric=selected_metric, group_by=group_by))
+            st.session_state.analysis_results = get_result_cache().get_or_compute(analysis_key, compute_analysis)
     
     # 탭으로 결과 구분
     tab1, tab2 = st.tabs(["🔍 검색 결과", "📊 분석 결과"])
@@ -417,15 +544,35 @@ def search_page():
     with tab1:
         st.header("검색 결과")
         
-        if st.session_state.filtered_results.empty:
+        if SERVER_SIDE_SEARCH:
+            has_results = st.session_state.search_total > 0
+        else:
+            search_result = st.session_state.search_result
+            has_results = search_result is not None and len(search_result) > 0
+        
+        if not has_results:
             st.warning("필터 조건을 설정하고 '검색 실행' 버튼을 눌러주세요.")
         else:
-            results = st.session_state.filtered_results
+            items_per_page = ITEMS_PER_PAGE
+            if SERVER_SIDE_SEARCH:
+                # 현재 페이지와 추천 5대만 DB에서 조회 (커서 = 직전 페이지 마지막 행)
+                filters = st.session_state.search_filters
+                top_recommendations = load_listing_page(filters, limit=5, data_version=listings_version)
+                paginated_results = load_listing_page(filters, after=st.session_state.page_cursors[-1],
+                                                      data_version=listings_version)
+                next_cursor = page_cursor(paginated_results)
+                total_items = st.session_state.search_total
+            else:
+                # 화면에 보이는 행만 원본 데이터에서 꺼냄
+                top_recommendations = rows_with_score(car_data, search_result, 0, 5)
+                start_idx = st.session_state.page_number * items_per_page
+                end_idx = start_idx + items_per_page
+                paginated_results = rows_with_score(car_data, search_result, start_idx, end_idx)
+                total_items = len(search_result)
             
             # 가성비 상위 추천 차량
-            if 'value_score' in results.columns:
+            if 'value_score' in top_recommendations.columns:
                 st.subheader("🏆 가성비 상위 추천 차량")
-                top_recommendations = results.head(5)
                 
                 for idx, row in top_recommendations.iterrows():
                     with st.container():
@@ -444,15 +591,8 @@ def search_page():
             
             st.subheader("전체 검색 결과")
             
-            # 페이지네이션
-            items_per_page = 10
-            start_idx = st.session_state.page_number * items_per_page
-            end_idx = start_idx + items_per_page
-            
-            paginated_results = results.iloc[start_idx:end_idx]
-            
             # 검색 결과 요약
-            st.info(f"총 {len(results)}대의 차량이 검색되었습니다.")
+            st.info(f"총 {total_items}대의 차량이 검색되었습니다.")
             
             # 결과 테이블
             if not paginated_results.empty:
@@ -474,7 +614,6 @@ def search_page():
                 )
             
             # 페이지네이션 버튼
-            total_items = len(results)
             total_pages = (total_items - 1) // items_per_page + 1 if total_items > 0 else 1
             
             st.markdown(f"페이지: **{st.session_state.page_number + 1} / {total_pages}**")
@@ -483,10 +622,14 @@ def search_page():
             with col1:
                 if st.button("이전 페이지", disabled=(st.session_state.page_number <= 0)):
                     st.session_state.page_number -= 1
+                    if SERVER_SIDE_SEARCH:
+                        st.session_state.page_cursors.pop()
                     st.rerun()
             with col2:
                 if st.button("다음 페이지", disabled=(st.session_state.page_number >= total_pages - 1)):
                     st.session_state.page_number += 1
+                    if SERVER_SIDE_SEARCH:
+                        st.session_state.page_cursors.append(next_cursor)
                     st.rerun()
     
     with tab2:
@@ -579,16 +722,12 @@ def faq_page():
     st.subheader("🔍 FAQ 검색")
     search_term = st.text_input("궁금한 내용을 검색하세요", placeholder="예: 보증, 할부, 명의변경 등")
     
-    # FAQ 데이터 로드
-    try:
-        # 먼저 DB에서 FAQ 데이터 로드 시도
-        faq_data = load_faq_data()
-        if faq_data.empty:
-            # DB에 데이터가 없으면 정적 데이터 사용
-            faq_data = get_static_faq_data()
-    except:
-        # DB 연결 실패 시 정적 데이터 사용
-        faq_data = get_static_faq_data()
+    # FAQ 데이터와 검색 색인 로드 (FAQ 데이터 버전이 바뀐 경우에만 다시 생성)
+    # (DB 연결 실패 시 정적 FAQ 사용)
+    faq_index = load_or_report("FAQ 데이터 로딩 중 오류가 발생했습니다", None, load_faq_index, dataset_version('faq'))
+    if faq_index is None:
+        faq_index = load_static_faq_index()
+    faq_data = faq_index.data
     
     if faq_data.empty:
         st.warning("FAQ 데이터가 없습니다.")
@@ -596,10 +735,8 @@ def faq_page():
     
     # 검색 필터링
     if search_term:
-        mask = (faq_data['question'].str.contains(search_term, case=False, na=False) | 
-                faq_data['answer'].str.contains(search_term, case=False, na=False) |
-                faq_data['category'].str.contains(search_term, case=False, na=False))
-        filtered_faq = faq_data[mask]
+        # 역색인으로 후보를 찾고 검색어가 그대로 포함된 FAQ만 관련도 순으로 표시
+        filtered_faq = faq_index.search(search_term)
         
         if filtered_faq.empty:
             st.info(f"'{search_term}'에 대한 검색 결과가 없습니다.")
@@ -633,6 +770,9 @@ def main():
         layout="wide"
     )
     
+    # 데이터 미리 로드 (프로세스당 한 번, 백그라운드)
+    warmup = start_warmup()
+    
     st.sidebar.title("메뉴")
     page_options = ["홈", "차량 검색", "FAQ"]
     selected_page = st.sidebar.radio("페이지를 선택하세요", page_options)
@@ -643,6 +783,10 @@ def main():
         search_page()
     elif selected_page == "FAQ":
         faq_page()
+    
+    if not warmup.ready:
+        finished, total = warmup.progress()
+        st.sidebar.caption(f"데이터 준비 중... ({finished}/{total})")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,171 @@
+"""앱 주요 함수 성능 측정 스크립트 (DB 불필요)
+
+synthetic_data.py로 만든 가상 매물 데이터(10k / 1M / 10M 행)에서
+가성비 점수 계산, 차량 필터링, 분석 집계, FAQ 검색 시간을 재고
+처리량(행/초)과 최대 메모리를 bench_baseline.json의 기준치와 비교합니다.
+최대 메모리는 실행 환경과 무관하게 재현되므로 기준치를 넘으면 실패로 처리하고,
+시간은 기준치를 기록한 컴퓨터에 따라 달라지므로 느려진 항목을 참고용으로만 출력합니다.
+
+    python bench_hot_paths.py                      # 10k, 1M 측정 후 기준치와 비교 (메모리가 기준을 넘으면 종료 코드 1)
+    python bench_hot_paths.py --sizes 10k,1m,10m   # 10M 포함 (메모리 8GB 이상 필요: 색인/큐브 생성이 각각 1GB 이상 사용)
+    python bench_hot_paths.py --update-baseline    # 현재 측정값을 기준치로 기록
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from analysis_cube import AnalysisCube
+from app import filter_car_data, get_analysis_data
+from faq_index import FaqIndex
+from listing_store import ListingStore
+from scoring import calculate_value_score
+from synthetic_data import make_faq, make_listings
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASE_DIR, "bench_baseline.json")
+
+SIZES = {'10k': 10_000, '1m': 1_000_000, '10m': 10_000_000}
+DEFAULT_SIZES = "10k,1m"
+FAQ_ROWS_PER_LISTING = 0.01   # FAQ 개수 = 매물 수의 1% (10k 매물 -> FAQ 100개)
+
+TIME_TOLERANCE = 0.50    # 시간은 기준치 대비 50% 이상 느려지면 경고만 출력 (컴퓨터마다 달라 실패로 보지 않음)
+MEMORY_TOLERANCE = 0.20  # 최대 메모리는 기준치 대비 20%까지 허용
+
+# 사이드바에서 자주 쓰는 조건 조합
+SEARCH_FILTERS = [
+    dict(brand="현대"),
+    dict(brand="기아", car_type="SUV", min_year=20),
+    dict(min_price=1000, max_price=2500, max_mileage=80000),
+    dict(),
+]
+ANALYSIS_TYPES = ["평균 가격", "판매 대수", "평균 주행거리", "신차-중고차 가격차이"]
+FAQ_TERMS = ["보증", "내차팔기", "환불", "인증중고차 계약", "자동차"]
+
+
+def repeats_for(rows):
+    """작은 데이터는 여러 번 재서 최솟값을 사용"""
+    return max(1, min(5, 1_000_000 // rows))
+
+
+def measure(func, repeats):
+    """func의 최소 실행 시간(초)과 한 번 실행할 때의 최대 추가 메모리(바이트)"""
+    best = float("inf")
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def bench_size(rows):
+    """한 크기의 데이터로 모든 함수를 측정해 {이름: (초, 처리 행 수, 최대 메모리)} 반환"""
+    data = make_listings(rows)
+    data['value_score'] = calculate_value_score(data, data)['value_score']
+    faq_data = make_faq(max(100, int(rows * FAQ_ROWS_PER_LISTING)))
+    repeats = repeats_for(rows)
+
+    store = ListingStore(data)
+    cube = AnalysisCube(data)
+    faq_index = FaqIndex(faq_data)
+
+    cases = {
+        'calculate_value_score': (lambda: calculate_value_score(data, data), rows),
+        'listing_store_build': (lambda: ListingStore(data), rows),
+        'filter_car_data': (lambda: [filter_car_data(data, store=store, **filters) for filters in SEARCH_FILTERS],
+                            rows * len(SEARCH_FILTERS)),
+        'get_analysis_data': (lambda: [get_analysis_data(data, analysis_type, '브랜드')
+                                       for analysis_type in ANALYSIS_TYPES], rows * len(ANALYSIS_TYPES)),
+        'analysis_cube_build': (lambda: AnalysisCube(data), rows),
+        'analysis_cube_query': (lambda: [cube.query(analysis_type, '브랜드', **filters)
+                                         for analysis_type in ANALYSIS_TYPES for filters in SEARCH_FILTERS],
+                                rows * len(ANALYSIS_TYPES) * len(SEARCH_FILTERS)),
+        'faq_index_build': (lambda: FaqIndex(faq_data), len(faq_data)),
+        'faq_search': (lambda: [faq_index.search(term) for term in FAQ_TERMS], len(faq_data) * len(FAQ_TERMS)),
+    }
+
+    results = {}
+    for name, (func, processed_rows) in cases.items():
+        seconds, peak = measure(func, repeats)
+        results[name] = (seconds, processed_rows, peak)
+        print(f"  {name:<24} {seconds * 1000:10.1f} ms {processed_rows / seconds:14,.0f} rows/s "
+              f"{peak / 1024 ** 2:9.1f} MB")
+    return results
+
+
+def compare(measured, baseline):
+    """기준치 대비 (메모리가 허용 범위 이상 늘어난 항목 목록, 허용 범위 이상 느려진 항목 목록)"""
+    regressions = []
+    slowdowns = []
+    for key, current in measured.items():
+        if key not in baseline:
+            continue
+        base = baseline[key]
+        if current['seconds'] > base['seconds'] * (1 + TIME_TOLERANCE):
+            slowdowns.append(f"{key}: {current['seconds'] * 1000:.1f} ms > 기준 {base['seconds'] * 1000:.1f} ms")
+        if current['peak_bytes'] > base['peak_bytes'] * (1 + MEMORY_TOLERANCE):
+            regressions.append(f"{key}: {current['peak_bytes'] / 1024 ** 2:.1f} MB > "
+                               f"기준 {base['peak_bytes'] / 1024 ** 2:.1f} MB")
+    return regressions, slowdowns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="앱 주요 함수 벤치마크 (가상 데이터)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="측정할 크기 (예: 10k,1m,10m)")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 측정값을 기준치로 기록")
+    args = parser.parse_args()
+
+    measured = {}
+    for label in args.sizes.split(","):
+        rows = SIZES[label.strip().lower()]
+        print(f"\n[{label}] {rows:,} rows")
+        for name, (seconds, processed_rows, peak) in bench_size(rows).items():
+            measured[f"{name}@{label}"] = {'seconds': round(seconds, 6),
+                                           'rows_per_second': round(processed_rows / seconds),
+                                           'peak_bytes': peak}
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    if args.update_baseline:
+        # 이번에 측정하지 않은 크기의 기준치는 그대로 유지
+        baseline.update(measured)
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump(dict(sorted(baseline.items())), file, indent=2, ensure_ascii=False)
+            file.write("\n")
+        print(f"\n기준치 기록: {len(measured)}개 항목 -> {os.path.basename(BASELINE_FILE)}")
+        return
+
+    if not baseline:
+        print("\n기준치 파일이 없습니다. --update-baseline 으로 먼저 기록하세요.")
+        return
+
+    regressions, slowdowns = compare(measured, baseline)
+    if slowdowns:
+        print("\n기준치보다 느린 항목 (참고용, 기준치를 기록한 컴퓨터와 다르면 무시):")
+        for line in slowdowns:
+            print(f"  {line}")
+    if regressions:
+        print("\n기준치 대비 메모리 증가:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""차종 매칭 성능 측정 스크립트 (DB 불필요)
+
+car_name.csv 차종 목록을 가상 차종으로 늘리고(카탈로그 크기) 가상 차량명(크롤링 크기)을 만들어
+ModelMatcher(트라이 정규식 한 번 검색)와 기존 방식(차종마다 str.contains 전체 검색)의 시간을 비교합니다.
+기존 방식은 차종 수 × 매물 수에 비례하므로 LOOP_LIMIT를 넘는 조합은 측정하지 않습니다.
+
+    python bench_model_matcher.py                                  # 차종 69/500/5000 × 매물 10k/100k/1m
+    python bench_model_matcher.py --models 69,2000 --rows 10k,1m
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from model_matcher import ModelMatcher
+from synthetic_data import ENGINES, TRIMS, load_car_names
+
+ROW_SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+DEFAULT_MODELS = "69,500,5000"
+DEFAULT_ROWS = "10k,100k,1m"
+LOOP_LIMIT = 10_000_000  # 기존 방식은 차종 수 × 매물 수가 이 값 이하일 때만 측정
+
+# 가상 차종 이름에 쓰는 글자 (정규식 특수문자 없음)
+SYLLABLES = list("가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초코토포호")
+SUFFIXES = ["", "", "", "S", "X", "GT", "EV", "7", "9"]
+
+
+def make_catalogue(models, seed=0):
+    """실제 차종에 가상 차종을 더해 models개의 (브랜드, 차종) 목록을 생성"""
+    rng = np.random.default_rng(seed)
+    names = load_car_names()[['브랜드', '차종']]
+    brands = names['브랜드'].unique()
+    seen = set(names['차종'])
+    extra = []
+    while len(seen) < models:
+        length = rng.integers(2, 5)
+        name = "".join(rng.choice(SYLLABLES, size=length)) + rng.choice(SUFFIXES)
+        if name not in seen:
+            seen.add(name)
+            extra.append((rng.choice(brands), name))
+    extra = pd.DataFrame(extra, columns=['브랜드', '차종'])
+    return pd.concat([names, extra], ignore_index=True).head(models)
+
+
+def make_listing_names(catalogue, rows, seed=0):
+    """카탈로그 차종으로 "브랜드 차종 엔진 트림" 형식의 차량명 Series 생성"""
+    rng = np.random.default_rng(seed)
+    model = rng.integers(0, len(catalogue), size=rows)
+    engine = np.array(ENGINES)[rng.integers(0, len(ENGINES), size=rows)]
+    trim = np.array(TRIMS)[rng.integers(0, len(TRIMS), size=rows)]
+    brand = catalogue['브랜드'].to_numpy()[model]
+    car_name = catalogue['차종'].to_numpy()[model]
+    return pd.Series([f"{b} {c} {e} {t}" for b, c, e, t in zip(brand, car_name, engine, trim)])
+
+
+def tag_with_loop(names, catalogue):
+    """기존 Data_Preprocessing 방식 (차종마다 전체 차량명에 str.contains, 마지막 일치가 남음)"""
+    tagged = pd.Series([None] * len(names), dtype=object)
+    for model in catalogue['차종']:
+        tagged[names.str.contains(model, na=False)] = model
+    return tagged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="차종 매칭 성능 측정")
+    parser.add_argument("--models", default=DEFAULT_MODELS, help="쉼표로 구분한 차종 수 목록")
+    parser.add_argument("--rows", default=DEFAULT_ROWS, help=f"쉼표로 구분한 매물 수 ({', '.join(ROW_SIZES)})")
+    args = parser.parse_args()
+
+    results = []
+    for models in [int(value) for value in args.models.split(",")]:
+        catalogue = make_catalogue(models)
+        start = time.perf_counter()
+        matcher = ModelMatcher.from_car_names(catalogue)
+        compile_seconds = time.perf_counter() - start
+
+        for label in args.rows.split(","):
+            rows = ROW_SIZES[label]
+            names = make_listing_names(catalogue, rows)
+            start = time.perf_counter()
+            tagged = matcher.tag(names)
+            matcher_seconds = time.perf_counter() - start
+
+            loop_seconds = None
+            if models * rows <= LOOP_LIMIT:
+                start = time.perf_counter()
+                tag_with_loop(names, catalogue)
+                loop_seconds = time.perf_counter() - start
+
+            results.append({
+                'models': len(catalogue), 'rows': label,
+                'compile_ms': compile_seconds * 1000,
+                'matcher_s': matcher_seconds,
+                'rows_per_s': rows / matcher_seconds,
+                'loop_s': loop_seconds,
+                'speedup': loop_seconds / matcher_seconds if loop_seconds else None,
+                'tagged': tagged.notna().mean(),
+            })
+            print(f"차종 {len(catalogue):,} × 매물 {label}: matcher {matcher_seconds:.2f}s"
+                  + (f", loop {loop_seconds:.2f}s" if loop_seconds is not None else ""))
+
+    print()
+    print(pd.DataFrame(results).to_string(index=False, float_format=lambda value: f"{value:,.3f}", na_rep="-"))
+
+
+if __name__ == "__main__":
+    main()
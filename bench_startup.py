@@ -0,0 +1,119 @@
+"""app.py 시작(import) 시간 측정 스크립트
+
+python -X importtime 으로 `import app`을 여러 번 실행해 누적 import 시간의 중앙값을 구하고,
+startup_baseline.json에 기록된 기준치와 비교합니다.
+
+    python bench_startup.py                    # 기준치와 비교 (초과하면 종료 코드 1)
+    python bench_startup.py --update-baseline  # 현재 측정값을 기준치로 기록
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE = os.path.join(BASE_DIR, "startup_baseline.json")
+
+RUNS = 5
+TOLERANCE = 0.20  # 기준치 대비 허용 증가율
+
+# 앱 시작 시 불러오면 안 되는 무거운 모듈 (처음 필요한 페이지에서만 로드)
+# pyarrow는 설치되어 있으면 pandas가 직접 불러오므로 제외
+DEFERRED_MODULES = ['matplotlib', 'mysql', 'Data_input']
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력을 (모듈 이름, 누적 시간(마이크로초), 중첩 깊이) 목록으로 반환
+
+    출력 순서대로이므로 하위 모듈이 자신을 불러온 모듈보다 먼저 나옵니다.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), int(cumulative_us), depth))
+    return entries
+
+
+def direct_imports(entries, module):
+    """module이 직접 불러온 모듈별 누적 시간 (module 바로 앞의 한 단계 깊은 항목들)"""
+    index = max(i for i, (name, _, depth) in enumerate(entries) if name == module and depth == 0)
+    children = {}
+    for name, cumulative_us, depth in reversed(entries[:index]):
+        if depth == 0:
+            break
+        if depth == 1:
+            children[name] = cumulative_us
+    return children
+
+
+def measure_once():
+    """새 인터프리터에서 app을 import 하고 import 시간 목록을 반환"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=BASE_DIR, capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"app import 실패:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def measure(runs=RUNS):
+    """runs번 측정해 app 전체 import 시간의 중앙값(ms)과 마지막 측정의 import 목록을 반환"""
+    totals = []
+    entries = []
+    for _ in range(runs):
+        entries = measure_once()
+        totals.append(next(us for name, us, depth in entries if name == 'app' and depth == 0) / 1000)
+    return statistics.median(totals), entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="app.py import 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=RUNS)
+    parser.add_argument("--update-baseline", action="store_true", help="현재 측정값을 기준치로 기록")
+    args = parser.parse_args()
+
+    app_ms, entries = measure(args.runs)
+    print(f"app import (median of {args.runs}): {app_ms:.1f} ms")
+
+    print("\napp이 직접 import 한 모듈의 누적 시간 (상위 10개)")
+    direct = direct_imports(entries, 'app')
+    for name, us in sorted(direct.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {name:<24} {us / 1000:8.1f} ms")
+
+    failed = False
+    modules = {name for name, _, _ in entries}
+    loaded = [name for name in DEFERRED_MODULES if any(m == name or m.startswith(name + ".") for m in modules)]
+    if loaded:
+        print(f"\n시작 시 불러오면 안 되는 모듈이 로드됨: {', '.join(loaded)}")
+        failed = True
+
+    if args.update_baseline:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as file:
+            json.dump({'app_import_ms': round(app_ms, 1), 'tolerance': TOLERANCE,
+                       'python': sys.version.split()[0]}, file, indent=2)
+            file.write("\n")
+        print(f"\n기준치 기록: {app_ms:.1f} ms -> {os.path.basename(BASELINE_FILE)}")
+    elif os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding="utf-8") as file:
+            baseline = json.load(file)
+        limit = baseline['app_import_ms'] * (1 + baseline.get('tolerance', TOLERANCE))
+        print(f"\n기준치 {baseline['app_import_ms']:.1f} ms, 허용 한도 {limit:.1f} ms")
+        if app_ms > limit:
+            print(f"시작 시간이 기준치를 초과했습니다: {app_ms:.1f} ms > {limit:.1f} ms")
+            failed = True
+    else:
+        print("\n기준치 파일이 없습니다. --update-baseline 으로 먼저 기록하세요.")
+
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+
+from db_access import DB_CONFIG, get_connection, timed
+
+INSERT_CHUNK_ROWS = 5000   # executemany 한 번에 보내는 행 수 (mysql.connector가 다중 행 VALUES 한 문장으로 보냄)
+COMMIT_EVERY_ROWS = 50000  # 한 트랜잭션(= 체크포인트 간격)으로 적재하는 행 수
+
+logger = logging.getLogger(__name__)
+
+
+class LoadStats:
+    """테이블 하나의 적재 결과 (행 수, 소요 시간, 적재 방식)"""
+
+    def __init__(self, table, rows, seconds, method):
+        self.table = table
+        self.rows = rows
+        self.seconds = seconds
+        self.method = method
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds > 0 else float('inf')
+
+    def __str__(self):
+        if self.rows == 0:
+            return f"{self.table}: 0 rows ({self.method})"
+        return (f"{self.table}: {self.rows:,} rows, {self.seconds:.2f}s "
+                f"({self.rows_per_second:,.0f} rows/s, {self.method})")
+
+
+def insert_statement(table, columns, ignore=True):
+    """table에 columns 순서로 한 행을 넣는 INSERT 문 (%s 자리표시자)"""
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT {'IGNORE ' if ignore else ''}INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+
+def chunked(rows, size):
+    """rows를 size개씩 묶은 리스트를 차례로 반환 (전체를 메모리에 올리지 않음)"""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def insert_rows(cursor, table, columns, rows, chunk_rows=INSERT_CHUNK_ROWS, ignore=True):
+    """rows를 chunk_rows개씩 executemany로 넣음 (커밋은 호출한 쪽에서)"""
+    statement = insert_statement(table, columns, ignore)
+    for chunk in chunked(rows, chunk_rows):
+        with timed(f"bulk_insert.{table}"):
+            cursor.executemany(statement, chunk)
+
+
+def _infile_field(value):
+    # ENCLOSED BY '"', ESCAPED BY '' 형식: NULL은 따옴표 없는 NULL, 나머지는 따옴표로 감싸고 "는 ""로
+    if value is None:
+        return "NULL"
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def write_infile(rows, path):
+    """rows를 LOAD DATA용 CSV 파일로 쓰고 행 수를 반환"""
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        for row in rows:
+            file.write(",".join(_infile_field(value) for value in row))
+            file.write("\n")
+            count += 1
+    return count
+
+
+def local_infile_enabled(conn):
+    """서버가 LOAD DATA LOCAL INFILE을 허용하는지 (local_infile 시스템 변수)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SHOW GLOBAL VARIABLES LIKE 'local_infile'")
+        row = cursor.fetchone()
+    finally:
+        cursor.close()
+    return row is not None and str(row[1]).upper() in ("ON", "1")
+
+
+def open_local_infile_connection():
+    """LOAD DATA LOCAL INFILE 전용 연결 (풀 연결은 allow_local_infile이 꺼져 있음)
+
+    서버가 local_infile을 허용하지 않거나 연결할 수 없으면 None을 반환합니다.
+    """
+    try:
+        import mysql.connector
+        conn = mysql.connector.connect(allow_local_infile=True, **DB_CONFIG)
+    except Exception as e:
+        logger.warning("LOAD DATA용 연결 실패: %s", e)
+        return None
+    try:
+        if local_infile_enabled(conn):
+            return conn
+        logger.info("서버의 local_infile이 꺼져 있어 executemany로 적재합니다.")
+    except Exception as e:
+        logger.warning("local_infile 설정 확인 실패: %s", e)
+    conn.close()
+    return None
+
+
+def load_infile(cursor, table, columns, rows, ignore=True):
+    """rows를 임시 파일로 쓴 뒤 LOAD DATA LOCAL INFILE 한 문장으로 넣음 (커밋은 호출한 쪽에서)"""
+    fd, path = tempfile.mkstemp(prefix=f"{table}_", suffix=".csv")
+    os.close(fd)
+    try:
+        write_infile(rows, path)
+        with timed(f"load_infile.{table}"):
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s {'IGNORE ' if ignore else ''}INTO TABLE {table} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' "
+                f"LINES TERMINATED BY '\\n' ({', '.join(columns)})",
+                (path,)
+            )
+    finally:
+        os.remove(path)
+
+
+@contextmanager
+def load_connection(use_infile=True):
+    """적재에 쓸 (연결, 적재 방식) - LOAD DATA를 쓸 수 있으면 전용 연결, 아니면 풀 연결"""
+    conn = open_local_infile_connection() if use_infile else None
+    if conn is not None:
+        try:
+            yield conn, "LOAD DATA"
+        finally:
+            conn.close()
+        return
+    with get_connection() as conn:
+        yield conn, "executemany"
+
+
+def load_batches(table, columns, batches, chunk_rows=INSERT_CHUNK_ROWS, use_infile=True, ignore=True,
+                 on_commit=None, after_commit=None):
+    """batches의 행 묶음을 묶음마다 한 트랜잭션으로 적재하고 (적재 행 수, 적재 방식)을 반환
+
+    batches는 (행 리스트, 위치) 쌍을 차례로 반환하며, on_commit(cursor, 행 리스트, 위치)는
+    커밋 직전 같은 트랜잭션에서, after_commit(행 리스트, 위치)는 커밋이 끝난 뒤 호출됩니다(체크포인트 기록용).
+    실패하면 진행 중인 묶음만 롤백됩니다.
+    """
+    total = 0
+    with load_connection(use_infile) as (conn, method):
+        cursor = conn.cursor()
+        try:
+            for rows, position in batches:
+                if method == "LOAD DATA":
+                    load_infile(cursor, table, columns, rows, ignore)
+                else:
+                    insert_rows(cursor, table, columns, rows, chunk_rows, ignore)
+                if on_commit is not None:
+                    on_commit(cursor, rows, position)
+                conn.commit()
+                total += len(rows)
+                if after_commit is not None:
+                    after_commit(rows, position)
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    if method == "executemany":
+        method = f"executemany x{chunk_rows}"
+    return total, method
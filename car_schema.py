@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+# 반복되는 문자열 컬럼 → category (앞뒤 공백은 로드 시 한 번만 제거)
+CATEGORY_COLUMNS = ['브랜드', '차종', '차량종류', '차량명']
+# 정수 컬럼 → 값 범위에 맞는 가장 작은 부호 있는 정수형
+INTEGER_COLUMNS = ['car_ID', '연식', '주행거리', '가격', '신차가격']
+
+
+def downcast_integer(series):
+    """결측치 없이 모두 정수값이면 가장 작은 정수형으로, 아니면 그대로 반환"""
+    values = pd.to_numeric(series, errors='coerce')
+    if values.isna().any():
+        return series
+    if not np.array_equal(values, np.floor(values)):
+        return series
+    return pd.to_numeric(values.astype('int64'), downcast='integer')
+
+
+def optimize_car_dtypes(car_data):
+    """load_car_data 결과를 메모리를 적게 쓰는 자료형으로 변환
+
+    문자열 컬럼은 공백 제거 후 category로, 정수 컬럼은 int8/int16/int32로 줄입니다.
+    결측치가 있거나 소수인 숫자 컬럼, value_score는 float64 그대로 둡니다.
+    """
+    optimized = {}
+    for column in car_data.columns:
+        series = car_data[column]
+        if column in CATEGORY_COLUMNS:
+            series = series.astype(object).str.strip().astype('category')
+        elif column in INTEGER_COLUMNS:
+            series = downcast_integer(series)
+        optimized[column] = series
+    return pd.DataFrame(optimized, index=car_data.index)
+
+
+def memory_report(df):
+    """컬럼별 자료형과 메모리 사용량(바이트, deep) 보고서"""
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'dtype': df.dtypes.astype(str),
+        'bytes': usage,
+    })
+    report['share'] = report['bytes'] / report['bytes'].sum() if report['bytes'].sum() else 0.0
+    report.loc['합계'] = ['', int(report['bytes'].sum()), 1.0 if len(df.columns) else 0.0]
+    return report
@@ -0,0 +1,226 @@
+import csv
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bulk_load import COMMIT_EVERY_ROWS, INSERT_CHUNK_ROWS, LoadStats, load_batches
+from db_access import get_connection, read_sql
+
+FINGERPRINT_SAMPLE_BYTES = 1 << 20  # 지문 계산 시 파일 앞/뒤에서 읽는 크기 (파일 전체를 읽지 않음)
+
+CHECKPOINT_QUERY = "SELECT fingerprint, byte_offset, rows_loaded FROM ingest_checkpoint WHERE source = %s"
+# 같은 파일이면 위치가 뒤로 가지 않게 GREATEST로 기록 (여러 연결이 커밋 순서와 다르게 기록해도 가장 앞선 위치 유지)
+# ON DUPLICATE KEY UPDATE는 왼쪽부터 적용되므로 fingerprint는 비교가 끝난 뒤 마지막에 바꿈
+SAVE_CHECKPOINT_QUERY = """
+INSERT INTO ingest_checkpoint (source, fingerprint, byte_offset, rows_loaded) VALUES (%s, %s, %s, %s)
+ON DUPLICATE KEY UPDATE
+    byte_offset = IF(fingerprint = VALUES(fingerprint), GREATEST(byte_offset, VALUES(byte_offset)), VALUES(byte_offset)),
+    rows_loaded = IF(fingerprint = VALUES(fingerprint), GREATEST(rows_loaded, VALUES(rows_loaded)), VALUES(rows_loaded)),
+    fingerprint = VALUES(fingerprint)
+"""
+RESET_CHECKPOINT_QUERY = "DELETE FROM ingest_checkpoint WHERE source = %s"
+
+
+def file_fingerprint(path):
+    """파일 크기와 앞/뒤 FINGERPRINT_SAMPLE_BYTES의 SHA-1 (파일이 바뀌었는지 확인용)"""
+    size = os.path.getsize(path)
+    digest = hashlib.sha1(str(size).encode())
+    with open(path, "rb") as file:
+        digest.update(file.read(FINGERPRINT_SAMPLE_BYTES))
+        if size > FINGERPRINT_SAMPLE_BYTES:
+            file.seek(max(size - FINGERPRINT_SAMPLE_BYTES, FINGERPRINT_SAMPLE_BYTES))
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class _Lines:
+    """바이너리 파일을 한 줄씩 디코딩해 돌려주며 지금까지 읽은 바이트 위치를 기록
+
+    csv.reader는 레코드 하나에 필요한 줄만 가져가므로(미리 읽지 않음),
+    레코드를 받은 직후의 offset이 다음 레코드의 시작 위치입니다.
+    """
+
+    def __init__(self, file, encoding):
+        self.file = file
+        self.encoding = encoding
+        self.offset = file.tell()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        line = self.file.readline()
+        if not line:
+            raise StopIteration
+        self.offset += len(line)
+        # 텍스트 모드(newline=None)로 읽던 이전 방식과 같이 줄바꿈을 \n으로 통일 (따옴표 안 여러 줄 값 포함)
+        return line.decode(self.encoding).replace('\r\n', '\n')
+
+
+def read_csv_batches(path, encoding, fields, batch_rows=COMMIT_EVERY_ROWS, start_offset=0):
+    """CSV를 batch_rows행씩 읽어 (fields 순서 튜플 리스트, 묶음 끝 바이트 위치)를 차례로 반환
+
+    start_offset이 있으면 헤더만 읽은 뒤 그 위치부터 이어서 읽습니다. 메모리는 묶음 하나 크기만 사용합니다.
+    없는 컬럼이나 값이 모자란 행의 값은 None(csv.DictReader와 같음)입니다.
+    """
+    with open(path, "rb") as file:
+        lines = _Lines(file, encoding)
+        header = next(csv.reader(lines), [])
+        indexes = [header.index(field) if field in header else None for field in fields]
+        if start_offset > lines.offset:
+            file.seek(start_offset)
+            lines = _Lines(file, encoding)
+
+        batch = []
+        for record in csv.reader(lines):
+            if not record:
+                continue
+            batch.append(tuple(record[index] if index is not None and index < len(record) else None
+                               for index in indexes))
+            if len(batch) >= batch_rows:
+                yield batch, lines.offset
+                batch = []
+        if batch:
+            yield batch, lines.offset
+
+
+def reset_checkpoint(source):
+    """source의 체크포인트 삭제 (처음부터 다시 적재할 때, 기록이 위치를 앞당기지 못하므로 먼저 지움)"""
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(RESET_CHECKPOINT_QUERY, (source,))
+        conn.commit()
+        cursor.close()
+
+
+def load_checkpoint(source, fingerprint):
+    """source의 저장된 (바이트 위치, 적재 행 수), 파일이 바뀌었거나 기록이 없으면 (0, 0)"""
+    checkpoint = read_sql(CHECKPOINT_QUERY, params=(source,), label="ingest_checkpoint")
+    if checkpoint.empty or checkpoint['fingerprint'].iloc[0] != fingerprint:
+        return 0, 0
+    return int(checkpoint['byte_offset'].iloc[0]), int(checkpoint['rows_loaded'].iloc[0])
+
+
+class _SharedBatches:
+    """여러 적재 스레드가 함께 꺼내 쓰는 묶음 반복자 ((번호, 끝 위치)를 위치로 붙여 반환)
+
+    CSV 읽기는 잠금 안에서 한 스레드씩 하고, DB 쓰기는 스레드마다 동시에 합니다.
+    close()하면 남은 묶음을 더 내주지 않습니다(다른 스레드가 실패했을 때).
+    """
+
+    def __init__(self, batches):
+        self._batches = enumerate(batches)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            if self._closed:
+                raise StopIteration
+            index, (rows, offset) = next(self._batches)
+        return rows, (index, offset)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+
+
+class _CommitTracker:
+    """묶음이 순서와 다르게 커밋돼도 앞에서부터 빠짐없이 커밋된 위치까지만 체크포인트로 계산"""
+
+    def __init__(self, offset, rows):
+        self._lock = threading.Lock()
+        self._committed = {}
+        self._next = 0
+        self.offset = offset
+        self.rows = rows
+
+    def _advance(self, committed):
+        index, offset, rows = self._next, self.offset, self.rows
+        while index in committed:
+            batch_rows, offset = committed[index]
+            rows += batch_rows
+            index += 1
+        return index, offset, rows
+
+    def checkpoint(self, rows, position):
+        """이 묶음(position = (번호, 끝 위치))까지 커밋된다고 할 때 기록할 (바이트 위치, 적재 행 수)"""
+        index, offset = position
+        with self._lock:
+            _, offset, total = self._advance({**self._committed, index: (len(rows), offset)})
+        return offset, total
+
+    def committed(self, rows, position):
+        index, offset = position
+        with self._lock:
+            self._committed[index] = (len(rows), offset)
+            self._next, self.offset, self.rows = self._advance(self._committed)
+            for done in [done for done in self._committed if done < self._next]:
+                del self._committed[done]
+
+
+def load_csv(table, columns, path, encoding, fields, batch_rows=COMMIT_EVERY_ROWS, chunk_rows=INSERT_CHUNK_ROWS,
+             use_infile=True, resume=True, transform=None, writers=1):
+    """CSV 파일 하나를 batch_rows행 묶음마다 커밋하며 table에 적재하고 LoadStats를 반환
+
+    묶음을 커밋할 때 같은 트랜잭션에서 ingest_checkpoint에 (파일 지문, 바이트 위치)를 기록하므로,
+    중간에 실패해도 다시 실행하면 마지막으로 커밋된 묶음 다음부터 이어서 적재합니다.
+    이미 끝까지 적재한 파일은 내용이 바뀌지 않았다면 건너뜁니다(resume=False면 처음부터).
+    transform을 주면 각 행(fields 순서 튜플)을 transform(행)으로 바꿔 적재합니다(예: 해시 컬럼 추가).
+
+    writers가 2 이상이면 연결 writers개가 묶음을 나눠 동시에 씁니다. 체크포인트는 앞에서부터
+    빠짐없이 커밋된 묶음까지만 기록하므로, 재개 시 그 뒤에 이미 커밋된 묶음은 다시 보내고
+    유일 키(CarInfo.row_hash 등)의 INSERT IGNORE로 중복 없이 무시됩니다.
+    기록은 위치가 뒤로 가지 않고(GREATEST), 모든 묶음이 커밋되면 끝 위치를 한 번 더 기록합니다
+    (마지막 묶음들이 동시에 커밋되면 각 연결이 계산한 위치에 서로의 묶음이 빠져 있을 수 있음).
+    """
+    source = f"{table}:{os.path.basename(path)}"
+    fingerprint = file_fingerprint(path)
+    if resume:
+        start_offset, rows_loaded = load_checkpoint(source, fingerprint)
+    else:
+        reset_checkpoint(source)
+        start_offset, rows_loaded = 0, 0
+    if start_offset >= os.path.getsize(path):
+        return LoadStats(source, 0, 0.0, "up to date")
+    if start_offset:
+        print(f"{source}: {start_offset:,} 바이트({rows_loaded:,} rows)까지 적재됨, 이어서 적재")
+
+    tracker = _CommitTracker(start_offset, rows_loaded)
+
+    def save_checkpoint(cursor, rows, position):
+        offset, total = tracker.checkpoint(rows, position)
+        cursor.execute(SAVE_CHECKPOINT_QUERY, (source, fingerprint, offset, total))
+
+    start = time.perf_counter()
+    batches = read_csv_batches(path, encoding, fields, batch_rows, start_offset)
+    if transform is not None:
+        batches = (([transform(row) for row in rows], offset) for rows, offset in batches)
+    batches = _SharedBatches(batches)
+
+    def write():
+        try:
+            return load_batches(table, columns, batches, chunk_rows, use_infile,
+                                on_commit=save_checkpoint, after_commit=tracker.committed)
+        except Exception:
+            batches.close()
+            raise
+
+    if writers <= 1:
+        count, method = write()
+    else:
+        with ThreadPoolExecutor(max_workers=writers, thread_name_prefix=f"load-{table}") as executor:
+            results = [future.result() for future in [executor.submit(write) for _ in range(writers)]]
+        count = sum(result[0] for result in results)
+        method = f"{results[0][1]}, {writers} writers"
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(SAVE_CHECKPOINT_QUERY, (source, fingerprint, tracker.offset, tracker.rows))
+            conn.commit()
+            cursor.close()
+    return LoadStats(source, count, time.perf_counter() - start, method)
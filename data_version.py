@@ -0,0 +1,135 @@
+import logging
+import random
+import threading
+import time
+
+from db_access import read_sql, table_checksum
+
+# 데이터셋 -> 해당 데이터셋을 구성하는 테이블 (적재 시 데이터셋 단위로 버전을 올림)
+DATASET_TABLES = {
+    'listings': ('carname', 'carinfo'),
+    'transactions': ('usedcardata', 'allcardata'),
+    'faq': ('car_faq',),
+}
+
+POLL_SECONDS = 30           # 버전 확인 간격 (프로세스당 쿼리 1회)
+RELOAD_JITTER_SECONDS = 10  # 여러 프로세스가 동시에 다시 로드하지 않도록 시작 시각을 흩뜨림
+
+VERSION_QUERY = "SELECT dataset, version FROM data_version"
+MISSING_TABLE_ERRNO = 1146  # ER_NO_SUCH_TABLE
+BUMP_QUERY = """
+INSERT INTO data_version (dataset, version) VALUES (%s, 1)
+ON DUPLICATE KEY UPDATE version = version + 1
+"""
+
+logger = logging.getLogger(__name__)
+
+
+def _is_missing_table(error):
+    """MySQL 1146(Table doesn't exist) 오류인지 (pandas가 감싼 오류면 원래 오류까지 확인)"""
+    while error is not None:
+        if getattr(error, 'errno', None) == MISSING_TABLE_ERRNO:
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def fetch_versions():
+    """데이터셋별 현재 버전 {데이터셋: 버전}
+
+    data_version 테이블이 없는 DB에서만 테이블 체크섬을 버전으로 사용합니다.
+    CHECKSUM TABLE은 테이블 전체를 읽으므로 일시적인 연결 오류 등에서는 쓰지 않고 오류를 그대로 올립니다
+    (VersionTracker는 이전 버전을 계속 사용).
+    """
+    try:
+        rows = read_sql(VERSION_QUERY, label="data_version")
+    except Exception as e:
+        if not _is_missing_table(e):
+            raise
+        logger.debug("data_version 테이블 없음, 체크섬 사용: %s", e)
+        return {dataset: "checksum:" + ",".join(str(value) for value in table_checksum(*tables))
+                for dataset, tables in DATASET_TABLES.items()}
+    versions = dict(zip(rows['dataset'], rows['version'].astype(int)))
+    # 아직 한 번도 적재되지 않은 데이터셋은 0
+    return {dataset: int(versions.get(dataset, 0)) for dataset in DATASET_TABLES}
+
+
+def bump_version(cursor, *datasets):
+    """적재가 끝난 데이터셋의 버전을 올림 (적재와 같은 트랜잭션에서 호출)"""
+    for dataset in datasets:
+        cursor.execute(BUMP_QUERY, (dataset,))
+
+
+class VersionTracker:
+    """데이터셋별로 앱이 사용 중인 버전을 관리하는 객체
+
+    POLL_SECONDS마다 data_version을 확인해 새 버전이 보이면 해당 데이터셋만
+    백그라운드에서 loaders[데이터셋](새 버전)으로 미리 로드하고, 끝난 뒤에 사용 버전을 바꿉니다.
+    다시 로드하는 동안에는 이전 버전의 캐시를 그대로 사용합니다.
+    """
+
+    def __init__(self, loaders, poll_seconds=POLL_SECONDS, jitter_seconds=RELOAD_JITTER_SECONDS):
+        self.loaders = loaders
+        self.poll_seconds = poll_seconds
+        self.jitter_seconds = jitter_seconds
+        self._lock = threading.Lock()
+        self._active = {}
+        self._loading = {}
+        self._last_poll = None
+        self._polling = False
+
+    def active_versions(self):
+        """현재 사용할 데이터셋별 버전 (확인 주기가 지났으면 새 버전을 확인)"""
+        with self._lock:
+            due = not self._polling and (self._last_poll is None
+                                         or time.monotonic() - self._last_poll >= self.poll_seconds)
+            if due:
+                self._polling = True
+        if due:
+            self._poll()
+        with self._lock:
+            return dict(self._active)
+
+    def version(self, dataset):
+        """dataset의 현재 사용 버전 (DB에 연결할 수 없으면 None)"""
+        return self.active_versions().get(dataset)
+
+    def _poll(self):
+        try:
+            latest = fetch_versions()
+        except Exception as e:
+            logger.warning("데이터 버전 확인 실패: %s", e)
+            latest = {}
+        with self._lock:
+            self._last_poll = time.monotonic()
+            self._polling = False
+            for dataset, version in latest.items():
+                if dataset not in self._active:
+                    # 처음 확인한 버전은 바로 사용 (첫 요청 또는 워밍업이 로드)
+                    self._active[dataset] = version
+                elif version != self._active[dataset] and self._loading.get(dataset) != version:
+                    self._loading[dataset] = version
+                    threading.Thread(target=self._reload, args=(dataset, version),
+                                     name=f"reload-{dataset}", daemon=True).start()
+
+    def _reload(self, dataset, version):
+        time.sleep(random.uniform(0, self.jitter_seconds))
+        start = time.perf_counter()
+        try:
+            self.loaders[dataset](version)
+        except Exception as e:
+            logger.warning("%s 버전 %s 로드 실패, 이전 버전 유지: %s", dataset, version, e)
+        else:
+            with self._lock:
+                self._active[dataset] = version
+            logger.info("%s 버전 %s로 교체 (%.2fs)", dataset, version, time.perf_counter() - start)
+        finally:
+            with self._lock:
+                if self._loading.get(dataset) == version:
+                    del self._loading[dataset]
+
+    def status(self):
+        """데이터셋별 사용 중인 버전과 로드 중인 버전"""
+        with self._lock:
+            return {dataset: {'active': version, 'loading': self._loading.get(dataset)}
+                    for dataset, version in self._active.items()}
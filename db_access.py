@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+
+# MySQL 연결 설정 (app.py, Data_input.py, test_value_score.py 공용)
+DB_CONFIG = {
+    'user': 'Park',
+    'password': 'Park',
+    'host': 'localhost',
+    'database': 'used_car_db',
+    'auth_plugin': 'mysql_native_password'
+}
+
+POOL_NAME = "used_car_pool"
+POOL_SIZE = 5            # 프로세스당 최대 동시 연결 수 (mysql.connector 상한 32)
+CHECKOUT_TIMEOUT = 10    # 연결을 빌릴 때 최대 대기 시간(초)
+SLOW_QUERY_SECONDS = 1.0  # 이 시간보다 오래 걸린 쿼리는 경고로 기록
+
+logger = logging.getLogger(__name__)
+
+_pool = None
+_pool_lock = threading.Lock()
+_pool_slots = threading.BoundedSemaphore(POOL_SIZE)
+
+_stats_lock = threading.Lock()
+_query_stats = {}
+
+# MySQL 대신 쿼리를 처리할 함수 (부하 측정/벤치마크용, None이면 MySQL 사용)
+_backend = None
+
+
+def get_pool():
+    """연결 풀을 처음 사용할 때 한 번만 생성해 반환"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from mysql.connector import pooling
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name=POOL_NAME,
+                    pool_size=POOL_SIZE,
+                    pool_reset_session=True,
+                    **DB_CONFIG
+                )
+    return _pool
+
+
+@contextmanager
+def get_connection():
+    """풀에서 연결을 빌려주고 with 블록이 끝나면 반납
+
+    풀이 모두 사용 중이면 CHECKOUT_TIMEOUT초까지 기다리며,
+    빌린 연결은 ping으로 상태를 확인해 끊겼으면 다시 연결합니다.
+    """
+    if not _pool_slots.acquire(timeout=CHECKOUT_TIMEOUT):
+        raise TimeoutError(f"{CHECKOUT_TIMEOUT}초 안에 DB 연결을 얻지 못했습니다. (pool_size={POOL_SIZE})")
+    conn = None
+    try:
+        conn = get_pool().get_connection()
+        conn.ping(reconnect=True, attempts=2, delay=0)
+        yield conn
+    finally:
+        if conn is not None:
+            conn.close()  # 풀 연결의 close()는 실제 종료가 아닌 반납
+        _pool_slots.release()
+
+
+@contextmanager
+def timed(label):
+    """with 블록의 실행 시간을 label별로 누적 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _stats_lock:
+            stats = _query_stats.setdefault(label, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            stats['count'] += 1
+            stats['total_seconds'] += elapsed
+            stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+        if elapsed >= SLOW_QUERY_SECONDS:
+            logger.warning("느린 쿼리 %s: %.3fs", label, elapsed)
+        else:
+            logger.debug("쿼리 %s: %.3fs", label, elapsed)
+
+
+def set_backend(backend):
+    """read_sql이 MySQL 대신 backend(query, params)로 조회하도록 지정 (None이면 MySQL로 복귀)
+
+    load_test.py 등에서 DB 없이 앱을 실행할 때 fixture_backend.FixtureBackend를 넘겨 사용합니다.
+    """
+    global _backend
+    _backend = backend
+
+
+def read_sql(query, params=None, label=None):
+    """풀 연결로 쿼리를 실행해 DataFrame으로 반환"""
+    label = label or " ".join(query.split())[:60]
+    if _backend is not None:
+        with timed(label):
+            return _backend(query, params)
+    with get_connection() as conn:
+        with timed(label):
+            return pd.read_sql(query, conn, params=params)
+
+
+def table_checksum(*tables):
+    """테이블 내용이 바뀌었는지 확인하기 위한 체크섬 튜플 (CHECKSUM TABLE)"""
+    checksums = read_sql("CHECKSUM TABLE " + ", ".join(tables), label="checksum " + ", ".join(tables))
+    return tuple(checksums.iloc[:, -1].tolist())
+
+
+def get_query_stats():
+    """쿼리별 실행 횟수, 누적/최대 시간을 DataFrame으로 반환"""
+    with _stats_lock:
+        rows = [dict(query=label, **stats) for label, stats in _query_stats.items()]
+    stats = pd.DataFrame(rows, columns=['query', 'count', 'total_seconds', 'max_seconds'])
+    stats['avg_seconds'] = stats['total_seconds'] / stats['count']
+    return stats.sort_values('total_seconds', ascending=False).reset_index(drop=True)
@@ -0,0 +1,154 @@
+import hashlib
+import time
+
+from bulk_load import COMMIT_EVERY_ROWS, INSERT_CHUNK_ROWS, chunked, load_batches
+from csv_source import read_csv_batches
+from db_access import get_connection, read_sql, timed
+
+# 같은 매물인지 판단하는 값 (CarInfo 적재 순서와 같음: 차종, 차량명, 연식, 주행거리, 가격)
+HASH_COLUMNS = ('car_name', 'full_name', 'model_year', 'mileage', 'price')
+
+LEGACY_ROWS_QUERY = (f"SELECT car_ID, {', '.join(HASH_COLUMNS)} FROM CarInfo WHERE row_hash IS NULL "
+                     "ORDER BY car_ID")
+HASHED_QUERY = "SELECT row_hash FROM CarInfo WHERE row_hash IS NOT NULL"
+
+# 이번 CSV에 없는 판매 중 매물은 판매 처리, 다시 올라온 매물은 판매 표시 해제
+SOLD_QUERY = """
+UPDATE CarInfo i LEFT JOIN tmp_seen_hash s ON s.row_hash = i.row_hash
+SET i.sold_at = NOW()
+WHERE s.row_hash IS NULL AND i.sold_at IS NULL
+"""
+RELISTED_QUERY = """
+UPDATE CarInfo i JOIN tmp_seen_hash s ON s.row_hash = i.row_hash
+SET i.sold_at = NULL
+WHERE i.sold_at IS NOT NULL
+"""
+NEW_HASH_QUERY = """
+SELECT s.row_hash FROM tmp_seen_hash s
+LEFT JOIN CarInfo i ON i.row_hash = s.row_hash
+WHERE i.car_ID IS NULL
+"""
+
+
+def normalize_value(value):
+    """해시 계산용 값 정규화 (공백 정리, 숫자는 같은 표기로: '2580.0' -> '2580')"""
+    if value is None:
+        return ""
+    text = " ".join(str(value).split())
+    try:
+        number = float(text)
+    except ValueError:
+        return text
+    return str(int(number)) if number.is_integer() else repr(number)
+
+
+def listing_hash(car_name, full_name, model_year, mileage, price):
+    """매물 한 건의 내용 해시 (SHA-1 hex, CarInfo.row_hash)"""
+    key = "\x1f".join(normalize_value(value) for value in (car_name, full_name, model_year, mileage, price))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def with_row_hash(row):
+    """CarInfo 행 튜플 끝에 row_hash를 붙임"""
+    return row + (listing_hash(*row),)
+
+
+def upsert_changed(table, columns, key, rows):
+    """rows 중 DB와 내용이 다른 행(새 행 포함)만 INSERT ... ON DUPLICATE KEY UPDATE로 반영하고 행 수를 반환
+
+    key는 테이블의 기본 키 컬럼이며, 비교는 normalize_value로 정규화한 값으로 합니다.
+    CarName/UsedCarData/AllCarData처럼 기본 키가 있는 작은 테이블용입니다.
+    """
+    existing = read_sql(f"SELECT {', '.join(columns)} FROM {table}", label=f"delta.{table}")
+    current = {tuple(normalize_value(value) for value in row)
+               for row in existing.itertuples(index=False, name=None)}
+    changed = [row for row in rows if tuple(normalize_value(value) for value in row) not in current]
+    if not changed:
+        return 0
+
+    updates = ", ".join(f"{column} = VALUES({column})" for column in columns if column != key)
+    statement = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+                 f"ON DUPLICATE KEY UPDATE {updates}")
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        with timed(f"delta.{table}.upsert"):
+            cursor.executemany(statement, changed)
+        conn.commit()
+        cursor.close()
+    return len(changed)
+
+
+def backfill_row_hashes(chunk_rows=INSERT_CHUNK_ROWS):
+    """row_hash 컬럼 추가 전에 적재된 행에 해시를 채우고, 반복 적재로 생긴 같은 내용의 중복 행은 삭제
+
+    같은 해시 중 car_ID가 가장 작은 행(이미 해시가 있는 행이 있으면 그 행)만 남깁니다.
+    (해시를 채운 행 수, 삭제한 행 수)를 반환하며, 해시가 없는 행이 없으면 아무것도 하지 않습니다.
+    """
+    legacy = read_sql(LEGACY_ROWS_QUERY, label="delta.legacy_rows")
+    if legacy.empty:
+        return 0, 0
+    legacy['row_hash'] = [listing_hash(*row) for row in legacy[list(HASH_COLUMNS)].itertuples(index=False, name=None)]
+    hashed = set(read_sql(HASHED_QUERY, label="delta.hashed")['row_hash'])
+    keep = ~legacy['row_hash'].duplicated() & ~legacy['row_hash'].isin(hashed)
+    updates = [(int(car_id), row_hash) for car_id, row_hash in zip(legacy.loc[keep, 'car_ID'], legacy.loc[keep, 'row_hash'])]
+    deletes = [int(car_id) for car_id in legacy.loc[~keep, 'car_ID']]
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        for chunk in chunked(deletes, chunk_rows):
+            cursor.execute(f"DELETE FROM CarInfo WHERE car_ID IN ({', '.join(['%s'] * len(chunk))})", chunk)
+        # update_value_scores와 같이 임시 테이블에 넣은 뒤 JOIN UPDATE 한 번으로 반영
+        cursor.execute("CREATE TEMPORARY TABLE tmp_row_hash (car_ID INT PRIMARY KEY, row_hash CHAR(40))")
+        for chunk in chunked(updates, chunk_rows):
+            cursor.executemany("INSERT INTO tmp_row_hash (car_ID, row_hash) VALUES (%s, %s)", chunk)
+        with timed("delta.backfill"):
+            cursor.execute("UPDATE CarInfo i JOIN tmp_row_hash t ON i.car_ID = t.car_ID SET i.row_hash = t.row_hash")
+        cursor.execute("DROP TEMPORARY TABLE tmp_row_hash")
+        conn.commit()
+        cursor.close()
+    return len(updates), len(deletes)
+
+
+def delta_load_listings(path, encoding, fields, columns, batch_rows=COMMIT_EVERY_ROWS,
+                        chunk_rows=INSERT_CHUNK_ROWS, use_infile=True):
+    """CSV 매물과 CarInfo를 row_hash로 비교해 새 매물만 넣고, CSV에서 사라진 매물은 sold_at을 기록
+
+    1) CSV 행의 해시만 임시 테이블에 올려 DB에 없는 해시를 찾고
+    2) CSV를 다시 읽어 새 해시의 행만 적재한 뒤
+    3) CSV에 없는 매물은 판매 처리, 다시 나타난 매물은 판매 표시를 해제합니다.
+    바뀌지 않은 매물은 해시(40바이트)만 전송되며, 중간에 실패해도 다시 실행하면 같은 결과가 됩니다.
+    columns는 row_hash를 마지막에 포함한 CarInfo 컬럼입니다. 결과 건수를 dict로 반환합니다.
+    """
+    start = time.perf_counter()
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("CREATE TEMPORARY TABLE tmp_seen_hash (row_hash CHAR(40) PRIMARY KEY)")
+        for rows, _ in read_csv_batches(path, encoding, fields, batch_rows):
+            hashes = [(listing_hash(*row),) for row in rows]
+            for chunk in chunked(hashes, chunk_rows):
+                cursor.executemany("INSERT IGNORE INTO tmp_seen_hash (row_hash) VALUES (%s)", chunk)
+        cursor.execute("SELECT COUNT(*) FROM tmp_seen_hash")
+        seen = cursor.fetchone()[0]
+        cursor.execute(NEW_HASH_QUERY)
+        new_hashes = {row_hash for (row_hash,) in cursor.fetchall()}
+
+        def new_rows():
+            for rows, position in read_csv_batches(path, encoding, fields, batch_rows):
+                rows = [row + (row_hash,) for row in rows if (row_hash := listing_hash(*row)) in new_hashes]
+                if rows:
+                    yield rows, position
+
+        # 새 매물은 다른 연결(LOAD DATA 또는 풀 연결)로 묶음마다 커밋하며 적재 (row_hash 유일 키로 중복 무시)
+        inserted, method = load_batches('CarInfo', columns, new_rows(), chunk_rows, use_infile)
+
+        with timed("delta.mark_sold"):
+            cursor.execute(SOLD_QUERY)
+            sold = cursor.rowcount
+            cursor.execute(RELISTED_QUERY)
+            relisted = cursor.rowcount
+        cursor.execute("DROP TEMPORARY TABLE tmp_seen_hash")
+        conn.commit()
+        cursor.close()
+
+    return {'inserted': inserted, 'sold': sold, 'relisted': relisted,
+            'unchanged': seen - len(new_hashes), 'seconds': time.perf_counter() - start, 'method': method}
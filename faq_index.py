@@ -0,0 +1,130 @@
+import math
+from collections import Counter, defaultdict
+
+import numpy as np
+
+# 필드별 가중치 (질문/카테고리에 나온 검색어를 답변보다 높게 평가)
+FIELD_WEIGHTS = {'question': 2.0, 'category': 1.5, 'answer': 1.0}
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def normalize_text(text):
+    """검색용 정규화 (대소문자 무시)"""
+    return str(text).lower() if text is not None and text == text else ""
+
+
+def char_ngrams(text):
+    """한글처럼 띄어쓰기가 일정하지 않은 텍스트용 글자 bigram (한 글자면 unigram)"""
+    if len(text) == 1:
+        return [text]
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+class FaqIndex:
+    """FAQ 질문/답변/카테고리에 대한 글자 bigram 역색인
+
+    검색어의 bigram을 모두 가진 문서만 후보로 고른 뒤, 검색어가 실제로 연속해서 나오는지
+    (구문 일치) 확인하고 BM25 점수 순으로 정렬합니다. 결과 집합은 대소문자를 무시한
+    부분 문자열 검색과 같고, 특수문자도 정규식이 아닌 글자 그대로 비교합니다.
+    """
+
+    def __init__(self, faq_data):
+        self.data = faq_data
+        self.fields = [field for field in FIELD_WEIGHTS if field in faq_data.columns]
+        self._texts = {
+            field: [normalize_text(value) for value in faq_data[field].tolist()]
+            for field in self.fields
+        }
+
+        postings = defaultdict(dict)
+        unigram_postings = defaultdict(set)
+        doc_lengths = np.zeros(len(faq_data), dtype='float64')
+        for doc_id in range(len(faq_data)):
+            weighted_tf = Counter()
+            for field in self.fields:
+                text = self._texts[field][doc_id]
+                grams = char_ngrams(text) if text else []
+                for gram in grams:
+                    weighted_tf[gram] += FIELD_WEIGHTS[field]
+                doc_lengths[doc_id] += len(grams) * FIELD_WEIGHTS[field]
+                for char in set(text):
+                    unigram_postings[char].add(doc_id)
+            for gram, tf in weighted_tf.items():
+                postings[gram][doc_id] = tf
+
+        # gram -> (문서 번호 배열(오름차순), 가중 빈도 배열)
+        self._postings = {
+            gram: (np.fromiter(docs.keys(), dtype=np.intp), np.fromiter(docs.values(), dtype='float64'))
+            for gram, docs in postings.items()
+        }
+        self._unigram_postings = {
+            char: np.array(sorted(docs), dtype=np.intp) for char, docs in unigram_postings.items()
+        }
+        self._doc_lengths = doc_lengths
+        self._avg_doc_length = doc_lengths.mean() if len(doc_lengths) else 0.0
+
+    def __len__(self):
+        return len(self.data)
+
+    def _candidates(self, grams):
+        """모든 gram을 포함하는 문서 번호 (가장 드문 gram부터 교집합)"""
+        lists = []
+        for gram in set(grams):
+            if len(gram) == 1:
+                docs = self._unigram_postings.get(gram)
+            else:
+                entry = self._postings.get(gram)
+                docs = None if entry is None else entry[0]
+            if docs is None:
+                return np.empty(0, dtype=np.intp)
+            lists.append(docs)
+        lists.sort(key=len)
+        candidates = lists[0]
+        for docs in lists[1:]:
+            candidates = np.intersect1d(candidates, docs, assume_unique=True)
+        return candidates
+
+    def _bm25(self, grams, candidates):
+        """후보 문서들의 BM25 점수"""
+        scores = np.zeros(len(candidates), dtype='float64')
+        doc_count = len(self.data)
+        length_norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths[candidates] / (self._avg_doc_length or 1.0))
+        for gram in set(grams):
+            entry = self._postings.get(gram)
+            if entry is None:
+                continue
+            docs, tfs = entry
+            idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+            # 후보는 모든 gram의 교집합이므로 각 gram의 문서 목록(오름차순)에 반드시 있음
+            tf = tfs[np.searchsorted(docs, candidates)]
+            scores += idf * tf * (BM25_K1 + 1) / (tf + length_norm)
+        return scores
+
+    def search_positions(self, search_term):
+        """검색어와 일치하는 FAQ의 행 위치를 관련도 순으로 반환"""
+        query = normalize_text(search_term)
+        if not query or len(self.data) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        grams = char_ngrams(query)
+        candidates = self._candidates(grams)
+
+        # 구문 일치: 검색어가 한 필드 안에 그대로 이어서 나오는 문서만 남김
+        matched = np.array([
+            any(query in self._texts[field][doc_id] for field in self.fields)
+            for doc_id in candidates.tolist()
+        ], dtype=bool)
+        candidates = candidates[matched] if len(candidates) else candidates
+        if len(candidates) == 0:
+            return candidates
+
+        scores = self._bm25(grams, candidates)
+        order = np.lexsort((candidates, -scores))
+        return candidates[order]
+
+    def search(self, search_term):
+        """검색어와 일치하는 FAQ 행을 관련도 순으로 반환"""
+        return self.data.iloc[self.search_positions(search_term)]
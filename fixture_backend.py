@@ -0,0 +1,97 @@
+import os
+import re
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_version import DATASET_TABLES
+from scoring import calculate_value_score
+from synthetic_data import BASE_DIR, FAQ_FILES, load_car_names, make_listings
+
+USED_CAR_FILE = os.path.join(BASE_DIR, "usedcar_data.csv")  # 연도, 총거래대수
+ALL_CAR_FILE = os.path.join(BASE_DIR, "AllCarData.csv")      # 연도, 총거래량
+MERGED_FILE = os.path.join(BASE_DIR, "merged_clean.csv")    # 차종, 차량명, 연식, 주행거리, 가격
+
+CHECKSUM_PATTERN = re.compile(r"^\s*CHECKSUM\s+TABLE\s+(.+?)\s*;?\s*$", re.IGNORECASE | re.DOTALL)
+
+
+class FixtureBackend:
+    """MySQL 대신 메모리 SQLite로 앱 쿼리를 처리하는 테스트용 백엔드
+
+    db_access.set_backend(FixtureBackend())로 지정하면 read_sql/table_checksum이 이 객체를 통해 조회합니다.
+    rows를 주면 synthetic_data로 만든 가상 매물을, 없으면 merged_clean.csv를 carinfo로 적재합니다.
+    data_version 테이블과 CHECKSUM TABLE은 버전 번호로 응답하며 bump()로 데이터 변경을 흉내낼 수 있습니다.
+    """
+
+    def __init__(self, rows=None, seed=0):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self.versions = {}
+        self._load(rows, seed)
+
+    def _load(self, rows, seed):
+        names = load_car_names()
+        if rows is None:
+            listings = pd.read_csv(MERGED_FILE, encoding='utf-8-sig').merge(names, on='차종')
+        else:
+            listings = make_listings(rows, seed=seed)
+        scores = calculate_value_score(listings, listings)['value_score']
+
+        tables = {
+            'carname': pd.DataFrame({
+                'car_name': names['차종'], 'car_brand': names['브랜드'],
+                'car_type': names['차량종류'], 'newcar_price': names['신차가격'],
+            }),
+            'carinfo': pd.DataFrame({
+                'car_ID': np.arange(1, len(listings) + 1),
+                'car_name': listings['차종'].astype(str), 'full_name': listings['차량명'].astype(str),
+                'mileage': listings['주행거리'], 'model_year': listings['연식'], 'price': listings['가격'],
+                'value_score': scores.to_numpy(),
+                'sold_at': None,
+            }),
+            # MySQL처럼 나눗셈이 실수로 계산되도록 REAL로 저장
+            'usedcardata': self._transactions(USED_CAR_FILE, 'utf-8-sig'),
+            'allcardata': self._transactions(ALL_CAR_FILE, 'cp949'),
+            'car_faq': self._faq(),
+        }
+        for name, frame in tables.items():
+            frame.to_sql(name, self._conn, index=False)
+            self.versions[name] = 1
+        self._conn.execute("CREATE INDEX idx_value_score ON carinfo (value_score DESC, car_ID)")
+        pd.DataFrame({'dataset': list(DATASET_TABLES), 'version': 1}).to_sql('data_version', self._conn, index=False)
+
+    @staticmethod
+    def _transactions(path, encoding):
+        frame = pd.read_csv(path, encoding=encoding)
+        frame.columns = ['yearNum', 'total_transactions']
+        frame['total_transactions'] = frame['total_transactions'].astype('float64')
+        return frame
+
+    @staticmethod
+    def _faq():
+        faq = pd.concat([pd.read_csv(path, encoding='utf-8-sig') for path in FAQ_FILES], ignore_index=True)
+        faq.columns = [column.lower() for column in faq.columns]
+        return faq[['category', 'question', 'answer', 'site']]
+
+    def bump(self, *tables):
+        """테이블 내용이 바뀐 것처럼 버전(체크섬)과 해당 데이터셋의 data_version을 올림"""
+        tables = [table.lower() for table in tables]
+        datasets = [dataset for dataset, members in DATASET_TABLES.items() if set(members) & set(tables)]
+        with self._lock:
+            for table in tables:
+                self.versions[table] += 1
+            self._conn.executemany("UPDATE data_version SET version = version + 1 WHERE dataset = ?",
+                                   [(dataset,) for dataset in datasets])
+            self._conn.commit()
+
+    def __call__(self, query, params=None):
+        """db_access.read_sql에서 호출 (MySQL 문법의 %s 자리표시자를 SQLite 형식으로 변환)"""
+        match = CHECKSUM_PATTERN.match(query)
+        if match:
+            tables = [table.strip().lower() for table in match.group(1).split(",")]
+            with self._lock:
+                return pd.DataFrame({'Table': tables, 'Checksum': [self.versions[table] for table in tables]})
+        with self._lock:
+            return pd.read_sql(query.replace("%s", "?"), self._conn, params=params)
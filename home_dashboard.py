@@ -0,0 +1,83 @@
+import io
+import platform
+import threading
+
+from db_access import read_sql
+
+# 연도별 중고차/전체 거래량 (홈 화면 차트용)
+TRANSACTION_QUERY = """
+SELECT
+    u.yearNum,
+    u.total_transactions AS used_transactions,
+    a.total_transactions AS all_transactions,
+    ROUND(u.total_transactions / a.total_transactions * 100, 2) AS used_ratio_percent
+FROM usedcardata u
+JOIN allcardata a
+    ON u.yearNum = a.yearNum
+ORDER BY u.yearNum;
+"""
+
+CHART_DPI = 200
+
+_Figure = None
+_matplotlib_lock = threading.Lock()
+
+
+def load_transactions():
+    """거래 현황 데이터와 신차 등록 전년 대비 증감률을 계산해 반환"""
+    df_1 = read_sql(TRANSACTION_QUERY, label="home_dashboard.transactions")
+    df_1["all_transactions_yoy"] = df_1["all_transactions"].pct_change() * 100
+    df_1["all_transactions_yoy"] = df_1["all_transactions_yoy"].round(2)
+    return df_1
+
+
+def get_figure_class():
+    """matplotlib을 처음 차트를 그릴 때 불러오고 한글 폰트를 한 번만 설정해 Figure 클래스를 반환
+
+    앱 시작 시간을 줄이기 위해 모듈 최상단이 아닌 첫 렌더링 시점에 import 합니다.
+    pyplot의 전역 상태(현재 Figure/Axes)를 쓰지 않으므로 워밍업과 요청 스레드가 동시에 그려도 섞이지 않습니다.
+    """
+    global _Figure
+    if _Figure is None:
+        with _matplotlib_lock:
+            if _Figure is None:
+                import matplotlib
+                from matplotlib.figure import Figure
+
+                # Windows용 한글 폰트 설정
+                if platform.system() == 'Windows':
+                    matplotlib.rcParams['font.family'] = ['Malgun Gothic', 'Microsoft YaHei', 'SimHei', 'sans-serif']
+                    matplotlib.rcParams['axes.unicode_minus'] = False
+                else:
+                    matplotlib.rc("font", family="AppleGothic")
+                _Figure = Figure
+    return _Figure
+
+
+def render_transaction_chart(df_1):
+    """거래 현황 이중 축 차트를 PNG 바이트로 렌더링 (pyplot 없이 Figure 객체로 그림)"""
+    fig = get_figure_class()(figsize=(10, 6))
+    ax1 = fig.subplots()
+
+    # 선 그래프 (중고차 거래량)
+    ax1.plot(df_1["yearNum"], df_1["used_transactions"], marker="o", label="중고차 거래 비율", color="blue")
+    ax1.set_xlabel("Year")
+    ax1.set_ylabel("중고차 거래 비율 (%)", color="blue")
+    ax1.legend(loc="upper left")
+
+    # 막대 그래프 (all_transactions 전년 대비 증감률)
+    ax2 = ax1.twinx()
+    ax2.bar(df_1["yearNum"], df_1["all_transactions_yoy"], alpha=0.3, color="orange", label="신차 등록 증감율(%)")
+    ax2.set_ylabel("신차 등록 증감율(%)", color="orange")
+
+    # 범례 합치기
+    lines, labels = ax1.get_legend_handles_labels()
+    lines2, labels2 = ax2.get_legend_handles_labels()
+    ax1.legend(lines + lines2, labels + labels2, loc="upper right")
+
+    ax2.set_title("신차 등록 증감률 및 중고차 거래 비율 (2015-2023)")
+    ax2.grid(True)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=CHART_DPI, bbox_inches="tight")
+    return buffer.getvalue()
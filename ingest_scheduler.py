@@ -0,0 +1,94 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from db_access import POOL_SIZE
+
+# 동시에 적재하는 작업 수와 큰 테이블 하나를 나눠 쓰는 연결 수
+# (작업 INGEST_WORKERS - 1개가 연결을 하나씩 쓰는 동안 큰 테이블이 CHUNK_WRITERS개를 써도 풀 크기를 넘지 않음)
+INGEST_WORKERS = 3
+CHUNK_WRITERS = POOL_SIZE - (INGEST_WORKERS - 1)
+
+logger = logging.getLogger(__name__)
+
+
+def topological_order(names, dependencies):
+    """dependencies({이름: 선행 이름 목록})를 지키는 실행 순서, 순환이나 없는 이름이 있으면 ValueError"""
+    order = []
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError("적재 의존 관계에 순환이 있습니다: " + " -> ".join(path + [name]))
+        state[name] = 'visiting'
+        for dependency in dependencies.get(name, ()):
+            if dependency not in names:
+                raise ValueError(f"{name}의 선행 작업 {dependency}이(가) 없습니다.")
+            visit(dependency, path + [name])
+        state[name] = 'done'
+        order.append(name)
+
+    for name in names:
+        visit(name, [])
+    return order
+
+
+class IngestScheduler:
+    """의존 관계를 지키며 적재 작업을 스레드 풀에서 동시에 실행하는 객체
+
+    tasks는 {이름: 함수}, dependencies는 {이름: 먼저 끝나야 하는 작업 이름 목록}입니다.
+    선행 작업이 모두 성공한 작업부터 실행하고, 선행 작업이 실패하면 그 작업은 건너뜁니다.
+    on_done(이름, 결과)은 작업이 성공할 때마다 호출됩니다(진행 상황 출력용).
+    """
+
+    def __init__(self, tasks, dependencies=None, max_workers=INGEST_WORKERS, on_done=None):
+        self.tasks = dict(tasks)
+        self.dependencies = {name: tuple(dependencies.get(name, ())) for name in self.tasks} if dependencies else {}
+        self.order = topological_order(list(self.tasks), self.dependencies)
+        self.max_workers = max_workers
+        self.on_done = on_done
+        self.results = {}
+        self.errors = {}
+        self.skipped = []
+        self.seconds = None
+
+    def _ready(self, pending):
+        """pending 중 지금 실행할 수 있는 작업 (선행 작업이 실패/건너뜀이면 건너뜀 처리)"""
+        ready = []
+        for name in list(pending):
+            dependencies = self.dependencies.get(name, ())
+            if any(dependency in self.errors or dependency in self.skipped for dependency in dependencies):
+                logger.warning("선행 작업 실패로 %s 건너뜀", name)
+                self.skipped.append(name)
+                pending.remove(name)
+            elif all(dependency in self.results for dependency in dependencies):
+                ready.append(name)
+                pending.remove(name)
+        return ready
+
+    def run(self):
+        """모든 작업을 실행하고 {이름: 결과}를 반환 (실패한 작업은 errors, 건너뛴 작업은 skipped에 기록)"""
+        start = time.perf_counter()
+        pending = list(self.order)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ingest") as executor:
+            running = {}
+            while True:
+                for name in self._ready(pending):
+                    running[executor.submit(self.tasks[name])] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as e:
+                        logger.warning("적재 작업 %s 실패: %s", name, e)
+                        self.errors[name] = e
+                    else:
+                        if self.on_done is not None:
+                            self.on_done(name, self.results[name])
+        self.seconds = time.perf_counter() - start
+        return self.results
@@ -0,0 +1,110 @@
+from db_access import read_sql
+
+# 검색 결과 컬럼 (load_car_data와 같은 한글 별칭)
+LISTING_COLUMNS = """
+    i.car_ID,
+    c.car_brand AS 브랜드,
+    i.car_name AS 차종,
+    c.car_type AS 차량종류,
+    i.full_name AS 차량명,
+    i.model_year AS 연식,
+    i.mileage AS 주행거리,
+    i.price AS 가격,
+    c.newcar_price AS 신차가격,
+    i.value_score
+"""
+
+# 점수가 저장된(Data_input.update_value_scores 실행 후) 판매 중인 차량만 대상으로 검색
+LISTING_FROM = """
+FROM carinfo i
+JOIN carname c ON c.car_name = i.car_name
+WHERE i.price IS NOT NULL
+AND i.mileage IS NOT NULL
+AND i.value_score IS NOT NULL
+AND i.sold_at IS NULL
+"""
+
+
+def build_filter_clause(brand=None, car_type=None, min_year=None, max_year=None,
+                        min_price=None, max_price=None, min_mileage=None, max_mileage=None):
+    """filter_car_data와 같은 조건을 WHERE 절 조각과 파라미터로 변환"""
+    clauses = []
+    params = []
+
+    if brand and brand != "전체":
+        clauses.append("TRIM(c.car_brand) = %s")
+        params.append(brand.strip())
+
+    if car_type and car_type != "전체":
+        clauses.append("TRIM(c.car_type) = %s")
+        params.append(car_type.strip())
+
+    # 기존 필터와 동일하게 값이 있는(0이 아닌) 경계만 적용
+    for column, operator, value in (('i.model_year', '>=', min_year), ('i.model_year', '<=', max_year),
+                                    ('i.price', '>=', min_price), ('i.price', '<=', max_price),
+                                    ('i.mileage', '>=', min_mileage), ('i.mileage', '<=', max_mileage)):
+        if value:
+            clauses.append(f"{column} {operator} %s")
+            params.append(value)
+
+    sql = "".join(f"AND {clause}\n" for clause in clauses)
+    return sql, params
+
+
+def count_listings(**filters):
+    """조건에 맞는 전체 차량 수 ("총 N대" 표시용)"""
+    where_sql, params = build_filter_clause(**filters)
+    query = "SELECT COUNT(*) AS total\n" + LISTING_FROM + where_sql
+    result = read_sql(query, params=tuple(params), label="listing_query.count")
+    return int(result['total'].iloc[0])
+
+
+def fetch_listing_page(after=None, limit=10, **filters):
+    """가성비 점수 순으로 한 페이지를 조회 (키셋 페이지네이션)
+
+    after는 직전 페이지 마지막 행의 (value_score, car_ID)이며, None이면 첫 페이지입니다.
+    정렬(value_score DESC, car_ID)은 앱 검색과 같이 동점이면 먼저 적재된 차량이 앞에 옵니다.
+    이 순서와 같은 내림차순 인덱스 idx_value_score(value_score DESC, car_ID, MySQL 8.0 이상)가 있어야
+    filesort 없이 커서 위치부터 인덱스 순서대로 limit행만 읽습니다(없으면 조건에 맞는 행 전체를 정렬).
+    """
+    where_sql, params = build_filter_clause(**filters)
+    if after is not None:
+        last_score, last_id = after
+        # value_score <= 조건을 따로 두어 옵티마이저가 인덱스 범위 검색으로 시작 위치를 찾도록 함
+        where_sql += ("AND i.value_score <= %s\n"
+                      "AND (i.value_score < %s OR i.car_ID > %s)\n")
+        params += [last_score, last_score, last_id]
+
+    query = ("SELECT" + LISTING_COLUMNS + LISTING_FROM + where_sql
+             + "ORDER BY i.value_score DESC, i.car_ID\nLIMIT %s")
+    params.append(limit)
+    return read_sql(query, params=tuple(params), label="listing_query.page")
+
+
+def page_cursor(page):
+    """조회한 페이지의 마지막 행으로 다음 페이지 커서를 만든다"""
+    if page.empty:
+        return None
+    last_row = page.iloc[-1]
+    return float(last_row['value_score']), int(last_row['car_ID'])
+
+
+def fetch_filter_options():
+    """사이드바 선택지(브랜드-차량종류 조합, 연식/가격/주행거리 범위)를 DB에서 집계"""
+    brand_types = read_sql(
+        "SELECT DISTINCT c.car_brand AS 브랜드, c.car_type AS 차량종류\n" + LISTING_FROM,
+        label="listing_query.brand_types"
+    )
+    ranges = read_sql(
+        """SELECT MIN(i.model_year) AS min_year, MAX(i.model_year) AS max_year,
+                  MIN(i.price) AS min_price, MAX(i.price) AS max_price,
+                  MIN(i.mileage) AS min_mileage, MAX(i.mileage) AS max_mileage
+        """ + LISTING_FROM,
+        label="listing_query.ranges"
+    ).iloc[0]
+    value_ranges = {
+        '연식': (int(ranges['min_year']), int(ranges['max_year'])),
+        '가격': (int(ranges['min_price']), int(ranges['max_price'])),
+        '주행거리': (int(ranges['min_mileage']), int(ranges['max_mileage'])),
+    }
+    return brand_types, value_ranges
@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+# 범위 검색용 컬럼 (정렬 인덱스 + 이진 탐색)
+RANGE_COLUMNS = ['연식', '가격', '주행거리']
+# 코드 검색용 컬럼 (공백 제거 후 값별 행 위치)
+CODE_COLUMNS = ['브랜드', '차량종류']
+
+
+class ListingStore:
+    """차량 데이터를 한 번 색인해 두고 필터 조건에 맞는 행 위치를 돌려주는 저장소
+
+    원본 데이터프레임은 복사하지 않으며, 결과는 원본 순서를 유지한 행 위치(정수 배열)입니다.
+    """
+
+    def __init__(self, data):
+        self.size = len(data)
+
+        # 연식/가격/주행거리: 결측치를 제외한 값을 정렬해 두고 위치를 함께 보관
+        self._sorted_values = {}
+        self._sorted_positions = {}
+        for column in RANGE_COLUMNS:
+            if column not in data.columns:
+                continue
+            values = pd.to_numeric(data[column], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            valid = np.flatnonzero(~np.isnan(values))
+            order = valid[np.argsort(values[valid], kind='stable')]
+            self._sorted_values[column] = values[order]
+            self._sorted_positions[column] = order
+
+        # 브랜드/차량종류: 공백을 한 번만 제거하고 값별 행 위치를 미리 계산
+        self._code_positions = {}
+        for column in CODE_COLUMNS:
+            if column not in data.columns:
+                continue
+            codes, uniques = pd.factorize(data[column].astype(object).str.strip())
+            order = np.argsort(codes, kind='stable')
+            boundaries = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            self._code_positions[column] = {
+                value: order[boundaries[code]:boundaries[code + 1]]
+                for code, value in enumerate(uniques)
+            }
+
+    def positions_for(self, column, value):
+        """코드 컬럼에서 값이 일치하는 행 위치를 반환"""
+        positions = self._code_positions[column].get(value.strip())
+        if positions is None:
+            return np.empty(0, dtype=np.intp)
+        return positions
+
+    def range_positions(self, column, low=None, high=None):
+        """범위 컬럼에서 low 이상 high 이하인 행 위치를 오름차순으로 반환"""
+        values = self._sorted_values[column]
+        start = np.searchsorted(values, low, side='left') if low is not None else 0
+        end = np.searchsorted(values, high, side='right') if high is not None else len(values)
+        return np.sort(self._sorted_positions[column][start:end])
+
+    def filter_positions(self, brand=None, car_type=None, min_year=None, max_year=None,
+                         min_price=None, max_price=None, min_mileage=None, max_mileage=None):
+        """filter_car_data와 같은 조건으로 일치하는 행 위치를 반환"""
+        candidates = []
+
+        if brand and brand != "전체":
+            candidates.append(self.positions_for('브랜드', brand))
+
+        if car_type and car_type != "전체":
+            candidates.append(self.positions_for('차량종류', car_type))
+
+        # 기존 함수와 동일하게 값이 있는(0이 아닌) 경계만 적용
+        for column, low, high in (('연식', min_year, max_year),
+                                  ('가격', min_price, max_price),
+                                  ('주행거리', min_mileage, max_mileage)):
+            low = low if low else None
+            high = high if high else None
+            if low is not None or high is not None:
+                candidates.append(self.range_positions(column, low, high))
+
+        if not candidates:
+            return np.arange(self.size)
+
+        # 가장 작은 후보부터 교집합을 구해 중간 결과를 최소화
+        candidates.sort(key=len)
+        positions = candidates[0]
+        for other in candidates[1:]:
+            if len(positions) == 0:
+                break
+            positions = np.intersect1d(positions, other, assume_unique=True)
+        return np.sort(positions)
@@ -0,0 +1,258 @@
+"""동시 접속 부하 측정 스크립트 (Streamlit AppTest, DB 불필요)
+
+N개 세션이 동시에 홈 → 차량 검색(검색 실행, 페이지 넘김, 분석 실행) → FAQ 검색을
+반복하며, 단계별 rerun 지연 시간(p50/p95/p99)과 세션당 메모리를 보고합니다.
+MySQL 대신 fixture_backend.FixtureBackend(메모리 SQLite)로 조회합니다.
+
+AppTest는 실행 중에 프로세스 전역 Runtime을 바꾸므로 한 프로세스에서 동시에 여러 개를 돌릴 수 없습니다.
+그래서 세션마다 별도 프로세스(작업자)에서 실행하며, 작업자는 먼저 세션 하나로 캐시를 채운 뒤(콜드 스타트)
+모든 작업자가 준비되면 동시에 측정을 시작합니다. 작업자마다 캐시가 따로이므로 서버 한 대가 아니라
+같은 데이터를 가진 서버 N대에 한 세션씩 붙은 상황에 가깝습니다.
+스크립트 스레드에서 난 예외(at.exception에 나오지 않는 것 포함)도 해당 단계의 오류로 셉니다.
+
+    python load_test.py --sessions 8                # merged_clean.csv 데이터로 8개 세션 동시 실행
+    python load_test.py --sessions 16 --rows 200000 # 가상 매물 20만 건으로 실행
+    python load_test.py --server-side               # SERVER_SIDE_SEARCH 모드로 실행
+"""
+import argparse
+import logging
+import multiprocessing
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+
+import db_access
+import snapshot
+from fixture_backend import FixtureBackend
+from result_cache import estimate_nbytes
+
+BRANDS = ["현대", "기아", "제네시스", "쉐보레(GM대우)", "르노코리아(삼성)", "KG모빌리티(쌍용)"]
+FAQ_TERMS = ["보증", "할부", "명의변경", "내차팔기", "환불", "탁송"]
+RUN_TIMEOUT = 300  # AppTest 한 번의 rerun 최대 대기 시간(초)
+
+
+def app_script(server_side):
+    """AppTest가 세션마다 실행하는 스크립트 (streamlit run app.py와 같은 동작)"""
+    import app
+    app.SERVER_SIDE_SEARCH = server_side
+    app.main()
+
+
+def click(at, label):
+    """label이 같은 버튼을 눌러 rerun"""
+    button = next(button for button in at.button if button.label == label)
+    return button.click().run()
+
+
+def session_steps(session_id):
+    """세션 하나가 실행하는 (단계 이름, 동작) 목록 (세션마다 브랜드/검색어를 다르게 선택)"""
+    rng = random.Random(session_id)
+    brand = rng.choice(BRANDS)
+    term = rng.choice(FAQ_TERMS)
+    return [
+        ("홈", lambda at: at.run()),
+        ("차량 검색", lambda at: at.sidebar.radio[0].set_value("차량 검색").run()),
+        ("브랜드 선택", lambda at: at.sidebar.selectbox[0].set_value(brand).run()),
+        ("검색 실행", lambda at: click(at, "검색 실행")),
+        ("다음 페이지", lambda at: click(at, "다음 페이지")),
+        ("분석 실행", lambda at: click(at, "분석 실행")),
+        ("FAQ", lambda at: at.sidebar.radio[0].set_value("FAQ").run()),
+        ("FAQ 검색", lambda at: at.text_input[0].input(term).run()),
+    ]
+
+
+class ScriptErrors:
+    """AppTest 스크립트 스레드에서 처리되지 않은 예외와 streamlit 오류 로그를 모으는 객체
+
+    Runtime 오류처럼 at.exception에 나타나지 않는 예외도 단계 오류로 세기 위해 사용합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.errors = []
+
+    def install(self):
+        previous_hook = threading.excepthook
+
+        def hook(args):
+            self.add(f"{args.thread.name if args.thread else 'thread'}: {args.exc_type.__name__}: {args.exc_value}")
+            previous_hook(args)
+
+        threading.excepthook = hook
+        self._handler = logging.Handler(level=logging.ERROR)
+        self._handler.emit = lambda record: self.add(f"{record.name}: {record.getMessage()}")
+        self.attach_loggers()
+
+    def attach_loggers(self):
+        """streamlit 로거는 상위로 전파하지 않으므로(propagate=False) 새로 생긴 streamlit.* 로거마다 직접 연결"""
+        for name in list(logging.root.manager.loggerDict):
+            logger = logging.getLogger(name)
+            if name.split(".")[0] == "streamlit" and self._handler not in logger.handlers:
+                logger.addHandler(self._handler)
+
+    def add(self, message):
+        with self._lock:
+            self.errors.append(message)
+
+    def since(self, count):
+        with self._lock:
+            return self.errors[count:]
+
+    def __len__(self):
+        with self._lock:
+            return len(self.errors)
+
+
+def session_state_bytes(at):
+    """세션 상태가 들고 있는 객체의 대략적인 크기 (공유 캐시 객체도 포함)"""
+    return sum(estimate_nbytes(value) for value in at.session_state.values())
+
+
+def run_session(session_id, server_side, script_errors):
+    """세션 하나를 끝까지 실행하고 단계별 지연 시간 기록과 세션 상태 크기를 반환 (한 프로세스에서 한 번에 하나만)"""
+    at = AppTest.from_function(app_script, args=(server_side,), default_timeout=RUN_TIMEOUT)
+
+    records = []
+    for step, action in session_steps(session_id):
+        script_errors.attach_loggers()
+        error_count = len(script_errors)
+        start = time.perf_counter()
+        error = None
+        try:
+            action(at)
+            if at.exception:
+                error = at.exception[0].value
+        except Exception as e:
+            error = repr(e)
+        thread_errors = script_errors.since(error_count)
+        if error is None and thread_errors:
+            error = thread_errors[0]
+        records.append({'session': session_id, 'step': step,
+                        'seconds': time.perf_counter() - start, 'error': error})
+        if error is not None:
+            break
+    return records, session_state_bytes(at)
+
+
+def current_rss():
+    """현재 프로세스의 RSS(바이트, Linux /proc 기준, 다른 OS는 None)"""
+    try:
+        with open("/proc/self/statm") as file:
+            pages = int(file.read().split()[1])
+    except OSError:
+        return None
+    import resource
+    return pages * resource.getpagesize()
+
+
+def run_worker(worker_id, sessions, rounds, rows, server_side, snapshot_dir, start_barrier):
+    """작업자 프로세스 하나: 캐시를 채우는 콜드 세션을 실행하고, 모든 작업자가 준비되면 rounds개 세션을 차례로 실행
+
+    (콜드 세션 기록, 측정 세션 기록, 세션 상태 크기 목록, RSS {시작, 콜드 후, 종료})를 반환합니다.
+    """
+    # AppTest 실행마다 나오는 경고 로그 생략 (오류 로그는 ScriptErrors가 수집)
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    script_errors = ScriptErrors()
+    script_errors.install()
+
+    rss = {'start': current_rss()}
+    db_access.set_backend(FixtureBackend(rows=rows))
+    # 측정용 데이터가 실제 스냅샷을 덮어쓰지 않도록 임시 폴더 사용
+    snapshot.SNAPSHOT_DIR = snapshot_dir
+
+    # 첫 세션은 데이터 로드와 색인 생성을 포함하므로 따로 측정 (콜드 스타트)
+    cold_records, _ = run_session(-(worker_id + 1), server_side, script_errors)
+    rss['warm'] = current_rss()
+    start_barrier.wait()
+
+    records = []
+    state_sizes = []
+    for round_number in range(rounds):
+        session_records, state_bytes = run_session(round_number * sessions + worker_id + 1, server_side,
+                                                   script_errors)
+        records.extend(session_records)
+        state_sizes.append(state_bytes)
+    rss['end'] = current_rss()
+    return cold_records, records, state_sizes, rss
+
+
+def latency_report(records):
+    """단계별/전체 rerun 지연 시간 p50/p95/p99 (ms)"""
+    frame = pd.DataFrame(records)
+    frame = frame[frame['error'].isna()]
+
+    def percentiles(seconds):
+        values = np.percentile(seconds.to_numpy() * 1000, [50, 95, 99])
+        return pd.Series({'count': len(seconds), 'p50_ms': values[0], 'p95_ms': values[1], 'p99_ms': values[2]})
+
+    by_step = frame.groupby('step', sort=False)['seconds'].apply(percentiles).unstack()
+    by_step.loc['전체'] = percentiles(frame['seconds'])
+    by_step['count'] = by_step['count'].astype(int)
+    return by_step.round(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit 동시 세션 부하 측정")
+    parser.add_argument("--sessions", type=int, default=8, help="동시에 실행할 세션 수")
+    parser.add_argument("--rounds", type=int, default=1, help="세션 묶음을 반복 실행할 횟수")
+    parser.add_argument("--rows", type=int, default=None, help="가상 매물 수 (없으면 merged_clean.csv 사용)")
+    parser.add_argument("--server-side", action="store_true", help="SERVER_SIDE_SEARCH 모드로 실행")
+    args = parser.parse_args()
+
+    print(f"작업자 프로세스 {args.sessions}개 준비 중 (fixture backend 생성, 콜드 스타트 세션)...")
+    snapshot_dir = tempfile.mkdtemp(prefix="load_test_snapshots_")
+    with multiprocessing.Manager() as manager:
+        barrier = manager.Barrier(args.sessions + 1)
+        with ProcessPoolExecutor(max_workers=args.sessions) as executor:
+            futures = [executor.submit(run_worker, worker_id, args.sessions, args.rounds, args.rows,
+                                       args.server_side, snapshot_dir, barrier)
+                       for worker_id in range(args.sessions)]
+            # 모든 작업자의 콜드 세션이 끝난 뒤부터 측정 (작업자가 실패하면 기다리지 않음)
+            while barrier.n_waiting < args.sessions and not any(future.done() for future in futures):
+                time.sleep(0.1)
+            if any(future.done() for future in futures):
+                barrier.abort()
+            else:
+                barrier.wait()
+            wall_start = time.perf_counter()
+            results = [future.result() for future in futures]
+        wall_seconds = time.perf_counter() - wall_start
+
+    cold_records = [record for result in results for record in result[0]]
+    records = [record for result in results for record in result[1]]
+    state_sizes = [size for result in results for size in result[2]]
+    rss = [result[3] for result in results]
+    cold_seconds = [sum(record['seconds'] for record in result[0]) for result in results]
+    print(f"cold start 세션: 평균 {np.mean(cold_seconds):.2f}s, 최대 {np.max(cold_seconds):.2f}s")
+
+    errors = [record for record in cold_records + records if record['error'] is not None]
+    print(f"\n동시 세션 {args.sessions}개 × {args.rounds}회, 모드: "
+          f"{'server-side' if args.server_side else 'in-memory'}, 매물: {args.rows or 'merged_clean.csv'}")
+    print(f"전체 소요 {wall_seconds:.2f}s, 처리량 {len(records) / wall_seconds:.1f} reruns/s")
+    print("\nrerun 지연 시간")
+    print(latency_report(records).to_string())
+
+    print("\n메모리 (작업자 프로세스 평균)")
+    if state_sizes:
+        print(f"  세션 상태 평균 {np.mean(state_sizes) / 1024:.1f} KB, 최대 {np.max(state_sizes) / 1024:.1f} KB")
+    if rss[0]['start'] is not None:
+        def mean_mb(key):
+            return np.mean([values[key] for values in rss]) / 1024 ** 2
+        print(f"  RSS: 시작 {mean_mb('start'):.1f} MB, 콜드 세션 후 {mean_mb('warm'):.1f} MB, "
+              f"종료 {mean_mb('end'):.1f} MB")
+        print(f"  세션당 RSS 증가 {(mean_mb('end') - mean_mb('warm')) * 1024 / args.rounds:.1f} KB")
+
+    if errors:
+        print(f"\n오류 {len(errors)}건")
+        for record in errors[:5]:
+            print(f"  세션 {record['session']} {record['step']}: {record['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import re
+
+import pandas as pd
+
+# 차종 앞에 붙어 쓰이는 세대 표기 ("뉴SM5", "올뉴모닝", "더뉴그랜저")
+NEW_PREFIX = "(?:올|더)?뉴?"
+
+
+def trie_pattern(words):
+    """words를 공통 접두사끼리 묶은 트라이 형태의 정규식 (같은 위치에서는 가장 긴 단어가 먼저 일치)
+
+    예: ['G70', 'G80', 'GV70'] -> G(?:70|80|V70)
+    한 위치에서 비교하는 횟수가 단어 수가 아니라 트라이 깊이에 비례하므로 단어가 많아져도 느려지지 않습니다.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # 여기서 끝나는 단어도 있으면 더 긴 단어를 먼저 시도하고(탐욕적 ?), 실패하면 여기서 끝냄
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class ModelMatcher:
+    """차량명에서 차종(car_name.csv)을 찾는 다중 패턴 매처
+
+    모든 차종 이름을 트라이 형태의 정규식 하나로 컴파일해 차량명마다 한 번만 검색합니다.
+    - 단어 시작(맨 앞 또는 공백 뒤, "뉴/올뉴/더뉴" 접두어 허용)에서 시작하는 차종만 인정합니다.
+      ("인스퍼레이션"의 "레이", "트레일블레이저"의 "레이"는 차종이 아님)
+    - 가장 왼쪽에서 일치하는 차종, 같은 위치에서는 가장 긴 차종을 고릅니다.
+    - 차량명 맨 앞의 브랜드는 건너뜁니다("제네시스 G80"은 G80). 브랜드 뒤에 차종이 없으면 브랜드명도 차종으로 봅니다.
+    """
+
+    def __init__(self, models, brands=()):
+        self.models = sorted({str(model).strip() for model in models if str(model).strip()})
+        self.pattern = re.compile(r"(?:^|(?<=\s))" + NEW_PREFIX + "(" + trie_pattern(self.models) + ")")
+        brands = sorted({str(brand).strip() for brand in brands if str(brand).strip()}, key=len, reverse=True)
+        self.brand_prefix = re.compile(r"^(?:" + "|".join(map(re.escape, brands)) + r")\s+") if brands else None
+
+    @classmethod
+    def from_car_names(cls, car_name_df):
+        """car_name.csv(브랜드, 차종, ...) 데이터프레임으로 매처 생성"""
+        return cls(car_name_df['차종'], car_name_df['브랜드'])
+
+    def match(self, name):
+        """차량명 하나의 차종 (없으면 None)"""
+        if not isinstance(name, str):
+            return None
+        if self.brand_prefix is not None:
+            found = self.pattern.search(self.brand_prefix.sub("", name, count=1))
+            if found:
+                return found.group(1)
+        found = self.pattern.search(name)
+        return found.group(1) if found else None
+
+    def tag(self, names):
+        """차량명 Series의 차종 Series (찾지 못했거나 차량명이 없으면 NaN, match와 같은 결과)"""
+        text = pd.Series(names, dtype=object)
+        if self.brand_prefix is None:
+            return text.str.extract(self.pattern, expand=False)
+        tagged = text.str.replace(self.brand_prefix, "", n=1, regex=True).str.extract(self.pattern, expand=False)
+        missing = tagged.isna() & text.notna()
+        if missing.any():
+            tagged[missing] = text[missing].str.extract(self.pattern, expand=False)
+        return tagged
@@ -0,0 +1,120 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 기본 메모리 예산 64MB
+
+
+def normalize_filter_key(kind, brand=None, car_type=None, min_year=None, max_year=None,
+                         min_price=None, max_price=None, min_mileage=None, max_mileage=None,
+                         metric=None, group_by=None, profile=None, segment=None):
+    """필터 조건을 캐시 키(튜플)로 정규화
+
+    filter_car_data와 같은 의미가 되도록 "전체"/빈 값은 None, 0인 경계도 None으로 맞춥니다.
+    """
+    def _label(value):
+        value = value.strip() if value else None
+        return None if value in (None, "", "전체") else value
+
+    def _bound(value):
+        return int(value) if value else None
+
+    return (
+        kind,
+        _label(brand),
+        _label(car_type),
+        (_bound(min_year), _bound(max_year)),
+        (_bound(min_price), _bound(max_price)),
+        (_bound(min_mileage), _bound(max_mileage)),
+        metric,
+        group_by,
+        profile,
+        segment,
+    )
+
+
+def estimate_nbytes(value):
+    """캐시 값의 대략적인 메모리 크기(바이트)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value)
+    return 64
+
+
+class ResultCache:
+    """필터 조합별 결과를 모든 세션이 공유하는 LRU 캐시 (메모리 예산 기준 제거)
+
+    검색 결과는 데이터프레임 복사본 대신 원본 데이터의 행 위치 배열로 저장합니다.
+    저장된 값은 여러 세션이 함께 보므로 수정하지 않고 읽기만 해야 합니다.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """키에 해당하는 값을 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        """값을 저장하고 예산을 넘으면 오래 사용하지 않은 항목부터 제거"""
+        nbytes = estimate_nbytes(value)
+        for array in (value if isinstance(value, tuple) else (value,)):
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+            if nbytes > self.max_bytes:
+                return value
+            self._entries[key] = (value, nbytes)
+            self.current_bytes += nbytes
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+        return value
+
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 그대로, 없으면 compute()로 계산해 저장 후 반환"""
+        value = self.get(key)
+        if value is None:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        """모든 항목 삭제 (데이터를 다시 로드했을 때 사용)"""
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        """적중/실패 횟수와 메모리 사용량"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+
+from topk import RankedResult
+
+# 가성비 점수 계산에 필요한 컬럼
+REQUIRED_COLUMNS = ['신차가격', '가격', '연식', '주행거리', '차종']
+
+# 성분 점수 (점수 행렬의 열 순서)
+SCORE_COMPONENTS = ['price_score', 'age_score', 'mileage_score', 'popularity_score']
+
+# 점수 정규화 범위 (None이면 전체 데이터, 아니면 해당 컬럼 값이 같은 차량끼리 비교)
+SEGMENT_COLUMNS = ['차량종류', '차종']
+
+# 가성비 기준별 성분 가중치 (가격, 연식, 주행거리, 인기도) - 합계 1
+DEFAULT_PROFILE = '기본'
+SCORE_PROFILES = {
+    '기본': (0.40, 0.25, 0.25, 0.10),
+    '가격 중시': (0.60, 0.15, 0.15, 0.10),
+    '신차급 중시': (0.15, 0.40, 0.35, 0.10),
+    '인기 차종 중시': (0.30, 0.20, 0.20, 0.30),
+}
+
+
+def _numeric(series):
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+
+
+def _factorize_rows(df, full_data, column):
+    """full_data[column]의 값 목록과 df 각 행의 값 번호 (없는 값은 -1)
+
+    category형은 내부 코드를 그대로 쓰므로 문자열 비교 없이 계산됩니다.
+    """
+    codes, uniques = pd.factorize(full_data[column])
+    if df is full_data:
+        return codes, codes, uniques
+    return codes, uniques.get_indexer(df[column]), uniques
+
+
+def segment_stats(full_data, segment):
+    """segment 값 목록과 segment별 연식/주행거리/인기도 최소·최대값 (groupby 한 번)"""
+    codes, segments = pd.factorize(full_data[segment])
+    frame = pd.DataFrame({
+        'year': _numeric(full_data['연식']),
+        'mileage': _numeric(full_data['주행거리']),
+        'popularity': _popularity(full_data, full_data),
+    })
+    stats = frame[codes >= 0].groupby(codes[codes >= 0])[['year', 'mileage', 'popularity']].agg(['min', 'max'])
+    return segments, stats.reindex(range(len(segments)))
+
+
+def _popularity(df, full_data):
+    """df 각 행 차종의 full_data 등록 대수 (float, 없는 차종은 NaN)"""
+    model_codes, rows, models = _factorize_rows(df, full_data, '차종')
+    counts = np.bincount(model_codes[model_codes >= 0], minlength=len(models)).astype('float64')
+    return np.where(rows >= 0, counts[rows], np.nan)
+
+
+def _segment_components(df, full_data, segment, components):
+    """연식/주행거리/인기도 점수를 segment 안의 최소/최대값 기준으로 채움
+
+    segment 안의 값이 모두 같으면(범위 0) 전체 기준과 마찬가지로 1.0, 통계에 없는 segment는 NaN입니다.
+    """
+    segments, stats = segment_stats(full_data, segment)
+    rows = pd.factorize(df[segment])[0] if df is full_data else segments.get_indexer(df[segment])
+    found = rows >= 0
+
+    values = {
+        'year': _numeric(df['연식']),
+        'mileage': _numeric(df['주행거리']),
+        'popularity': _popularity(df, full_data),
+    }
+    for column, (name, higher_is_better) in zip((1, 2, 3), (('year', True), ('mileage', False), ('popularity', True))):
+        low = np.where(found, stats[(name, 'min')].to_numpy()[rows], np.nan)
+        high = np.where(found, stats[(name, 'max')].to_numpy()[rows], np.nan)
+        spread = high - low
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scaled = (values[name] - low) / spread
+        score = scaled if higher_is_better else 1 - scaled
+        components[:, column] = np.where(spread > 0, score, np.where(found, 1.0, np.nan))
+
+
+def _price_score(df):
+    """신차 대비 중고차 가격 비율 점수 (가격이 낮을수록 좋음)"""
+    price_ratio = _numeric(df['가격']) / _numeric(df['신차가격'])
+    return 1 - np.clip(price_ratio, 0, 1)
+
+
+def _component_columns(df, full_data):
+    """전체 데이터 기준 성분 점수를 SCORE_COMPONENTS 순서로 한 열씩 반환 (범위가 0인 성분은 1.0)
+
+    calculate_value_score는 열을 바로 데이터프레임에 넣으므로 (행 수 × 4) 행렬을 따로 만들지 않습니다.
+    """
+    # 1. 신차 대비 중고차 가격 비율 점수 (가격이 낮을수록 좋음)
+    yield _price_score(df)
+
+    # 2. 차량 연령 점수 (최신 연식일수록 좋음) - 전체 데이터 기준
+    min_year = full_data['연식'].min()
+    max_year = full_data['연식'].max()
+    year_range = max_year - min_year
+    if year_range > 0:
+        yield (_numeric(df['연식']) - min_year) / year_range
+    else:
+        yield 1.0
+
+    # 3. 주행거리 점수 (적을수록 좋음) - 전체 데이터 기준
+    min_mileage = full_data['주행거리'].min()
+    max_mileage = full_data['주행거리'].max()
+    mileage_range = max_mileage - min_mileage
+    if mileage_range > 0:
+        yield 1 - ((_numeric(df['주행거리']) - min_mileage) / mileage_range)
+    else:
+        yield 1.0
+
+    # 4. 차종별 인기도 점수 (같은 차종 등록 대수가 많을수록 좋음) - 전체 데이터 기준
+    car_popularity = full_data['차종'].value_counts()
+    car_popularity = car_popularity[car_popularity > 0]  # category형의 미사용 범주 제외
+    min_popularity = car_popularity.min()
+    max_popularity = car_popularity.max()
+    popularity_range = max_popularity - min_popularity
+    if popularity_range > 0:
+        popularity = df['차종'].map(car_popularity).to_numpy(dtype='float64', na_value=np.nan)
+        yield (popularity - min_popularity) / popularity_range
+    else:
+        yield 1.0
+
+
+def score_components(df, full_data, segment=None):
+    """가격/연식/주행거리/인기도 성분 점수를 (행 수 × 4) 행렬로 계산
+
+    연식, 주행거리, 인기도는 full_data의 최소/최대값 기준으로 0~1로 정규화합니다.
+    segment(차량종류/차종)를 주면 같은 segment 차량끼리의 최소/최대값 기준으로 정규화합니다.
+    """
+    components = np.empty((len(df), len(SCORE_COMPONENTS)), dtype='float64')
+    if segment is not None:
+        components[:, 0] = _price_score(df)
+        _segment_components(df, full_data, segment, components)
+        return components
+
+    for column, values in enumerate(_component_columns(df, full_data)):
+        components[:, column] = values
+    return components
+
+
+def calculate_value_score(df, full_data):
+    """차량의 가성비 점수를 계산하는 함수"""
+    df_copy = df.copy()
+
+    # 필요한 컬럼이 있는지 확인
+    if not all(col in df_copy.columns for col in REQUIRED_COLUMNS):
+        return df_copy
+
+    # 성분 점수를 한 열씩 계산해 바로 넣음 (행렬을 만들지 않아 메모리 사용량이 늘지 않음)
+    for name, values in zip(SCORE_COMPONENTS, _component_columns(df_copy, full_data)):
+        df_copy[name] = values
+
+    # 전체 가성비 점수 계산 (기본 가중치의 가중평균)
+    price_weight, age_weight, mileage_weight, popularity_weight = SCORE_PROFILES[DEFAULT_PROFILE]
+    df_copy['value_score'] = (
+        df_copy['price_score'] * price_weight +        # 가격 점수 (40%)
+        df_copy['age_score'] * age_weight +            # 연식 점수 (25%)
+        df_copy['mileage_score'] * mileage_weight +    # 주행거리 점수 (25%)
+        df_copy['popularity_score'] * popularity_weight  # 인기도 점수 (10%)
+    ) * 100  # 100점 만점으로 변환
+
+    return df_copy
+
+
+def with_value_score(df, full_data):
+    """저장된 가성비 점수가 모두 있으면 그대로 쓰고, 없으면 새로 계산하는 함수"""
+    if 'value_score' in df.columns and df['value_score'].notna().all():
+        return df
+    return calculate_value_score(df, full_data)
+
+
+class ProfileScores:
+    """여러 가성비 기준의 점수를 한 번의 행렬 곱으로 계산해 두는 객체
+
+    성분 점수 행렬(행 수 × 4)을 한 번 만들고 가중치 행렬(기준 수 × 4)을 곱해
+    모든 기준의 점수(행 수 × 기준 수)를 구하므로, 기준을 바꿀 때는 열만 골라 씁니다.
+    segment를 주면 성분 점수를 segment(차량종류/차종) 안에서 정규화합니다.
+    """
+
+    def __init__(self, data, profiles=None, segment=None):
+        profiles = profiles or SCORE_PROFILES
+        self.segment = segment
+        self.names = list(profiles)
+        self.weights = np.array([profiles[name] for name in self.names], dtype='float64')
+        self.components = score_components(data, data, segment)
+        self.scores = self.components @ self.weights.T * 100
+
+    def __len__(self):
+        return len(self.scores)
+
+    @property
+    def nbytes(self):
+        return self.components.nbytes + self.scores.nbytes
+
+    def column(self, profile):
+        """profile 기준의 전체 행 점수"""
+        return self.scores[:, self.names.index(profile)]
+
+    def rankings(self):
+        """기준별 전체 순위 객체 (RankedResult는 요청한 순위까지만 정렬)"""
+        positions = np.arange(len(self.scores))
+        return {name: RankedResult(positions, self.scores[:, column]) for column, name in enumerate(self.names)}
@@ -0,0 +1,149 @@
+import json
+import logging
+import os
+import time
+
+from car_schema import optimize_car_dtypes
+from data_version import fetch_versions
+from db_access import read_sql
+
+# 스냅샷 저장 위치 (Arrow IPC 파일 + 버전 정보 JSON)
+SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snapshots")
+
+# 앱 차량 데이터 조회 쿼리 (load_car_data와 스냅샷 내보내기 공용)
+CAR_DATA_QUERY = """
+SELECT i.car_ID,
+       c.car_brand AS 브랜드,
+       i.car_name AS 차종,
+       c.car_type AS 차량종류,
+       i.full_name AS 차량명,
+       i.model_year AS 연식,
+       i.mileage AS 주행거리,
+       i.price AS 가격,
+       c.newcar_price AS 신차가격,
+       i.value_score
+FROM carname c
+JOIN carinfo i ON c.car_name = i.car_name
+WHERE i.price IS NOT NULL
+AND i.mileage IS NOT NULL
+AND i.sold_at IS NULL
+"""
+
+# 스냅샷 이름 -> (조회 쿼리, 버전을 따르는 데이터셋(data_version), 저장 전 변환 함수)
+DATASETS = {
+    'car_data': (CAR_DATA_QUERY, 'listings', optimize_car_dtypes),
+    'usedcardata': ("SELECT * FROM usedcardata", 'transactions', None),
+    'allcardata': ("SELECT * FROM allcardata", 'transactions', None),
+    'car_faq': ("SELECT category, question, answer FROM car_faq", 'faq', None),
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _paths(name):
+    base = os.path.join(SNAPSHOT_DIR, name)
+    return base + ".arrow", base + ".json"
+
+
+def save_snapshot(name, df, version):
+    """데이터프레임을 Arrow IPC 파일로 저장 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽과 충돌 없음)"""
+    import pyarrow as pa
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    data_path, meta_path = _paths(name)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    temp_path = f"{data_path}.{os.getpid()}.tmp"
+    with pa.OSFile(temp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(temp_path, data_path)
+
+    meta = {'version': version,
+            'rows': len(df),
+            'exported_at': time.strftime("%Y-%m-%d %H:%M:%S")}
+    temp_meta = f"{meta_path}.{os.getpid()}.tmp"
+    with open(temp_meta, "w", encoding="utf-8") as file:
+        json.dump(meta, file)
+    os.replace(temp_meta, meta_path)
+
+
+def snapshot_version(name):
+    """저장된 스냅샷의 데이터 버전 (없으면 None)"""
+    _, meta_path = _paths(name)
+    try:
+        with open(meta_path, encoding="utf-8") as file:
+            return json.load(file).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def load_snapshot(name, current_version=None):
+    """스냅샷을 메모리 맵으로 읽어 반환 (없거나 버전이 다르거나 pyarrow가 없으면 None)
+
+    current_version을 주면 스냅샷의 버전과 비교해 다를 때 None을 반환합니다.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    data_path, _ = _paths(name)
+    if not os.path.exists(data_path):
+        return None
+    if current_version is not None and snapshot_version(name) != current_version:
+        return None
+
+    with pa.memory_map(data_path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas()
+
+
+def read_dataset(name, version=None):
+    """스냅샷이 최신이면 스냅샷에서, 아니면 MySQL에서 읽고 스냅샷을 갱신해 반환
+
+    version은 앱이 확인한 데이터셋 버전이며, 없으면 data_version에서 직접 확인합니다.
+    """
+    query, dataset, prepare = DATASETS[name]
+    if version is None:
+        try:
+            version = fetch_versions()[dataset]
+        except Exception as e:
+            # DB 버전 확인이 안 되면 가지고 있는 스냅샷이라도 사용
+            logger.warning("%s 버전 확인 실패, 스냅샷 사용: %s", name, e)
+            snapshot = load_snapshot(name)
+            if snapshot is not None:
+                return snapshot
+
+    if version is not None:
+        snapshot = load_snapshot(name, version)
+        if snapshot is not None:
+            return snapshot
+
+    df = read_sql(query, label=f"snapshot.{name}")
+    if prepare is not None:
+        df = prepare(df)
+    if version is not None:
+        try:
+            save_snapshot(name, df, version)
+        except Exception as e:
+            logger.warning("%s 스냅샷 저장 실패: %s", name, e)
+    return df
+
+
+def export_snapshots():
+    """적재 후 모든 데이터셋을 스냅샷으로 내보내기 (Data_input에서 호출)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("pyarrow가 없어 스냅샷을 만들지 않습니다. (앱은 MySQL에서 직접 로드)")
+        return
+    # 버전을 먼저 읽어 두면 내보내는 중 데이터가 바뀌어도 다음 확인 때 다시 로드됨
+    versions = fetch_versions()
+    for name, (query, dataset, prepare) in DATASETS.items():
+        version = versions[dataset]
+        df = read_sql(query, label=f"snapshot.{name}")
+        if prepare is not None:
+            df = prepare(df)
+        save_snapshot(name, df, version)
+        print(f"{name} snapshot exported ({len(df)} rows).")
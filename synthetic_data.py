@@ -0,0 +1,95 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from car_schema import INTEGER_COLUMNS, downcast_integer
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CAR_NAME_FILE = os.path.join(BASE_DIR, "car_name.csv")  # 브랜드, 차종, 차량종류, 신차가격
+FAQ_FILES = [os.path.join(BASE_DIR, "FAQ", "kia_faq.csv"), os.path.join(BASE_DIR, "FAQ", "hyundai_faq.csv")]
+
+LATEST_YEAR = 25   # 연식은 두 자리 연도 (merged_clean.csv 기준 08~25)
+MAX_AGE = 17
+
+# 차량명 조합용 엔진/트림 (실제 매물 이름처럼 "브랜드 차종 엔진 트림")
+ENGINES = ['1.6 가솔린', '2.0 가솔린', '2.5 가솔린', '1.6 터보', '2.2 디젤', '하이브리드', 'LPi', '전기']
+TRIMS = ['스마트', '모던', '프리미엄', '인스퍼레이션', '노블레스', '시그니처', '프레스티지', '익스클루시브']
+
+
+def load_car_names():
+    """car_name.csv의 차종 목록 (브랜드, 차종, 차량종류, 신차가격, 문자열 공백 제거)"""
+    names = pd.read_csv(CAR_NAME_FILE, encoding='cp949')
+    for column in ['브랜드', '차종', '차량종류']:
+        names[column] = names[column].str.strip()
+    return names
+
+
+def make_listings(rows, seed=0):
+    """car_name.csv의 차종으로 그럴듯한 중고차 매물 데이터를 생성 (value_score를 뺀 load_car_data와 같은 컬럼/자료형)
+
+    - 차종: 인기 차종에 몰리도록 순위 기반 가중치로 추출
+    - 연식: 차령(0~17년)이 3~6년에 가장 많은 감마 분포
+    - 주행거리: 차령 × 연 1.3만km 내외 (로그정규 분포)
+    - 가격(만원): 신차가격에서 차령·주행거리만큼 감가하고 ±15% 내외 변동
+    """
+    rng = np.random.default_rng(seed)
+    names = load_car_names()
+
+    weights = 1.0 / np.arange(1, len(names) + 1) ** 0.8
+    weights = rng.permutation(weights)
+    model = rng.choice(len(names), size=rows, p=weights / weights.sum())
+
+    age = np.minimum(np.round(rng.gamma(2.5, 2.0, size=rows)), MAX_AGE).astype('int64')
+    mileage = np.maximum(age, 0.5) * rng.lognormal(np.log(13000), 0.45, size=rows)
+    mileage = np.clip(np.round(mileage), 20, 300000).astype('int64')
+
+    newcar_price = names['신차가격'].to_numpy()[model]
+    price = newcar_price * 0.88 ** age * (1 - mileage / 1_000_000) * rng.lognormal(0, 0.15, size=rows)
+    price = np.clip(np.round(price / 10) * 10, 100, 30000).astype('int64')
+
+    # 차량명은 (차종, 엔진, 트림) 조합 범주로 만들어 행마다 문자열을 생성하지 않음
+    variant = rng.integers(0, len(ENGINES) * len(TRIMS), size=rows)
+    combo = model * (len(ENGINES) * len(TRIMS)) + variant
+    combo_names = [
+        f"{brand} {car_name} {engine} {trim}"
+        for brand, car_name in zip(names['브랜드'], names['차종'])
+        for engine in ENGINES
+        for trim in TRIMS
+    ]
+
+    brand_categories = pd.Index(names['브랜드'].unique())
+    type_categories = pd.Index(names['차량종류'].unique())
+    data = pd.DataFrame({
+        'car_ID': np.arange(1, rows + 1),
+        '브랜드': pd.Categorical.from_codes(brand_categories.get_indexer(names['브랜드'])[model], brand_categories),
+        '차종': pd.Categorical.from_codes(model, names['차종']),
+        '차량종류': pd.Categorical.from_codes(type_categories.get_indexer(names['차량종류'])[model], type_categories),
+        '차량명': pd.Categorical.from_codes(combo, combo_names),
+        '연식': LATEST_YEAR - age,
+        '주행거리': mileage,
+        '가격': price,
+        '신차가격': newcar_price,
+    })
+    # 문자열 컬럼은 이미 category이므로 정수 컬럼만 optimize_car_dtypes와 같은 방식으로 축소
+    for column in INTEGER_COLUMNS:
+        data[column] = downcast_integer(data[column])
+    return data
+
+
+def make_faq(rows, seed=0):
+    """실제 FAQ 문장을 섞어 rows개의 FAQ 데이터(category, question, answer)를 생성"""
+    rng = np.random.default_rng(seed)
+    faq = pd.concat([pd.read_csv(path, encoding='utf-8-sig') for path in FAQ_FILES], ignore_index=True)
+    faq.columns = [column.lower() for column in faq.columns]
+
+    question = faq['question'].to_numpy()[rng.integers(0, len(faq), size=rows)]
+    answer = faq['answer'].to_numpy()[rng.integers(0, len(faq), size=rows)]
+    category = faq['category'].to_numpy()[rng.integers(0, len(faq), size=rows)]
+    # 같은 문장이 반복되지 않도록 번호를 붙임
+    suffix = np.char.add(" #", np.arange(rows).astype(str))
+    return pd.DataFrame({
+        'category': category,
+        'question': np.char.add(question.astype(str), suffix),
+        'answer': answer,
+    })
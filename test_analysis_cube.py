@@ -0,0 +1,69 @@
+"""AnalysisCube.query가 filter_car_data + get_analysis_data(직접 집계)와 같은 결과인지 확인하는 테스트
+
+    python -m pytest -q test_analysis_cube.py
+"""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis_cube import AnalysisCube
+from app import filter_car_data, get_analysis_data
+from listing_store import ListingStore
+from synthetic_data import make_listings
+
+ANALYSIS_TYPES = ["평균 가격", "판매 대수", "평균 주행거리", "신차-중고차 가격차이"]
+GROUP_BY = ['브랜드', '차량종류', '연식']
+
+
+@pytest.fixture(scope="module")
+def listings():
+    """가상 매물 + 가격/주행거리/신차가격/연식 결측치가 있는 행"""
+    data = make_listings(4000, seed=2)
+    for column in ['연식', '가격', '주행거리', '신차가격']:
+        data[column] = data[column].astype('float64')
+    data.loc[[3, 300], '연식'] = np.nan
+    data.loc[[7, 8, 2000], '가격'] = np.nan
+    data.loc[[9, 3999], '주행거리'] = np.nan
+    data.loc[[10], '신차가격'] = np.nan
+    return data
+
+
+@pytest.fixture(scope="module")
+def store(listings):
+    return ListingStore(listings)
+
+
+def assert_same_analysis(listings, store, cube, analysis_type, group_by, filters):
+    filtered = filter_car_data(listings, store=store, **filters)
+    expected = get_analysis_data(filtered, analysis_type, group_by) if not filtered.empty else pd.DataFrame()
+    result = cube.query(analysis_type, group_by, **filters)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_dtype=False, rtol=1e-9, obj=f"{analysis_type}/{group_by}/{filters}")
+
+
+@pytest.mark.parametrize("bucket_widths", [(500, 20000), (97, 3001)])
+def test_query_matches_direct_aggregation(listings, store, bucket_widths):
+    # 구간 폭을 바꿔 경계 셀(부분 재집계)이 많은 경우도 확인
+    cube = AnalysisCube(listings, *bucket_widths)
+    rng = random.Random(0)
+    brands = ["전체", "현대", "기아", " 제네시스", "없는브랜드"]
+    car_types = ["전체", "SUV", "경차"]
+    for _ in range(150):
+        filters = dict(brand=rng.choice(brands), car_type=rng.choice(car_types))
+        for name, low, high in (('year', 8, 25), ('price', 100, 9000), ('mileage', 0, 300000)):
+            lower, upper = sorted(rng.randint(low, high) for _ in range(2))
+            filters['min_' + name] = rng.choice([lower, None, 0])
+            filters['max_' + name] = rng.choice([upper, None])
+        assert_same_analysis(listings, store, cube, rng.choice(ANALYSIS_TYPES), rng.choice(GROUP_BY), filters)
+
+
+@pytest.mark.parametrize("analysis_type", ANALYSIS_TYPES)
+@pytest.mark.parametrize("group_by", GROUP_BY)
+def test_query_without_filters(listings, store, analysis_type, group_by):
+    assert_same_analysis(listings, store, AnalysisCube(listings), analysis_type, group_by, {})
+
+
+def test_query_with_no_matching_rows(listings):
+    assert AnalysisCube(listings).query("평균 가격", '브랜드', brand="없는브랜드").empty
@@ -0,0 +1,84 @@
+"""Data_Preprocessing의 조각 단위 중복 제거(SeenRows)와 스트리밍 결과를 확인하는 테스트
+
+    python -m pytest -q test_data_preprocessing.py
+"""
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import Data_Preprocessing
+from Data_Preprocessing import KEY_COLUMNS, SeenRows, clean_chunk, process_all_data, read_source_chunks, source_columns
+from model_matcher import ModelMatcher
+
+
+def first_seen_with_set(chunks):
+    """기준 구현: 파이썬 set에 본 해시를 넣어 가며 처음 보는 값인지 표시"""
+    seen = set()
+    masks = []
+    for hashes in chunks:
+        mask = []
+        for value in hashes.tolist():
+            mask.append(value not in seen)
+            seen.add(value)
+        masks.append(np.array(mask, dtype=bool))
+    return masks, len(seen)
+
+
+@pytest.mark.parametrize("chunk_sizes", [[1000] * 40, [1, 2, 3, 500, 7, 2000, 1, 0, 64] * 5, [50_000]])
+def test_first_seen_matches_set(chunk_sizes):
+    rng = np.random.default_rng(len(chunk_sizes))
+    # 값 범위를 좁혀 같은 조각 안과 조각 사이의 중복이 모두 자주 생기게 함
+    chunks = [rng.integers(0, 20_000, size=size).astype(np.uint64) for size in chunk_sizes]
+    expected, unique_count = first_seen_with_set(chunks)
+
+    seen = SeenRows()
+    for hashes, mask in zip(chunks, expected):
+        np.testing.assert_array_equal(seen.first_seen(hashes), mask)
+    assert len(seen) == unique_count
+    # run은 정렬돼 있고 크기가 2배 이상씩 줄어듦 (run 수는 O(log N))
+    assert all(np.all(run[:-1] < run[1:]) for run in seen.runs)
+    assert all(len(larger) > 2 * len(smaller) for larger, smaller in zip(seen.runs, seen.runs[1:]))
+
+
+def test_first_seen_extreme_hashes():
+    seen = SeenRows()
+    extremes = np.array([0, 2 ** 64 - 1, 0, 2 ** 63], dtype=np.uint64)
+    assert seen.first_seen(extremes).tolist() == [True, True, False, True]
+    assert seen.first_seen(extremes[::-1]).tolist() == [False, False, False, False]
+
+
+@pytest.fixture
+def source_dir(tmp_path, monkeypatch):
+    """중복 행과 형식이 섞인 원본 CSV 두 개와 car_name.csv가 있는 작업 폴더"""
+    shutil.copy(Data_Preprocessing.__file__.replace("Data_Preprocessing.py", "car_name.csv"), tmp_path)
+    rng = np.random.default_rng(0)
+    names = ["현대 그랜저 IG 2.5", "기아 올뉴모닝 럭셔리", "제네시스 G80 3.3", "현대 캐스퍼 인스퍼레이션", "알수없는차"]
+    for file, rows in (("kcar_cars.csv", 300), ("usedcar_data.csv", 200)):
+        pd.DataFrame({
+            '차량명': rng.choice(names, size=rows),
+            '연식': rng.choice(["19년형", "2020", "21", "없음"], size=rows),
+            '주행거리': rng.choice(["12,000km", "3400", "50,000km"], size=rows),
+            '가격': rng.choice(["1,200만원", "2500", "미정", "3,000만원"], size=rows),
+        }).to_csv(tmp_path / file, index=False, encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_streaming_output_matches_drop_duplicates(source_dir):
+    # 기준: 전체를 한 번에 정제한 뒤 drop_duplicates (스트리밍 이전 방식)
+    files = ["kcar_cars.csv", "usedcar_data.csv"]
+    matcher = ModelMatcher.from_car_names(pd.read_csv("car_name.csv", encoding="cp949"))
+    merged = pd.concat(read_source_chunks(files, source_columns(files), chunk_rows=0), ignore_index=True)
+    expected = clean_chunk(merged, matcher).drop_duplicates(subset=KEY_COLUMNS)
+    assert 0 < len(expected) < len(merged)
+
+    process_all_data(chunk_rows=0, output_file="whole.csv")
+    whole = (source_dir / "whole.csv").read_bytes()
+    assert whole == b"\xef\xbb\xbf" + expected.to_csv(index=False).encode("utf-8")
+
+    process_all_data(chunk_rows=7, output_file="chunked.csv")
+    assert (source_dir / "chunked.csv").read_bytes() == whole
+    process_all_data(chunk_rows=7, output_file="parallel.csv", workers=2)
+    assert (source_dir / "parallel.csv").read_bytes() == whole
@@ -0,0 +1,47 @@
+"""FaqIndex 검색 결과가 대소문자를 무시한 부분 문자열 검색(str.contains)과 같은 집합인지 확인하는 테스트
+
+    python -m pytest -q test_faq_index.py
+"""
+import numpy as np
+import pytest
+
+from faq_index import FaqIndex
+from synthetic_data import make_faq
+
+SEARCH_TERMS = ["보증", "내차팔기", "환불", "인증중고차 계약", "자동차", "차", "EV", "ev", "Kia",
+                "a/s", "(", "?", ".*", "1", "#12", " 보험", "없는검색어"]
+
+
+@pytest.fixture(scope="module")
+def faq_data():
+    """가상 FAQ + 빈 값과 정규식 특수문자가 있는 행"""
+    data = make_faq(800, seed=3)
+    data.loc[5, 'answer'] = np.nan
+    data.loc[6, 'category'] = None
+    data.loc[7, 'question'] = "보증 기간(A/S)은 몇 년인가요? .*"
+    return data
+
+
+@pytest.fixture(scope="module")
+def faq_index(faq_data):
+    return FaqIndex(faq_data)
+
+
+def search_with_contains(faq_data, search_term):
+    """색인 도입 전 FAQ 검색 (필드마다 str.contains, 정규식 없이 대소문자 무시)"""
+    mask = (faq_data['question'].str.contains(search_term, case=False, na=False, regex=False) |
+            faq_data['answer'].str.contains(search_term, case=False, na=False, regex=False) |
+            faq_data['category'].str.contains(search_term, case=False, na=False, regex=False))
+    return np.flatnonzero(mask.to_numpy())
+
+
+@pytest.mark.parametrize("search_term", SEARCH_TERMS)
+def test_search_positions_match_contains(faq_data, faq_index, search_term):
+    positions = faq_index.search_positions(search_term)
+    assert len(set(positions.tolist())) == len(positions)
+    assert sorted(positions.tolist()) == search_with_contains(faq_data, search_term).tolist()
+
+
+@pytest.mark.parametrize("search_term", ["", None])
+def test_empty_search_term(faq_index, search_term):
+    assert len(faq_index.search_positions(search_term)) == 0
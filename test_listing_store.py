@@ -0,0 +1,85 @@
+"""ListingStore가 기존 filter_car_data(불리언 마스크 필터)와 같은 행을 돌려주는지 확인하는 테스트
+
+    python -m pytest -q test_listing_store.py
+"""
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from listing_store import ListingStore
+from synthetic_data import make_listings
+
+
+def filter_with_masks(data, brand=None, car_type=None, min_year=None, max_year=None,
+                      min_price=None, max_price=None, min_mileage=None, max_mileage=None):
+    """색인 도입 전 filter_car_data와 같은 방식 (조건마다 불리언 마스크)"""
+    filtered_data = data
+    if brand and brand != "전체":
+        filtered_data = filtered_data[filtered_data['브랜드'].astype(object).str.strip() == brand.strip()]
+    if car_type and car_type != "전체":
+        filtered_data = filtered_data[filtered_data['차량종류'].astype(object).str.strip() == car_type.strip()]
+    for column, low, high in (('연식', min_year, max_year),
+                              ('가격', min_price, max_price),
+                              ('주행거리', min_mileage, max_mileage)):
+        if low:
+            filtered_data = filtered_data[filtered_data[column] >= low]
+        if high:
+            filtered_data = filtered_data[filtered_data[column] <= high]
+    return filtered_data
+
+
+@pytest.fixture(scope="module")
+def listings():
+    """가상 매물 + 결측치와 앞뒤 공백이 있는 행 (원본 CSV에서 나올 수 있는 값)"""
+    data = make_listings(5000, seed=1)
+    for column in ['연식', '가격', '주행거리']:
+        data[column] = data[column].astype('float64')
+    data.loc[[3, 50, 777], '연식'] = np.nan
+    data.loc[[7, 51, 1234], '가격'] = np.nan
+    data.loc[[9, 4000], '주행거리'] = np.nan
+    data['브랜드'] = data['브랜드'].astype(object)
+    data.loc[[11, 12], '브랜드'] = " 현대 "
+    return data
+
+
+@pytest.fixture(scope="module")
+def store(listings):
+    return ListingStore(listings)
+
+
+def random_filters(rng, brands, car_types):
+    filters = dict(brand=rng.choice(brands), car_type=rng.choice(car_types))
+    for name, low, high in (('year', 8, 25), ('price', 100, 9000), ('mileage', 0, 300000)):
+        lower, upper = sorted(rng.randint(low, high) for _ in range(2))
+        filters['min_' + name] = rng.choice([lower, None, 0])
+        filters['max_' + name] = rng.choice([upper, None, 0])
+    return filters
+
+
+def test_filter_positions_matches_masks(listings, store):
+    rng = random.Random(0)
+    brands = ["전체", None, "현대", " 기아", "없는브랜드"] + list(listings['브랜드'].unique()[:5])
+    car_types = ["전체", None, "SUV", "경차 "] + list(listings['차량종류'].unique()[:3])
+    for _ in range(300):
+        filters = random_filters(rng, brands, car_types)
+        expected = filter_with_masks(listings, **filters)
+        positions = store.filter_positions(**filters)
+        assert positions.tolist() == listings.index.get_indexer(expected.index).tolist(), filters
+
+
+@pytest.mark.parametrize("low, high", list(itertools.product([None, 15, 19.5], [None, 19, 25])))
+def test_range_boundaries_are_inclusive(listings, store, low, high):
+    expected = filter_with_masks(listings, min_year=low, max_year=high)
+    assert store.filter_positions(min_year=low, max_year=high).tolist() == \
+        listings.index.get_indexer(expected.index).tolist()
+
+
+def test_no_filters_returns_all_rows(listings, store):
+    assert store.filter_positions().tolist() == list(range(len(listings)))
+
+
+def test_empty_data():
+    empty = make_listings(0)
+    assert ListingStore(empty).filter_positions(brand="현대", min_price=1000).tolist() == []
@@ -0,0 +1,96 @@
+"""ModelMatcher(트라이 정규식)가 규칙대로 차종을 찾는지, tag와 match가 같은 결과인지 확인하는 테스트
+
+    python -m pytest -q test_model_matcher.py
+"""
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bench_model_matcher import make_catalogue, make_listing_names
+from model_matcher import ModelMatcher, trie_pattern
+from synthetic_data import load_car_names
+
+# NEW_PREFIX((?:올|더)?뉴?)가 시도하는 순서
+PREFIXES = ["올뉴", "올", "더뉴", "더", "뉴", ""]
+
+
+def match_by_scan(name, models, brands):
+    """정규식 없이 같은 규칙으로 찾는 기준 구현 (단어 시작마다 접두어 → 가장 긴 차종, 맨 앞 브랜드는 건너뜀)"""
+    def scan(text):
+        for start in range(len(text)):
+            if start > 0 and not text[start - 1].isspace():
+                continue
+            for prefix in PREFIXES:
+                if not text.startswith(prefix, start):
+                    continue
+                found = [model for model in models if text.startswith(model, start + len(prefix))]
+                if found:
+                    return max(found, key=len)
+        return None
+
+    if not isinstance(name, str):
+        return None
+    for brand in sorted(brands, key=len, reverse=True):
+        rest = name[len(brand):]
+        if name.startswith(brand) and rest[:1].isspace():
+            found = scan(rest.lstrip())
+            if found:
+                return found
+            break
+    return scan(name)
+
+
+@pytest.fixture(scope="module")
+def car_names():
+    return load_car_names()
+
+
+@pytest.fixture(scope="module")
+def matcher(car_names):
+    return ModelMatcher.from_car_names(car_names)
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("제네시스 G80 2.5 터보 프리미엄", "G80"),      # 브랜드명보다 뒤의 차종이 우선
+    ("제네시스 DH 3.3 프리미엄", "제네시스"),        # 브랜드 뒤에 차종이 없으면 브랜드명이 차종
+    ("기아 올뉴모닝 럭셔리", "모닝"),
+    ("더뉴그랜저 IG 2.5", "그랜저"),
+    ("현대 캐스퍼 인스퍼레이션", "캐스퍼"),           # 트림 "인스퍼레이션" 안의 "레이"는 차종이 아님
+    ("쉐보레 트레일블레이저 RS", "트레일블레이저"),
+    ("기아 레이 EV", "레이"),
+    ("BMW 5시리즈 (G70)", None),                   # 단어 중간의 "G70"은 차종이 아님
+    ("", None),
+    (None, None),
+])
+def test_known_names(matcher, name, expected):
+    assert matcher.match(name) == expected
+    tagged = matcher.tag([name])[0]
+    assert (tagged if isinstance(tagged, str) else None) == expected
+
+
+def test_trie_pattern_prefers_longest_word():
+    pattern = re.compile(trie_pattern(['G7', 'G70', 'GV70', 'K5']))
+    assert pattern.pattern == "(?:G(?:7(?:0)?|V70)|K5)"
+    assert [pattern.match(text).group() for text in ['G70', 'G7X', 'GV70', 'K5']] == ['G70', 'G7', 'GV70', 'K5']
+
+
+@pytest.mark.parametrize("models", [69, 800])
+def test_match_equals_scan_and_tag(models):
+    catalogue = make_catalogue(models)
+    matcher = ModelMatcher.from_car_names(catalogue)
+    names = make_listing_names(catalogue, 1500, seed=models)
+
+    # 세대 접두어, 브랜드 생략, 단어 중간 일치, 결측 등 규칙이 갈리는 차량명 섞기
+    rng = np.random.default_rng(models)
+    variants = []
+    for name in names[:300]:
+        brand, rest = name.split(" ", 1)
+        variants += [rest, f"{brand} {rng.choice(PREFIXES)}{rest}", f"{brand} X{rest}", name.replace(" ", "")]
+    names = pd.concat([names, pd.Series(variants), pd.Series([None, np.nan, "", "   "])], ignore_index=True)
+
+    expected = [match_by_scan(name, matcher.models, catalogue['브랜드'].unique()) for name in names]
+    assert [matcher.match(name) for name in names] == expected
+    tagged = matcher.tag(names)
+    assert [value if isinstance(value, str) else None for value in tagged] == expected
@@ -0,0 +1,52 @@
+"""top_k_positions / RankedResult가 안정 정렬(점수 내림차순, 동점은 앞선 위치, 결측은 맨 뒤)과 같은지 확인하는 테스트
+
+    python -m pytest -q test_topk.py
+"""
+import numpy as np
+import pytest
+
+from topk import RankedResult, top_k_positions
+
+
+def stable_ranking(scores):
+    """전체를 안정 정렬한 순위 (기존 sort_values(ascending=False, kind='stable')와 같은 순서)"""
+    keys = -np.asarray(scores, dtype='float64')
+    keys[np.isnan(keys)] = np.inf
+    return np.argsort(keys, kind='stable')
+
+
+def score_cases():
+    rng = np.random.default_rng(0)
+    with_nan = rng.normal(50, 10, size=500)
+    with_nan[rng.integers(0, 500, size=40)] = np.nan
+    return {
+        'continuous': rng.normal(50, 10, size=1000),
+        'many_ties': rng.integers(0, 5, size=1000).astype('float64'),
+        'all_equal': np.full(300, 7.0),
+        'with_nan': with_nan,
+        'all_nan': np.full(20, np.nan),
+        'single': np.array([1.0]),
+        'empty': np.empty(0),
+    }
+
+
+@pytest.mark.parametrize("name", list(score_cases()))
+@pytest.mark.parametrize("k", [0, 1, 3, 10, 100, 5000])
+def test_top_k_positions_matches_stable_sort(name, k):
+    scores = score_cases()[name]
+    assert top_k_positions(scores, k).tolist() == stable_ranking(scores)[:k].tolist()
+
+
+@pytest.mark.parametrize("name", list(score_cases()))
+def test_ranked_result_pages_match_stable_sort(name):
+    scores = score_cases()[name]
+    positions = np.arange(len(scores)) * 3 + 11  # 원본 행 위치는 순위와 무관한 임의의 값
+    expected = stable_ranking(scores)
+    result = RankedResult(positions, scores)
+
+    # 앞쪽부터 이어보기, 건너뛰어 뒤쪽 페이지 요청을 섞어도 같은 순서여야 함
+    for start, end in [(0, 10), (10, 20), (50, 70), (20, 50), (0, 1000), (990, 1100)]:
+        page_positions, page_scores = result.page(start, end)
+        assert page_positions.tolist() == positions[expected[start:end]].tolist()
+        np.testing.assert_array_equal(page_scores, scores[expected[start:end]])
+    assert result.next_k(5, 5)[0].tolist() == positions[expected[5:10]].tolist()
@@ -1,14 +1,7 @@
 import pandas as pd
-import mysql.connector
+from db_access import read_sql
 
-# MySQL 연결 설정
-db_config = {
-    'user': 'Park',
-    'password': 'Park',
-    'host': 'localhost',
-    'database': 'used_car_db',
-    'auth_plugin': 'mysql_native_password'
-}
+# MySQL 연결 설정은 db_access.py의 DB_CONFIG 사용
 
 def calculate_value_score(df):
     """차량의 가성비 점수를 계산하는 함수"""
@@ -98,8 +91,6 @@ def calculate_value_score(df):
 # 테스트 실행
 if __name__ == "__main__":
     try:
-        conn = mysql.connector.connect(**db_config)
-        
         query = """
         SELECT c.car_brand AS 브랜드,
                i.car_name AS 차종,
@@ -116,8 +107,7 @@ if __name__ == "__main__":
         LIMIT 1000
         """
         
-        car_data = pd.read_sql(query, conn)
-        conn.close()
+        car_data = read_sql(query)
         
         print(f"총 데이터 수: {len(car_data)}")
         result = calculate_value_score(car_data)
@@ -0,0 +1,85 @@
+import threading
+
+import numpy as np
+
+
+def _rank_keys(scores):
+    """작을수록 순위가 높은 정렬 키 (점수 내림차순, 결측 점수는 맨 뒤)"""
+    keys = -np.asarray(scores, dtype='float64')
+    keys[np.isnan(keys)] = np.inf
+    return keys
+
+
+def _select(keys, candidates, count):
+    """candidates(오름차순 위치) 중 키가 가장 작은 count개를 골라 (순위순 선택, 나머지)로 반환
+
+    전체를 정렬하지 않고 np.partition으로 경계값만 찾은 뒤 선택된 count개만 정렬합니다.
+    동점은 위치가 앞선 행이 먼저 옵니다 (안정 정렬과 같은 결과).
+    """
+    if count <= 0:
+        return candidates[:0], candidates
+    if count >= len(candidates):
+        chosen, rest = candidates, candidates[:0]
+    else:
+        candidate_keys = keys[candidates]
+        kth = np.partition(candidate_keys, count - 1)[count - 1]
+        selected = candidate_keys < kth
+        ties = np.flatnonzero(candidate_keys == kth)
+        selected[ties[:count - int(selected.sum())]] = True
+        chosen, rest = candidates[selected], candidates[~selected]
+    order = np.lexsort((chosen, keys[chosen]))
+    return chosen[order], rest
+
+
+def top_k_positions(scores, k):
+    """점수가 높은 k개의 위치를 높은 순으로 반환"""
+    keys = _rank_keys(scores)
+    chosen, _ = _select(keys, np.arange(len(keys)), k)
+    return chosen
+
+
+class RankedResult:
+    """검색 결과를 보여줄 만큼만 점수 순으로 정렬해 두는 결과 객체
+
+    positions는 원본 데이터의 행 위치, scores는 같은 순서의 점수입니다.
+    page()나 next_k()가 아직 정렬되지 않은 구간을 요청할 때만 그만큼 더 선택·정렬하므로
+    비용은 전체 검색 건수가 아니라 화면에 보여준 건수에 비례합니다.
+    여러 세션이 공유해도 되도록 확장은 잠금 안에서 이루어집니다.
+    """
+
+    def __init__(self, positions, scores):
+        self.positions = np.asarray(positions)
+        self.scores = np.asarray(scores, dtype='float64')
+        self._keys = _rank_keys(self.scores)
+        self._ranked = np.empty(0, dtype=np.intp)
+        self._rest = np.arange(len(self.positions))
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def nbytes(self):
+        return self.positions.nbytes + self.scores.nbytes + self._keys.nbytes + len(self) * np.dtype(np.intp).itemsize
+
+    def _ensure_ranked(self, count):
+        """상위 count개까지 순위가 정해지도록 필요한 만큼만 추가 선택"""
+        with self._lock:
+            missing = min(count, len(self)) - len(self._ranked)
+            if missing > 0:
+                chosen, self._rest = _select(self._keys, self._rest, missing)
+                self._ranked = np.concatenate([self._ranked, chosen])
+            return self._ranked
+
+    def page(self, start, end):
+        """start~end 순위의 (행 위치, 점수)를 반환"""
+        ranked = self._ensure_ranked(end)[start:end]
+        return self.positions[ranked], self.scores[ranked]
+
+    def top(self, k):
+        """상위 k개의 (행 위치, 점수)를 반환"""
+        return self.page(0, k)
+
+    def next_k(self, offset, k):
+        """offset 순위 다음부터 k개를 반환 (이어보기용)"""
+        return self.page(offset, offset + k)
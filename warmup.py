@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+logger = logging.getLogger(__name__)
+
+WARMUP_WORKERS = 4  # 연결 풀(5개) 중 하나는 사용자 요청용으로 남겨 둠
+
+
+class Warmup:
+    """여러 데이터 로더를 스레드 풀에서 동시에 실행하고 진행 상태를 알려주는 객체
+
+    tasks는 (이름, 함수) 목록이며 각 함수는 캐시된 로더를 호출해 캐시를 채웁니다.
+    한 작업 안의 로더는 순서대로, 서로 다른 작업은 동시에 실행됩니다.
+    """
+
+    def __init__(self, tasks, max_workers=WARMUP_WORKERS):
+        self.tasks = dict(tasks)
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._status = {name: {'state': 'pending', 'seconds': None, 'error': None} for name in self.tasks}
+        self._futures = []
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self):
+        """모든 작업을 백그라운드에서 시작하고 바로 반환"""
+        self.started_at = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="warmup")
+        self._futures = [executor.submit(self._run, name, func) for name, func in self.tasks.items()]
+        executor.shutdown(wait=False)
+        return self
+
+    def _run(self, name, func):
+        self._update(name, state='running')
+        start = time.perf_counter()
+        try:
+            func()
+        except Exception as e:
+            logger.warning("워밍업 %s 실패: %s", name, e)
+            self._update(name, state='failed', seconds=time.perf_counter() - start, error=str(e))
+        else:
+            self._update(name, state='done', seconds=time.perf_counter() - start)
+        finally:
+            with self._lock:
+                if self.finished_at is None and all(status['state'] in ('done', 'failed')
+                                                    for status in self._status.values()):
+                    self.finished_at = time.perf_counter()
+                    logger.info("워밍업 완료: %.2fs", self.finished_at - self.started_at)
+
+    def _update(self, name, **values):
+        with self._lock:
+            self._status[name].update(values)
+
+    @property
+    def ready(self):
+        """모든 작업이 끝났는지 (실패한 작업은 사용자가 요청할 때 다시 로드)"""
+        return self.finished_at is not None
+
+    def progress(self):
+        """(끝난 작업 수, 전체 작업 수)"""
+        with self._lock:
+            finished = sum(status['state'] in ('done', 'failed') for status in self._status.values())
+        return finished, len(self._status)
+
+    def status(self):
+        """작업별 상태, 소요 시간, 오류"""
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+    def wait(self, timeout=None):
+        """모든 작업이 끝날 때까지 최대 timeout초 대기하고 준비 여부를 반환"""
+        wait(self._futures, timeout=timeout)
+        return self.ready